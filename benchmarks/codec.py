@@ -0,0 +1,78 @@
+"""Compare JSON codecs on server listings of different size.
+
+Run with `python benchmarks/codec.py` from the repository root.
+"""
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from ssclient.codec import OrjsonCodec, StdlibJSONCodec, get_codec  # noqa: E402, I001
+from ssclient.server.server import ServerEntity  # noqa: E402
+
+LISTING_SIZES = (10, 100, 1000)
+REPEATS = 5
+
+
+def make_server(index: int) -> ServerEntity:
+    return {
+        'id': 'l1s{index}'.format(index=index),
+        'location_id': 'am2',
+        'cpu': 2,
+        'ram_mb': 2048,
+        'volumes': [
+            {'id': index * 10 + volume, 'name': 'boot', 'size_mb': 25600, 'created': '2021-02-11T14:05:20.345Z'}
+            for volume in range(2)
+        ],
+        'nics': [
+            {
+                'id': index,
+                'network_id': 'l1n{index}'.format(index=index),
+                'mac': '00:50:56:00:{byte:02x}:01'.format(byte=index % 256),
+                'ip_address': '10.0.{high}.{low}'.format(high=index // 256, low=index % 256),
+                'mask': 24,
+                'bandwidth_mbps': 50,
+            },
+        ],
+        'image_id': 'Ubuntu-20.04-X64',
+        'is_power_on': True,
+        'name': 'server-{index}'.format(index=index),
+        'login': 'root',
+        'password': 'Zt9bLq2mVxC4',
+        'ssh_key_ids': [1, 2],
+        'state': 'Active',
+        'created': '2021-02-11T14:05:20.345Z',
+        'tags': ['web', 'prod'],
+    }
+
+
+def measure(codec_name: str, listing: Dict[str, List[Any]]) -> Dict[str, float]:
+    codec = get_codec(codec_name)
+    raw_data = codec.dumps(listing)
+    number = max(1, 1000 // len(listing['servers']))
+    timings = {
+        'loads': timeit.repeat(lambda: codec.loads(raw_data), number=number, repeat=REPEATS),
+        'dumps': timeit.repeat(lambda: codec.dumps(listing), number=number, repeat=REPEATS),
+        'pretty': timeit.repeat(lambda: codec.dumps_pretty(listing), number=number, repeat=REPEATS),
+    }
+    return {operation: min(runs) / number for operation, runs in timings.items()}
+
+
+def main() -> None:
+    codec_names = [StdlibJSONCodec.name]
+    if get_codec().name == OrjsonCodec.name:
+        codec_names.append(OrjsonCodec.name)
+    print('{0:>8} {1:>8} {2:>12} {3:>12} {4:>12}'.format('servers', 'codec', 'loads, ms', 'dumps, ms', 'pretty, ms'))
+    for size in LISTING_SIZES:
+        listing = {'servers': [make_server(index) for index in range(size)]}
+        for codec_name in codec_names:
+            timings = measure(codec_name, listing)
+            print('{0:>8} {1:>8} {2:>12.3f} {3:>12.3f} {4:>12.3f}'.format(
+                size, codec_name, timings['loads'] * 1000, timings['dumps'] * 1000, timings['pretty'] * 1000,
+            ))
+
+
+if __name__ == '__main__':
+    main()
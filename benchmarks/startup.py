@@ -0,0 +1,72 @@
+"""Compare cold start of s2ctl with the API key of a context and the one given by arguments.
+
+Run with `python benchmarks/startup.py` from the repository root. Commands call
+a closed local port, so a run is the startup and one refused connection.
+"""
+import os
+import statistics
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import yaml
+
+SRC_PATH = Path(__file__).parent.parent / 'src'
+# nothing listens there, requests fail at once
+CLOSED_HOST = 'http://127.0.0.1:9'
+APIKEY = '02' + 'a' * 62
+CONTEXT_KEY = 'benchmark-context-key'
+RUNS = 10
+COMMON_ARGS = ('--retries', '0', '--no-cache', 'server', 'list')
+
+
+def run_cli(args: Sequence[str], env: Dict[str, str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(  # noqa: S603
+        [sys.executable, '-m', 's2ctl', *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - started
+
+
+def make_env(config_home: str) -> Dict[str, str]:
+    env = dict(os.environ, XDG_CONFIG_HOME=config_home, HOME=config_home, S2CTL_CONTEXT_KEY=CONTEXT_KEY)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SRC_PATH), env.get('PYTHONPATH')]))
+    env.pop('S2CTL_APIKEY', None)
+    return env
+
+
+def create_context(env: Dict[str, str]) -> None:
+    run_cli(('context', 'create', '-n', 'benchmark', '-k', APIKEY), env)
+    config_path = next(Path(env['XDG_CONFIG_HOME']).rglob('config.yaml'))
+    with open(config_path) as config_file:
+        config = yaml.safe_load(config_file)
+    config['host'] = CLOSED_HOST
+    with open(config_path, 'w') as config_file:
+        yaml.dump(config, config_file)
+
+
+def measure(args: Sequence[str], env: Dict[str, str]) -> List[float]:
+    return [run_cli(args, env) for _ in range(RUNS)]
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as config_home:
+        env = make_env(config_home)
+        create_context(env)
+        timings = {
+            'context': measure(COMMON_ARGS, env),
+            'apikey': measure(('--apikey', APIKEY, '--host', CLOSED_HOST, *COMMON_ARGS), env),
+        }
+    print('{0:>10} {1:>10} {2:>12}'.format('key from', 'min, ms', 'median, ms'))
+    for mode, runs in timings.items():
+        print('{0:>10} {1:>10.1f} {2:>12.1f}'.format(mode, min(runs) * 1000, statistics.median(runs) * 1000))
+
+
+if __name__ == '__main__':
+    main()
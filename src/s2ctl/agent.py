@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+from s2ctl.config import DEFAULT_CONFIG_DIR
+
+AGENT_SOCKET_ENV = 'S2CTL_AGENT_SOCK'
+# an agent stuck for longer is skipped, the keyring is unlocked instead
+AGENT_TIMEOUT = 0.5
+DEFAULT_TTL = 3600
+
+
+def get_agent_socket_path() -> Path:
+    return Path(os.environ.get(AGENT_SOCKET_ENV) or DEFAULT_CONFIG_DIR / 'agent.sock')
+
+
+def make_key_id(keyring_path: str, keyring_key: str, context_name: str) -> str:
+    # keys are given only to ones knowing the keyring key, as by the keyring itself
+    keyring_file = str(Path(keyring_path).resolve())
+    key_source = '\0'.join((keyring_file, context_name, keyring_key))
+    return hashlib.sha256(key_source.encode()).hexdigest()
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    # a message is a line of JSON, one request and reply per connection
+    return '{message}\n'.format(message=json.dumps(message)).encode()
+
+
+class KeyAgentPort(Protocol):
+    def get(self, key_id: str) -> Optional[str]:
+        """Get unlocked API key, None if there is no such one."""
+
+    def add(self, key_id: str, apikey: str) -> None:
+        """Keep unlocked API key."""
+
+    def remove(self, key_id: str) -> None:
+        """Drop API key, e.g. changed one."""
+
+
+class KeyStore(object):
+    """Unlocked API keys kept in memory for ``ttl`` seconds."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL) -> None:
+        self.ttl = ttl
+        self._keys: Dict[str, Tuple[str, float]] = {}
+
+    def get(self, key_id: str) -> Optional[str]:
+        self._drop_expired()
+        apikey, _ = self._keys.get(key_id, (None, None))
+        return apikey
+
+    def add(self, key_id: str, apikey: str) -> None:
+        self._keys[key_id] = (apikey, time.monotonic() + self.ttl)
+
+    def remove(self, key_id: str) -> None:
+        self._keys.pop(key_id, None)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+    def _drop_expired(self) -> None:
+        now = time.monotonic()
+        for key_id, (_, expires) in list(self._keys.items()):
+            if expires <= now:
+                del self._keys[key_id]  # noqa: WPS420
+
+
+class AgentClient(object):
+    """Client of "s2ctl agent" keeping unlocked API keys.
+
+    Missing or broken agent is the same as the one without the key,
+    callers fall back to the keyring.
+    """
+
+    def __init__(self, socket_path: Path, timeout: float = AGENT_TIMEOUT) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def get(self, key_id: str) -> Optional[str]:
+        reply = self._request({'op': 'get', 'key_id': key_id})
+        return reply.get('apikey') if reply else None
+
+    def add(self, key_id: str, apikey: str) -> None:
+        self._request({'op': 'add', 'key_id': key_id, 'apikey': apikey})
+
+    def remove(self, key_id: str) -> None:
+        self._request({'op': 'remove', 'key_id': key_id})
+
+    def _request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if not hasattr(socket, 'AF_UNIX') or not self.socket_path.exists():
+            return None
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as agent_socket:  # noqa: WPS432
+                agent_socket.settimeout(self.timeout)
+                agent_socket.connect(str(self.socket_path))
+                agent_socket.sendall(encode_message(request))
+                with agent_socket.makefile('rb') as reply_file:
+                    return json.loads(reply_file.readline())
+        except (OSError, ValueError):
+            return None
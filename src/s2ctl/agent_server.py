@@ -0,0 +1,57 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+from s2ctl.agent import DEFAULT_TTL, KeyStore, encode_message
+from s2ctl.unix_socket import is_same_user, private_socket_path, unlink_socket
+
+
+class KeyAgent(object):
+    """Keeps unlocked API keys in memory and gives them over a Unix socket.
+
+    Only processes of the same user may connect to the socket. A key is
+    dropped after ``ttl`` seconds, the next command unlocks the keyring again.
+    """
+
+    def __init__(self, socket_path: Path, ttl: float = DEFAULT_TTL) -> None:
+        self.socket_path = socket_path
+        self.keys = KeyStore(ttl)
+
+    async def serve(self) -> None:
+        """Serve until cancelled, e.g. by Ctrl-C."""
+        with private_socket_path(self.socket_path):
+            server = await asyncio.start_unix_server(self._handle_connection, path=str(self.socket_path))
+        try:  # noqa: WPS501
+            await server.serve_forever()
+        finally:
+            await self._close(server)
+
+    async def _close(self, server: asyncio.AbstractServer) -> None:
+        server.close()
+        await server.wait_closed()
+        self.keys.clear()
+        unlink_socket(self.socket_path)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            if is_same_user(writer.get_extra_info('socket')):
+                request = json.loads(await reader.readline())
+                writer.write(encode_message(self._handle_request(request)))
+                await writer.drain()
+        except (ValueError, KeyError, ConnectionError):
+            return
+        finally:
+            writer.close()
+
+    def _handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        operation = request['op']
+        if operation == 'get':
+            return {'apikey': self.keys.get(request['key_id'])}
+        elif operation == 'add':
+            self.keys.add(request['key_id'], request['apikey'])
+        elif operation == 'remove':
+            self.keys.remove(request['key_id'])
+        else:
+            return {'error': 'unknown operation {op!r}'.format(op=operation)}
+        return {}
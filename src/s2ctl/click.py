@@ -1,10 +1,10 @@
+import inspect
 import types
 from functools import wraps
 from http import HTTPStatus
-from typing import Any, Callable, Dict, Optional, cast
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, cast
 
 import click
-import click_completion
 
 from s2ctl.formatters import (
     FormatterPort,
@@ -14,6 +14,7 @@ from s2ctl.formatters import (
     YAMLFormatter,
     general_fields_sort,
 )
+from s2ctl.invocation import run_async
 from ssclient.errors import HttpClientResponseError
 
 FORMATTERS = types.MappingProxyType({
@@ -23,8 +24,6 @@ FORMATTERS = types.MappingProxyType({
 })
 FORMATTER_NAMES = tuple(FORMATTERS.keys())
 
-click_completion.init()
-
 
 def echo(
     raw_obj: Any,
@@ -43,6 +42,23 @@ def echo(
         click.echo(formatter.format(raw_obj, sorter), *args, **kwargs)
 
 
+def echo_stream(
+    raw_objs: Iterable[Any],
+    sorter: Optional[SorterType] = general_fields_sort,
+    formatter: Optional[FormatterPort] = None,
+) -> None:
+    """Print items of a list as they arrive."""
+    if not formatter:
+        formatter = cast(FormatterPort, click.get_current_context().obj['formatter'])
+
+    is_printed = False
+    for text in formatter.format_stream(raw_objs, sorter):
+        click.echo(text, nl=False)
+        is_printed = True
+    if is_printed:
+        click.echo()
+
+
 def wait_option(func):
     return click.option(
         '--wait',
@@ -76,7 +92,7 @@ def _command_callback_wrap(  # noqa: WPS231
     @wraps(func)
     def wrapper(*args, **kwargs):  # noqa: WPS430
         try:
-            return func(*args, **kwargs)
+            return _run_command(func, *args, **kwargs)
         except BaseFailException:  # noqa: WPS329
             raise
         except HttpClientResponseError as exc:
@@ -91,6 +107,20 @@ def _command_callback_wrap(  # noqa: WPS231
     return wrapper
 
 
+def _run_command(func: Callable[..., Any], *args, **kwargs) -> Any:
+    command_result = func(*args, **kwargs)
+    if inspect.isawaitable(command_result):
+        # async command bodies run in the event loop of the invocation
+        return run_async(_run_in_context(click.get_current_context(), command_result))
+    return command_result
+
+
+async def _run_in_context(ctx: click.Context, coro: Awaitable[Any]) -> Any:
+    # click context is thread local, the body uses it from the loop thread
+    with ctx.scope(cleanup=False):
+        return await coro
+
+
 def _check_http_response_error(exc: HttpClientResponseError) -> None:
     if exc.status == HTTPStatus.UNAUTHORIZED:
         return echo("Can't log in. Check your API key.", err=True)
@@ -1,58 +1,67 @@
-import types
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import click
 from click.core import Context
 
+from s2ctl.config import DEFAULT_CONFIG_DIR
 from s2ctl.context import ContextManager
-from ssclient.client import SSClient
-from ssclient.http_client import HttpClient
-
-HOSTS_MAP = types.MappingProxyType({
-    '02': 'https://api.serverspace.by',
-    '04': 'https://api.serverspace.io',
-    '06': 'https://api.serverspace.ru',
-    '07': 'https://api.lincore.kz',
-    '08': 'https://api.serverspace.us',
-    '09': 'https://api.serverspace.com.tr',
-    '0a': 'https://api.serverspace.in',
-    '0f': 'https://api.itglobal.com',
-    '14': 'https://api.serverspace.kz',
-    '20': 'https://api.cloudtek.kz',
-    '21': 'https://api.serverspace.ca',
-    '22': 'https://api.serverspace.com.br',
-    '23': 'https://api.falconcloud.ae',
-    '25': 'https://api.vc.miran.ru',
-    '26': 'https://api.ekacod.ru',
-    '28': 'https://api.glos.online',
-    '29': 'https://api.vcloud-test.uzum.io',
-})
-
-
-def client_factory(ctx: Context) -> SSClient:
-    context_manager: ContextManager = ctx.obj['context_manager']
-    apikey_arg: str = ctx.obj['apikey_arg']
-    try:
-        apikey = apikey_arg or context_manager.get_current_apikey()
-    except Exception:  # noqa: WPS329
-        raise KeyMissingError
+from s2ctl.hosts import get_host_by_apikey
+from s2ctl.invocation import get_runtime, import_factory
+from ssclient.journal import TaskJournal, get_task_journal
+
+if TYPE_CHECKING:
+    from ssclient.client import SSClient  # noqa: F401
 
-    if not apikey:
-        raise KeyMissingError
 
+def client_factory(ctx: Context) -> 'SSClient':
     config: Dict[str, Any] = ctx.obj['config_manager'].get_config()
-    host = config.get('host')
+    host = ctx.obj.get('host') or config.get('host')
+    apikey = _get_apikey(ctx, config, host)
     if not host:
         host = get_host_by_apikey(apikey)
         if not host:
             raise WrongApikeyError
 
-    return SSClient(HttpClient(host, apikey))
+    configure_task_journal(None if ctx.obj['apikey_arg'] else config.get('current_context'))
+    runtime = get_runtime(ctx)
+    ctx.obj['client'] = import_factory().make_client(ctx, runtime, config, host, apikey)
+    return ctx.obj['client']
+
+
+def configure_task_journal(context_name: Optional[str]) -> TaskJournal:
+    # started tasks are kept, so waits interrupted by Ctrl-C or a crash may be resumed
+    task_journal = get_task_journal()
+    task_journal.path = DEFAULT_CONFIG_DIR / 'task_journal.jsonl'
+    task_journal.context = context_name or None
+    return task_journal
+
+
+def _get_apikey(ctx: Context, config: Dict[str, Any], host: Optional[str]) -> str:
+    apikey_arg: str = ctx.obj['apikey_arg']
+    if apikey_arg:
+        return apikey_arg
+
+    # stateless runs always have API key, so contexts are here
+    context_manager: ContextManager = ctx.obj['context_manager']
+    context_host = context_manager.get_current_context_host()
+    _prewarm_host(ctx, config, host or context_host)
+    try:
+        apikey = context_manager.get_current_apikey()
+    except Exception:  # noqa: WPS329
+        raise KeyMissingError
+
+    if not apikey:
+        raise KeyMissingError
+    if not context_host:
+        # contexts created before hosts were stored get theirs by the first unlocked key
+        context_manager.set_context_host(context_manager.get_current_context_name(), get_host_by_apikey(apikey))
+    return apikey
 
 
-def get_host_by_apikey(apikey: str) -> Optional[str]:
-    partner_code = apikey[:2].lower()
-    return HOSTS_MAP.get(partner_code)
+def _prewarm_host(ctx: Context, config: Dict[str, Any], host: Optional[str]) -> None:
+    # connecting goes in background while keyring is unlocked
+    if host and config.get('prewarm', True):
+        get_runtime(ctx).prewarm(host)
 
 
 class KeyMissingError(click.UsageError):
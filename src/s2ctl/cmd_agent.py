@@ -0,0 +1,37 @@
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from s2ctl.agent import AGENT_SOCKET_ENV, DEFAULT_TTL, get_agent_socket_path
+from s2ctl.agent_server import KeyAgent
+from s2ctl.click import S2CTLCommand
+from s2ctl.entrypoint import entry_point
+
+
+@entry_point.command(cls=S2CTLCommand)
+@click.option(
+    '--ttl',
+    type=click.IntRange(min=1),
+    default=DEFAULT_TTL,
+    show_default=True,
+    help='Seconds an unlocked API key is kept for.',
+)
+@click.option(
+    '--socket',
+    'socket_path',
+    type=click.Path(dir_okay=False),
+    envvar=AGENT_SOCKET_ENV,
+    help='Path of the agent socket, "agent.sock" in the configuration folder by default.',
+)
+async def agent(ttl: int, socket_path: Optional[str]):
+    """Keep API keys of contexts unlocked, so commands don't decrypt the keyring.
+
+    The agent runs in the foreground until it's stopped by Ctrl-C, e.g. start
+    it by "s2ctl agent &". Commands find it at the default path or by the
+    S2CTL_AGENT_SOCK env variable, which sets the socket of the agent too.
+    """
+    key_agent = KeyAgent(Path(socket_path) if socket_path else get_agent_socket_path(), ttl)
+    # nothing is printed to stdout, the agent doesn't exit for its output to be evaluated
+    click.echo('s2ctl agent is listening on {path}'.format(path=key_agent.socket_path), err=True)
+    await key_agent.serve()
@@ -1,4 +1,3 @@
-import asyncio
 from collections import defaultdict
 from typing import Any, DefaultDict, Dict, List, Optional
 
@@ -9,6 +8,7 @@ from s2ctl.click import S2CTLCommand, echo, output_option
 from s2ctl.client import client_factory
 from s2ctl.entrypoint import entry_point
 from s2ctl.formatters import YAMLFormatter
+from s2ctl.taskgroup import TaskGroup
 from ssclient.network.network import NetworkService
 from ssclient.server.server import ServerEntity, ServerNicEntity, ServerService
 
@@ -33,13 +33,14 @@ def ansible(ctx):
 @ansible.command(cls=S2CTLCommand)
 @output_option
 @click.pass_context
-def get_inventory(ctx):
+async def get_inventory(ctx):
     """Get ansible inventory."""
-    networks = asyncio.run(_get_net_serivce(ctx).list())
-    servers = asyncio.run(_get_server_serivce(ctx).list())
+    async with TaskGroup() as task_group:
+        networks = task_group.create_task(_get_net_serivce(ctx).list())
+        servers = task_group.create_task(_get_server_serivce(ctx).list())
 
-    isolated_network_ids = [network['id'] for network in networks]
-    inventory_resp = _generate_inventory(servers, isolated_network_ids)
+    isolated_network_ids = [network['id'] for network in networks.result()]
+    inventory_resp = _generate_inventory(servers.result(), isolated_network_ids)
     echo(inventory_resp, formatter=YAMLFormatter())
 
 
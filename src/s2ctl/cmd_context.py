@@ -3,6 +3,7 @@ import click
 from click.core import Context
 
 from s2ctl.click import S2CTLCommand, echo, output_option
+from s2ctl.hosts import get_host_by_apikey
 from s2ctl.context import ContextManager
 from s2ctl.entrypoint import entry_point
 
@@ -33,7 +34,7 @@ def create(ctx, name: str, key: str):
     """Create new context with API key obtained from control panel."""
     context_manager = _get_context_manager(ctx)
     try:
-        context_manager.add_context(context_name=name, apikey=key)
+        context_manager.add_context(context_name=name, apikey=key, host=get_host_by_apikey(key))
     except Exception as exc:
         echo(exc, err=True)
 
@@ -0,0 +1,52 @@
+from pathlib import Path
+from typing import Optional
+
+import click
+from click.core import Context
+
+from s2ctl.agent import DEFAULT_TTL, KeyStore
+from s2ctl.click import S2CTLCommand
+from s2ctl.entrypoint import entry_point
+from s2ctl.thin import DAEMON_SOCKET_ENV, get_daemon_socket_path
+
+
+@entry_point.command(cls=S2CTLCommand)
+@click.option(
+    '--ttl',
+    type=click.IntRange(min=1),
+    default=DEFAULT_TTL,
+    show_default=True,
+    help='Seconds an unlocked API key is kept for.',
+)
+@click.option(
+    '--socket',
+    'socket_path',
+    type=click.Path(dir_okay=False),
+    envvar=DAEMON_SOCKET_ENV,
+    help='Path of the daemon socket, "daemon.sock" in the configuration folder by default.',
+)
+@click.pass_context
+def daemon(ctx: Context, ttl: int, socket_path: Optional[str]):
+    """Run commands of "s2ctl-thin" in one warm process.
+
+    Commands skip the start of Python, unlocking of the keyring and reuse
+    connections to the API. The daemon runs in the foreground until it's
+    stopped by Ctrl-C, "s2ctl-thin" runs commands by itself when there is
+    no daemon.
+    """
+    # the daemon loads the whole client, help listing the command doesn't
+    from s2ctl.daemon import Daemon  # noqa: WPS433
+    from s2ctl.factory import make_pool_config  # noqa: WPS433
+    from s2ctl.runtime import Runtime  # noqa: WPS433
+
+    config = ctx.obj['config_manager'].get_config()
+    runtime = Runtime(make_pool_config(config))
+    command_daemon = Daemon(
+        Path(socket_path) if socket_path else get_daemon_socket_path(), runtime, KeyStore(ttl),
+    )
+    click.echo('s2ctl daemon is listening on {path}'.format(path=command_daemon.socket_path), err=True)
+    try:  # noqa: WPS501
+        command_daemon.serve_forever()
+    finally:
+        command_daemon.server_close()
+        runtime.close()
@@ -1,11 +1,11 @@
-import asyncio
 from typing import Iterable, Optional
 
 import click
 
-from s2ctl.click import S2CTLCommand, echo, output_option, wait_option
+from s2ctl.click import S2CTLCommand, echo, echo_stream, output_option, wait_option
 from s2ctl.client import client_factory
 from s2ctl.entrypoint import entry_point
+from s2ctl.invocation import iterate_async, run_async
 from ssclient.domain import record_entities as entities
 from ssclient.domain.domain import DomainService
 
@@ -42,7 +42,7 @@ def create(
 ):
     """Create new domain."""
     domain_service = _get_domain_serivce(ctx)
-    service_resp = asyncio.run(domain_service.create(
+    service_resp = run_async(domain_service.create(
         name=name,
         migrate_records=migrate_records,
         wait=wait,
@@ -56,8 +56,7 @@ def create(
 def list_domain(ctx):
     """Display all domains in the project."""
     domain_service = _get_domain_serivce(ctx)
-    service_resp = asyncio.run(domain_service.list())
-    echo(service_resp)
+    echo_stream(iterate_async(domain_service.iter_list()))
 
 
 @domain.command(cls=S2CTLCommand)
@@ -67,7 +66,7 @@ def list_domain(ctx):
 def get(ctx, domain_name: str):
     """Get domain information."""
     domain_service = _get_domain_serivce(ctx)
-    service_resp = asyncio.run(domain_service.get(domain_name=domain_name))
+    service_resp = run_async(domain_service.get(domain_name=domain_name))
     echo(service_resp)
 
 
@@ -78,7 +77,7 @@ def get(ctx, domain_name: str):
 def delete(ctx, domain_name: str):
     """Delete a domain."""
     domain_service = _get_domain_serivce(ctx)
-    service_resp = asyncio.run(domain_service.delete(domain_name=domain_name))
+    service_resp = run_async(domain_service.delete(domain_name=domain_name))
     echo(service_resp)
 
 
@@ -186,28 +185,28 @@ def create_record(  # noqa: WPS231
         priority=priority,
     )
     if record_type == entities.AllowedRecordType.a:  # noqa: WPS223
-        service_resp = asyncio.run(record_service.create_a(
+        service_resp = run_async(record_service.create_a(
             name=name,
             ttl=ttl,
             ip=ip,  # type: ignore
             wait=wait,
         ))
     elif record_type == entities.AllowedRecordType.aaaa:
-        service_resp = asyncio.run(record_service.create_aaaa(
+        service_resp = run_async(record_service.create_aaaa(
             name=name,
             ttl=ttl,
             ip=ip,  # type: ignore
             wait=wait,
         ))
     elif record_type == entities.AllowedRecordType.cname:
-        service_resp = asyncio.run(record_service.create_cname(
+        service_resp = run_async(record_service.create_cname(
             name=name,
             ttl=ttl,
             canonical_name=cname,  # type: ignore
             wait=wait,
         ))
     elif record_type == entities.AllowedRecordType.mx:
-        service_resp = asyncio.run(record_service.create_mx(
+        service_resp = run_async(record_service.create_mx(
             name=name,
             ttl=ttl,
             mail_host=mail_host,  # type: ignore
@@ -215,21 +214,21 @@ def create_record(  # noqa: WPS231
             wait=wait,
         ))
     elif record_type == entities.AllowedRecordType.ns:
-        service_resp = asyncio.run(record_service.create_ns(
+        service_resp = run_async(record_service.create_ns(
             name=name,
             ttl=ttl,
             name_server_host=name_server_host,  # type: ignore
             wait=wait,
         ))
     elif record_type == entities.AllowedRecordType.txt:
-        service_resp = asyncio.run(record_service.create_txt(
+        service_resp = run_async(record_service.create_txt(
             name=name,
             ttl=ttl,
             text=text,  # type: ignore
             wait=wait,
         ))
     elif record_type == entities.AllowedRecordType.srv:
-        service_resp = asyncio.run(record_service.create_srv(
+        service_resp = run_async(record_service.create_srv(
             name=name,
             ttl=ttl,
             protocol=protocol,  # type: ignore
@@ -357,7 +356,7 @@ def update_record(  # noqa: WPS231
         target=target,
         priority=priority,
     )
-    service_resp = asyncio.run(record_service.update(
+    service_resp = run_async(record_service.update(
         record_id=record_id,
         name=name,
         ttl=ttl,
@@ -386,8 +385,7 @@ def list_record(ctx, domain_name: str):
     """Display all records in the domain."""
     domain_service = _get_domain_serivce(ctx)
     record_service = domain_service.records(domain_name=domain_name)
-    service_resp = asyncio.run(record_service.list())
-    echo(service_resp)
+    echo_stream(iterate_async(record_service.iter_list()))
 
 
 @domain.command(cls=S2CTLCommand)
@@ -405,7 +403,7 @@ def get_record(ctx, domain_name: str, record_id: int):
     """Get record information."""
     domain_service = _get_domain_serivce(ctx)
     record_service = domain_service.records(domain_name=domain_name)
-    service_resp = asyncio.run(record_service.get(record_id=record_id))
+    service_resp = run_async(record_service.get(record_id=record_id))
     echo(service_resp)
 
 
@@ -424,7 +422,7 @@ def delete_record(ctx, domain_name: str, record_id: int):
     """Remove the record from a domain."""
     domain_service = _get_domain_serivce(ctx)
     record_service = domain_service.records(domain_name=domain_name)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         record_service.delete(record_id=record_id),
     )
     echo(service_resp)
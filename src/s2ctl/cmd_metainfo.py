@@ -1,10 +1,9 @@
-import asyncio
-
 import click
 
 from s2ctl.click import S2CTLCommand, echo, output_option
 from s2ctl.client import client_factory
 from s2ctl.entrypoint import entry_point
+from s2ctl.invocation import run_async
 
 
 @entry_point.command(cls=S2CTLCommand)
@@ -13,7 +12,7 @@ from s2ctl.entrypoint import entry_point
 def locations(ctx):
     """List of places where our data centers are located."""
     client = client_factory(ctx)
-    locations_resp = asyncio.run(client.locations().get())
+    locations_resp = run_async(client.locations().get())
 
     echo(list({location['id'] for location in locations_resp}))
 
@@ -24,6 +23,6 @@ def locations(ctx):
 def images(ctx):
     """List of OS images which you can use for your server."""
     client = client_factory(ctx)
-    images_resp = asyncio.run(client.images().get())
+    images_resp = run_async(client.images().get())
 
     echo(list({image['id'] for image in images_resp}))
@@ -1,10 +1,9 @@
-import asyncio
-
 import click
 
 from s2ctl.click import S2CTLCommand, echo, output_option, wait_option
 from s2ctl.client import client_factory
 from s2ctl.entrypoint import entry_point
+from s2ctl.invocation import run_async
 from ssclient.network.network import NetworkService
 
 
@@ -46,7 +45,7 @@ def create(
 ):
     """Create new isolated network."""
     net_service = _get_net_serivce(ctx)
-    service_resp = asyncio.run(net_service.create(
+    service_resp = run_async(net_service.create(
         location_id=location,
         name=name,
         description=description,
@@ -63,7 +62,7 @@ def create(
 def list_network(ctx):
     """Display all isolated networks in the project."""
     net_service = _get_net_serivce(ctx)
-    service_resp = asyncio.run(net_service.list())
+    service_resp = run_async(net_service.list())
     echo(service_resp)
 
 
@@ -74,7 +73,7 @@ def list_network(ctx):
 def get(ctx, network_id: str):
     """Get information about a network."""
     net_service = _get_net_serivce(ctx)
-    service_resp = asyncio.run(net_service.get(network_id=network_id))
+    service_resp = run_async(net_service.get(network_id=network_id))
     echo(service_resp)
 
 
@@ -87,7 +86,7 @@ def get(ctx, network_id: str):
 def edit(ctx, network_id: str, name: str, description: str):
     """Update network information."""
     net_service = _get_net_serivce(ctx)
-    service_resp = asyncio.run(net_service.update(
+    service_resp = run_async(net_service.update(
         network_id=network_id,
         name=name,
         description=description,
@@ -102,7 +101,7 @@ def edit(ctx, network_id: str, name: str, description: str):
 def delete(ctx, network_id: str):
     """Delete a network."""
     net_service = _get_net_serivce(ctx)
-    service_resp = asyncio.run(net_service.delete(network_id=network_id))
+    service_resp = run_async(net_service.delete(network_id=network_id))
     echo(service_resp)
 
 
@@ -115,7 +114,7 @@ def add_tag(ctx, network_id: str, name: str):
     """Add tag to network."""
     net_service = _get_net_serivce(ctx)
     tag_service = net_service.tags(network_id=network_id)
-    service_resp = asyncio.run(tag_service.create(name=name))
+    service_resp = run_async(tag_service.create(name=name))
     echo(service_resp)
 
 
@@ -128,7 +127,7 @@ def delete_tag(ctx, network_id: str, name: str):
     """Remove tag from network."""
     net_service = _get_net_serivce(ctx)
     tag_service = net_service.tags(network_id=network_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         tag_service.delete(name=name),
     )
     echo(service_resp)
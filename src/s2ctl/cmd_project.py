@@ -1,11 +1,10 @@
-import asyncio
-
 import click
 from click.core import Context
 
 from s2ctl.click import S2CTLCommand, echo, output_option
 from s2ctl.client import client_factory
 from s2ctl.entrypoint import entry_point
+from s2ctl.invocation import run_async
 from ssclient.project import ProjectService
 
 
@@ -28,4 +27,4 @@ def _get_proj_serivce(ctx) -> ProjectService:
 def show(ctx):
     """Display project information whose API key is bound to the current context."""
     proj_service = _get_proj_serivce(ctx)
-    echo(asyncio.run(proj_service.get()))
+    echo(run_async(proj_service.get()))
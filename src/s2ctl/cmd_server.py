@@ -1,14 +1,14 @@
-import asyncio
 import string
 from typing import Any, Dict, List, Optional, Sequence
 
 import click
 from click import Context
 
-from s2ctl.click import S2CTLCommand, echo, output_option, wait_option
+from s2ctl.click import S2CTLCommand, echo, echo_stream, output_option, wait_option
 from s2ctl.client import client_factory
 from s2ctl.entrypoint import entry_point
 from s2ctl.formatters import general_fields_sort
+from s2ctl.invocation import iterate_async, run_async
 from ssclient.server.server import ServerService, VolumeCreationData
 
 SERVER_ID_ARG = 'server-id'
@@ -139,7 +139,7 @@ def create(
 ):
     """Create new virtual server."""
     server_service = _get_server_serivce(ctx)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         server_service.create(
             name=name,
             location_id=location,
@@ -169,7 +169,7 @@ def create(
 def edit(ctx, server_id: str, cpu: Optional[int], ram: Optional[int], wait: bool):
     """Change server configuration."""
     server_service = _get_server_serivce(ctx)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         server_service.update(server_id=server_id, cpu=cpu, ram_mb=ram, wait=wait),
     )
     echo(service_resp)
@@ -181,8 +181,7 @@ def edit(ctx, server_id: str, cpu: Optional[int], ram: Optional[int], wait: bool
 def servers_list(ctx):
     """Display all virtual servers in the project."""
     server_service = _get_server_serivce(ctx)
-    service_resp = asyncio.run(server_service.list())
-    echo(service_resp, sorter=sort_server_resp)
+    echo_stream(iterate_async(server_service.iter_list()), sorter=sort_server_resp)
 
 
 @server.command(cls=S2CTLCommand)
@@ -192,7 +191,7 @@ def servers_list(ctx):
 def get(ctx, server_id: str):
     """Get information about a server."""
     server_service = _get_server_serivce(ctx)
-    service_resp = asyncio.run(server_service.get(server_id=server_id))
+    service_resp = run_async(server_service.get(server_id=server_id))
     echo(service_resp, sorter=sort_server_resp)
 
 
@@ -203,7 +202,7 @@ def get(ctx, server_id: str):
 def delete(ctx, server_id: str):
     """Delete a server."""
     server_service = _get_server_serivce(ctx)
-    service_resp = asyncio.run(server_service.delete(server_id=server_id))
+    service_resp = run_async(server_service.delete(server_id=server_id))
     echo(service_resp, sorter=sort_server_resp)
 
 
@@ -223,7 +222,7 @@ def add_volume(ctx, server_id: str, volume_name: str, volume_size: int, wait: bo
     """Add new storage volume to a server."""
     server_service = _get_server_serivce(ctx)
     volume_service = server_service.volumes(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         volume_service.create(name=volume_name, size_mb=volume_size, wait=wait),
     )
     echo(service_resp)
@@ -247,7 +246,7 @@ def edit_volume(
     """Resize a storage volume."""
     server_service = _get_server_serivce(ctx)
     volume_service = server_service.volumes(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         volume_service.update(volume_id=volume_id, size_mb=volume_size, wait=wait),
     )
     echo(service_resp)
@@ -262,7 +261,7 @@ def get_volume(ctx, server_id: str, volume_id: int):
     """Get information about a storage volume."""
     server_service = _get_server_serivce(ctx)
     volume_service = server_service.volumes(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         volume_service.get(volume_id=volume_id),
     )
     echo(service_resp)
@@ -276,7 +275,7 @@ def list_volume(ctx, server_id: str):
     """Display all storage volumes of a server."""
     server_service = _get_server_serivce(ctx)
     volume_service = server_service.volumes(server_id=server_id)
-    service_resp = asyncio.run(volume_service.list())
+    service_resp = run_async(volume_service.list())
     echo(service_resp)
 
 
@@ -289,7 +288,7 @@ def delete_volume(ctx, server_id: str, volume_id: int):
     """Remove a storage volume from a server."""
     server_service = _get_server_serivce(ctx)
     volume_service = server_service.volumes(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         volume_service.delete(volume_id=volume_id),
     )
     echo(service_resp)
@@ -324,7 +323,7 @@ def add_nic(
 
     server_service = _get_server_serivce(ctx)
     nic_service = server_service.nics(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         nic_service.create(network_id=network_id, bandwidth=bandwidth, wait=wait),
     )
     echo(service_resp)
@@ -338,7 +337,7 @@ def list_nic(ctx, server_id: str):
     """Display all network interfaces of a server."""
     server_service = _get_server_serivce(ctx)
     nic_service = server_service.nics(server_id=server_id)
-    service_resp = asyncio.run(nic_service.list())
+    service_resp = run_async(nic_service.list())
     echo(service_resp)
 
 
@@ -351,7 +350,7 @@ def get_nic(ctx, server_id: str, nic_id: int):
     """Get information about a network interface."""
     server_service = _get_server_serivce(ctx)
     nic_service = server_service.nics(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         nic_service.get(nic_id=nic_id),
     )
     echo(service_resp)
@@ -366,7 +365,7 @@ def delete_nic(ctx, server_id: str, nic_id: int):
     """Remove a network interface from a server."""
     server_service = _get_server_serivce(ctx)
     nic_service = server_service.nics(server_id=server_id)
-    service_resp = asyncio.run(nic_service.delete(nic_id=nic_id))
+    service_resp = run_async(nic_service.delete(nic_id=nic_id))
     echo(service_resp)
 
 
@@ -379,7 +378,7 @@ def power_on(ctx, server_id: str, wait: bool):
     """Turn a server on."""
     server_service = _get_server_serivce(ctx)
     power_service = server_service.power(server_id=server_id)
-    service_resp = asyncio.run(power_service.power_on(wait))
+    service_resp = run_async(power_service.power_on(wait))
     echo(service_resp)
 
 
@@ -400,9 +399,9 @@ def power_off(ctx, server_id: str, hard: bool, wait: bool):
     server_service = _get_server_serivce(ctx)
     power_service = server_service.power(server_id=server_id)
     if hard:
-        service_resp = asyncio.run(power_service.power_off(wait=wait))
+        service_resp = run_async(power_service.power_off(wait=wait))
     else:
-        service_resp = asyncio.run(power_service.shutdown(wait=wait))
+        service_resp = run_async(power_service.shutdown(wait=wait))
     echo(service_resp)
 
 
@@ -423,9 +422,9 @@ def reboot(ctx, server_id: str, hard: bool, wait: bool):
     server_service = _get_server_serivce(ctx)
     power_service = server_service.power(server_id=server_id)
     if hard:
-        service_resp = asyncio.run(power_service.reset(wait))
+        service_resp = run_async(power_service.reset(wait))
     else:
-        service_resp = asyncio.run(power_service.reboot(wait))
+        service_resp = run_async(power_service.reboot(wait))
 
     echo(service_resp)
 
@@ -440,7 +439,7 @@ def create_snapshot(ctx, server_id: str, name: str, wait: bool):
     """Create snapshot of a server."""
     server_service = _get_server_serivce(ctx)
     snapshot_service = server_service.snapshots(server_id=server_id)
-    service_resp = asyncio.run(snapshot_service.create(name=name, wait=wait))
+    service_resp = run_async(snapshot_service.create(name=name, wait=wait))
     echo(service_resp)
 
 
@@ -452,7 +451,7 @@ def list_snapshot(ctx, server_id: str):
     """Display all snapshots of a server."""
     server_service = _get_server_serivce(ctx)
     snapshot_service = server_service.snapshots(server_id=server_id)
-    service_resp = asyncio.run(snapshot_service.list())
+    service_resp = run_async(snapshot_service.list())
     echo(service_resp)
 
 
@@ -466,7 +465,7 @@ def rollback_snapshot(ctx, server_id: str, snapshot_id: int, wait: bool):
     """Rollback a server to a saved snapshot."""
     server_service = _get_server_serivce(ctx)
     snapshot_service = server_service.snapshots(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         snapshot_service.rollback(snapshot_id=snapshot_id, wait=wait),
     )
     echo(service_resp)
@@ -481,7 +480,7 @@ def delete_snapshot(ctx, server_id: str, snapshot_id: int):
     """Remove a snapshot of a server."""
     server_service = _get_server_serivce(ctx)
     snapshot_service = server_service.snapshots(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         snapshot_service.delete(snapshot_id=snapshot_id),
     )
     echo(service_resp)
@@ -496,7 +495,7 @@ def add_tag(ctx, server_id: str, name: str):
     """Add tag to server."""
     server_service = _get_server_serivce(ctx)
     tag_service = server_service.tags(server_id=server_id)
-    service_resp = asyncio.run(tag_service.create(name=name))
+    service_resp = run_async(tag_service.create(name=name))
     echo(service_resp)
 
 
@@ -509,7 +508,7 @@ def delete_tag(ctx, server_id: str, name: str):
     """Remove tag from server."""
     server_service = _get_server_serivce(ctx)
     tag_service = server_service.tags(server_id=server_id)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         tag_service.delete(name=name),
     )
     echo(service_resp)
@@ -1,4 +1,3 @@
-import asyncio
 from typing import IO, Optional
 
 import click
@@ -7,6 +6,7 @@ from click.core import Context
 from s2ctl.click import S2CTLCommand, echo, output_option
 from s2ctl.client import client_factory
 from s2ctl.entrypoint import entry_point
+from s2ctl.invocation import run_async
 from ssclient.sshkey import SshkeyService
 
 
@@ -53,7 +53,7 @@ def create(
         return
 
     sshkey_service = _get_sshkey_serivce(ctx)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         sshkey_service.create(
             name=name,
             public_key=public_key or sshkey_file.read(),
@@ -68,7 +68,7 @@ def create(
 def list_ssh_key(ctx):
     """Display all SSH keys of the project."""
     sshkey_service = _get_sshkey_serivce(ctx)
-    service_resp = asyncio.run(sshkey_service.list())
+    service_resp = run_async(sshkey_service.list())
     echo(service_resp)
 
 
@@ -79,7 +79,7 @@ def list_ssh_key(ctx):
 def get(ctx, sshkey_id: int):
     """Get information about a key."""
     sshkey_service = _get_sshkey_serivce(ctx)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         sshkey_service.get(sshkey_id=sshkey_id),
     )
     echo(service_resp)
@@ -92,7 +92,7 @@ def get(ctx, sshkey_id: int):
 def delete(ctx, sshkey_id: int):
     """Delete a key from project."""
     sshkey_service = _get_sshkey_serivce(ctx)
-    service_resp = asyncio.run(
+    service_resp = run_async(
         sshkey_service.delete(sshkey_id=sshkey_id),
     )
     echo(service_resp)
@@ -1,26 +1,38 @@
-import asyncio
+from typing import AsyncIterator, List, Sequence
 
 import click
 from click import Context
 
-from s2ctl.click import S2CTLCommand, echo, output_option
-from s2ctl.client import client_factory
+from s2ctl.click import S2CTLCommand, echo, echo_stream, output_option
+from s2ctl.client import client_factory, configure_task_journal
 from s2ctl.entrypoint import entry_point
-from ssclient.task import TaskService
+from s2ctl.invocation import iterate_async, run_async
+from ssclient.base import TaskEntity
+from ssclient.journal import get_task_journal
+from ssclient.task import TaskOutcome, TaskService, TaskWaiter
+
+
+_wait_mode_option = click.option(
+    '--any/--all',
+    'wait_any',
+    default=False,
+    help='wait for the first completed task or for all of them.  [default: all]',
+)
 
 
 def _get_task_serivce(ctx: Context) -> TaskService:
-    return ctx.obj['tasks_service']
+    return client_factory(ctx).tasks()
+
+
+def _get_task_waiter(ctx: Context) -> TaskWaiter:
+    return client_factory(ctx).task_waiter()
 
 
 @entry_point.group()
-@click.pass_context
-def task(ctx):
+def task():
     """Many actions are long-running (e.g. creating a server) and
     executed in asynchronous way returning a task.
     """
-    client = client_factory(ctx)
-    ctx.obj['tasks_service'] = client.tasks()
 
 
 @task.command(cls=S2CTLCommand)
@@ -30,5 +42,74 @@ def task(ctx):
 def get(ctx, task_id: str):
     """Get information about a task."""
     task_service = _get_task_serivce(ctx)
-    service_resp = asyncio.run(task_service.get(task_id=task_id))
+    service_resp = run_async(task_service.get(task_id=task_id))
     echo(service_resp)
+
+
+@task.command(cls=S2CTLCommand)
+@output_option
+@click.argument('task_ids', nargs=-1, required=True)
+@_wait_mode_option
+@click.pass_context
+def wait(ctx, task_ids: Sequence[str], wait_any: bool):
+    """Wait for tasks to complete printing them as they complete."""
+    task_waiter = _get_task_waiter(ctx)
+    for task_id in task_ids:
+        task_waiter.add(task_id)
+    _wait_for_added(task_waiter, wait_any)
+
+
+@task.command(cls=S2CTLCommand)
+@output_option
+@click.pass_context
+def pending(ctx):
+    """Show tasks started by s2ctl whose completion wasn't seen yet,
+    e.g. because waiting for them was interrupted.
+    """
+    # the journal is local, no API key is needed to read it
+    echo([entry._asdict() for entry in configure_task_journal(None).get_pending()])
+
+
+@task.command(cls=S2CTLCommand)
+@output_option
+@_wait_mode_option
+@click.pass_context
+def resume(ctx, wait_any: bool):
+    """Wait for pending tasks of the current context printing them as they complete."""
+    task_waiter = _get_task_waiter(ctx)
+    task_journal = get_task_journal()
+    for entry in task_journal.get_pending():
+        if entry.context == task_journal.context:
+            task_waiter.add(entry.task_id)
+    _wait_for_added(task_waiter, wait_any)
+
+
+def _wait_for_added(task_waiter: TaskWaiter, wait_any: bool) -> None:
+    failed: List[TaskOutcome] = []
+    completed: List[TaskEntity] = []
+    outcomes = _iter_completed(task_waiter.as_completed(), completed, failed, wait_any)
+    echo_stream(iterate_async(outcomes))
+    # with --any failures matter only when no task completed
+    if failed and not (wait_any and completed):
+        _echo_failures(failed)
+
+
+async def _iter_completed(
+    outcomes: AsyncIterator[TaskOutcome],
+    completed: List[TaskEntity],
+    failed: List[TaskOutcome],
+    stop_at_first: bool,
+) -> AsyncIterator[TaskEntity]:
+    async for outcome in outcomes:
+        if outcome.task is None:
+            failed.append(outcome)
+            continue
+        completed.append(outcome.task)
+        yield outcome.task
+        if stop_at_first:
+            return
+
+
+def _echo_failures(failed: List[TaskOutcome]) -> None:
+    failures = [str(outcome.error) for outcome in failed]
+    echo('\n'.join(failures), err=True)
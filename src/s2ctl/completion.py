@@ -0,0 +1,15 @@
+import os
+import sys
+
+
+def is_completion_requested() -> bool:
+    # click turns to completion by the variable named after the program
+    prog_name = os.path.basename(sys.argv[0])
+    complete_var = '_{prog_name}_COMPLETE'.format(prog_name=prog_name.replace('-', '_').upper())
+    return complete_var in os.environ
+
+
+def init_completion() -> None:
+    if is_completion_requested():
+        import click_completion  # noqa: WPS433
+        click_completion.init()
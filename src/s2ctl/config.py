@@ -5,7 +5,8 @@ from pathlib import Path
 from typing import Any, Dict
 
 import config_path
-import yaml
+
+from ssclient.files import ensure_directory
 
 
 def generate_password(length: int = 10):
@@ -14,11 +15,11 @@ def generate_password(length: int = 10):
 
 
 _CONFIG_PATH = config_path.ConfigPath('s2ctl', 'serverspace', '.yaml')
-DEFAULT_CONFIG_DIR: Path = _CONFIG_PATH.saveFolderPath(mkdir=True)  # type: ignore
+# importing doesn't touch the file system, the folder is made by the first file written to it
+DEFAULT_CONFIG_DIR: Path = _CONFIG_PATH.saveFolderPath(mkdir=False)  # type: ignore
 DEFAULT_CONFIG_PATH: Path = DEFAULT_CONFIG_DIR / 'config.yaml'
 DEFAULT_CONFIG = types.MappingProxyType({
     'keyring': str(DEFAULT_CONFIG_DIR / 'keyring.cfg'),
-    'keyring_key': generate_password(),
     'contexts': [],
     'current_context': '',
 })
@@ -30,13 +31,31 @@ class ConfigManager(object):
 
     def get_config(self) -> Dict[str, Any]:
         self._init_config()
+        # stateless runs never read the file, so yaml is loaded here
+        import yaml  # noqa: WPS433
         with open(self.path)as config:
             return {**DEFAULT_CONFIG, **yaml.safe_load(config)}
 
     def save_config(self, config: Dict[str, Any]) -> None:
+        import yaml  # noqa: WPS433
         with open(self.path, 'w') as config_file:
             yaml.dump(config, config_file)
 
     def _init_config(self):
         if not self.path.exists():
-            self.save_config(dict(DEFAULT_CONFIG))
+            ensure_directory(self.path.parent)
+            self.save_config({**DEFAULT_CONFIG, 'keyring_key': generate_password()})
+
+
+class StatelessConfigManager(ConfigManager):
+    """Default config of runs with API key and host given by arguments, the file isn't read or written."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__(DEFAULT_CONFIG_PATH)
+        self._config: Dict[str, Any] = {**DEFAULT_CONFIG, 'host': host}
+
+    def get_config(self) -> Dict[str, Any]:  # noqa: WPS615
+        return dict(self._config)
+
+    def save_config(self, config: Dict[str, Any]) -> None:
+        self._config = dict(config)
@@ -1,13 +1,16 @@
-from typing import List, Optional, TypedDict
-
-from keyrings.cryptfile.cryptfile import CryptFileKeyring
+from typing import TYPE_CHECKING, List, Optional, TypedDict
 
+from s2ctl.agent import KeyAgentPort, make_key_id
 from s2ctl.config import ConfigManager
 
+if TYPE_CHECKING:
+    from keyrings.cryptfile.cryptfile import CryptFileKeyring  # noqa: F401
+
 SERVICE_NAME = 'serverspace'
 
 _CONTEXTS_CONFIG = 'contexts'
 _CURRENT_CONTEXT_CONFIG = 'current_context'
+_CONTEXT_HOSTS_CONFIG = 'context_hosts'
 
 
 class ContextEntity(TypedDict):
@@ -15,7 +18,7 @@ class ContextEntity(TypedDict):
     current: bool
 
 
-class BaseContextManager(object):
+class BaseContextManager(object):  # noqa: WPS214
     def __init__(self, config_manager: ConfigManager) -> None:
         self.config_manager = config_manager
 
@@ -23,6 +26,10 @@ class BaseContextManager(object):
         config = self.config_manager.get_config()
         return config[_CURRENT_CONTEXT_CONFIG]
 
+    def get_current_context_host(self) -> Optional[str]:
+        config = self.config_manager.get_config()
+        return config.get(_CONTEXT_HOSTS_CONFIG, {}).get(config.get(_CURRENT_CONTEXT_CONFIG))
+
     def set_context(self, curr_context: str) -> None:
         config = self.config_manager.get_config()
         if curr_context not in config.get(_CONTEXTS_CONFIG, []):
@@ -51,32 +58,60 @@ class BaseContextManager(object):
             config[_CURRENT_CONTEXT_CONFIG] = ''
 
         contexts.remove(context_name)
+        config.get(_CONTEXT_HOSTS_CONFIG, {}).pop(context_name, None)
         self.config_manager.save_config(config)
         return contexts
 
-    def add_context_to_config(self, context_name: str) -> List[str]:
+    def add_context_to_config(self, context_name: str, host: Optional[str] = None) -> List[str]:
         config = self.config_manager.get_config()
         contexts = config.get(_CONTEXTS_CONFIG, [])
         if context_name in contexts:
             raise Exception('Context with same name already exists')
         contexts.append(context_name)
         config[_CONTEXTS_CONFIG] = contexts
+        if host:
+            # host is known before the key is unlocked, so connecting may start earlier
+            config.setdefault(_CONTEXT_HOSTS_CONFIG, {})[context_name] = host
         self.config_manager.save_config(config)
         return contexts
 
+    def set_context_host(self, context_name: str, host: Optional[str]) -> None:
+        if not host:
+            return
+        config = self.config_manager.get_config()
+        config.setdefault(_CONTEXT_HOSTS_CONFIG, {})[context_name] = host
+        self.config_manager.save_config(config)
+
 
 class ContextManager(BaseContextManager):
     def __init__(
-        self, config_manager: ConfigManager, keyring_key: str, keyring_path: str,
+        self,
+        config_manager: ConfigManager,
+        keyring_key: str,
+        keyring_path: str,
+        agent: Optional[KeyAgentPort] = None,
     ) -> None:
         super().__init__(config_manager)
-        self.keyring = CryptFileKeyring()
-        self.keyring.file_path = keyring_path  # type: ignore
-        self.keyring.keyring_key = keyring_key  # type: ignore
-
-    def add_context(self, context_name: str, apikey: str) -> None:
+        self.keyring_key = keyring_key
+        self.keyring_path = keyring_path
+        self.agent = agent
+        self._keyring: Optional['CryptFileKeyring'] = None
+
+    @property
+    def keyring(self) -> 'CryptFileKeyring':
+        # unlocking is slow by design of the key derivation, so it's done on demand
+        if self._keyring is None:
+            from keyrings.cryptfile.cryptfile import CryptFileKeyring  # noqa: WPS433
+            keyring = CryptFileKeyring()
+            keyring.file_path = self.keyring_path  # type: ignore
+            keyring.keyring_key = self.keyring_key  # type: ignore
+            self._keyring = keyring
+        return self._keyring
+
+    def add_context(self, context_name: str, apikey: str, host: Optional[str] = None) -> None:
         self.keyring.set_password(SERVICE_NAME, context_name, apikey)
-        self.add_context_to_config(context_name)
+        self._forget_agent_key(context_name)
+        self.add_context_to_config(context_name, host)
         if len(self.contexts_list()) == 1:
             self.set_context(context_name)
 
@@ -85,8 +120,26 @@ class ContextManager(BaseContextManager):
         curr_context = config.get(_CURRENT_CONTEXT_CONFIG)
         if not curr_context:
             raise RuntimeError("context doesn't exist")
-        return self.keyring.get_password(SERVICE_NAME, curr_context)
+        if self.agent is None:
+            return self.keyring.get_password(SERVICE_NAME, curr_context)
+
+        # the agent keeps keys unlocked before, so the slow key derivation is skipped
+        key_id = self._get_agent_key_id(curr_context)
+        apikey = self.agent.get(key_id)
+        if not apikey:
+            apikey = self.keyring.get_password(SERVICE_NAME, curr_context)
+            if apikey:
+                self.agent.add(key_id, apikey)
+        return apikey
 
     def delete_context(self, context_name: str) -> None:
         self.remove_context_from_config(context_name)
         self.keyring.delete_password(SERVICE_NAME, context_name)
+        self._forget_agent_key(context_name)
+
+    def _forget_agent_key(self, context_name: str) -> None:
+        if self.agent is not None:
+            self.agent.remove(self._get_agent_key_id(context_name))
+
+    def _get_agent_key_id(self, context_name: str) -> str:
+        return make_key_id(self.keyring_path, self.keyring_key, context_name)
@@ -0,0 +1,75 @@
+import importlib
+import socket
+import socketserver
+import traceback
+from pathlib import Path
+from typing import Any, Dict
+
+from s2ctl import frames
+from s2ctl.agent import KeyStore
+from s2ctl.entrypoint import COMMAND_MODULES, entry_point
+from s2ctl.relay import client_environment, get_exit_code, relayed_stdio
+from s2ctl.runtime import Runtime
+from s2ctl.unix_socket import is_same_user, private_socket_path, unlink_socket
+
+# imported by the daemon once instead of by every command
+WARM_MODULES = ('s2ctl.factory', 'keyrings.cryptfile.cryptfile', 'tabulate', 'yaml', *COMMAND_MODULES.values())
+
+
+class Daemon(socketserver.UnixStreamServer):
+    """Runs s2ctl commands sent by thin clients in one warm process.
+
+    Commands share the event loop with pooled connections and unlocked API
+    keys. They change stdio, env and cwd of the process, so they run one
+    at a time; others wait in the socket backlog.
+    """
+
+    def __init__(self, socket_path: Path, runtime: Runtime, key_store: KeyStore) -> None:
+        self.socket_path = socket_path
+        self.runtime = runtime
+        self.key_store = key_store
+        for module_name in WARM_MODULES:
+            importlib.import_module(module_name)
+        with private_socket_path(socket_path):
+            super().__init__(str(socket_path), _CommandHandler)
+
+    def verify_request(self, request: Any, client_address: Any) -> bool:
+        return is_same_user(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        unlink_socket(self.socket_path)
+
+    def run_request(self, connection: socket.socket) -> None:
+        request = frames.recv_request(connection)
+        if request is None:
+            return
+        command_obj = {'shared_runtime': self.runtime, 'agent': self.key_store}
+        with client_environment(request['env'], request['cwd']):
+            with relayed_stdio(connection, lambda: self._interrupt(command_obj)):
+                exit_code = self._run_command(request['argv'], command_obj)
+        frames.send_frame(connection, frames.FRAME_EXIT, str(exit_code).encode())
+
+    def _run_command(self, argv: list, command_obj: Dict[str, Any]) -> int:
+        try:
+            entry_point.main(argv, prog_name='s2ctl', obj=command_obj)
+        except SystemExit as exc:
+            return get_exit_code(exc.code)
+        except Exception:
+            traceback.print_exc()
+            return 1
+        return 0
+
+    def _interrupt(self, command_obj: Dict[str, Any]) -> None:
+        # per command options, e.g. --timeout, make their own runtime
+        runtime = command_obj.get('runtime') or self.runtime
+        runtime.interrupt()
+
+
+class _CommandHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:  # noqa: WPS110
+        try:
+            self.server.run_request(self.request)  # type: ignore
+        except (OSError, ValueError, KeyError):
+            # the client has gone or sent a broken request
+            return
@@ -1,44 +1,140 @@
+import importlib
+import logging
 import os
 import types
 from pathlib import Path
+from typing import List, Optional
 
 import click
 from click.core import Context
 
-from s2ctl.config import DEFAULT_CONFIG_PATH, ConfigManager
+from s2ctl.agent import AgentClient, get_agent_socket_path
+from s2ctl.completion import init_completion
+from s2ctl.config import DEFAULT_CONFIG_PATH, ConfigManager, StatelessConfigManager
 from s2ctl.context import ContextManager
 
 CONTEXT_SETTINGS = types.MappingProxyType({'help_option_names': ['-h', '--help']})
+_DEBUG_HANDLER = 's2ctl-debug'
+# modules register their commands on import, so only the invoked one is loaded
+COMMAND_MODULES = types.MappingProxyType({
+    'agent': 's2ctl.cmd_agent',
+    'ansible': 's2ctl.cmd_ansible',
+    'context': 's2ctl.cmd_context',
+    'daemon': 's2ctl.cmd_daemon',
+    'domain': 's2ctl.cmd_domain',
+    'images': 's2ctl.cmd_metainfo',
+    'locations': 's2ctl.cmd_metainfo',
+    'network': 's2ctl.cmd_network',
+    'project': 's2ctl.cmd_project',
+    'server': 's2ctl.cmd_server',
+    'ssh-key': 's2ctl.cmd_sshkey',
+    'task': 's2ctl.cmd_task',
+})
 
 
 def run_cli():
+    init_completion()
     entry_point()
 
 
-def _get_config_manager(_ctx, _format, value: Path) -> ConfigManager:  # noqa: WPS110
-    return ConfigManager(value)
+class LazyGroup(click.Group):
+    """Group importing modules of its commands when they are invoked or listed in help."""
 
+    def list_commands(self, ctx: Context) -> List[str]:
+        return sorted({*self.commands, *COMMAND_MODULES})
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+    def get_command(self, ctx: Context, cmd_name: str) -> Optional[click.Command]:
+        module_name = COMMAND_MODULES.get(cmd_name)
+        if cmd_name not in self.commands and module_name is not None:
+            importlib.import_module(module_name)
+        return self.commands.get(cmd_name)
+
+
+def _get_config_manager(_ctx, _format, value: Optional[str]) -> Optional[ConfigManager]:  # noqa: WPS110
+    # the default one is made by the callback unless the run is stateless
+    return ConfigManager(Path(value)) if value else None
+
+
+@click.group(cls=LazyGroup, context_settings=CONTEXT_SETTINGS)
 @click.option(
     '--config',
     '-c',
     'config_manager',
     type=click.types.Path(),
-    default=DEFAULT_CONFIG_PATH,
-    show_default=True,
+    show_default=str(DEFAULT_CONFIG_PATH),
     callback=_get_config_manager,
 )
 @click.option('--apikey', '-k', envvar='S2CTL_APIKEY')
+@click.option(
+    '--host',
+    envvar='S2CTL_HOST',
+    help='API host (overrides the one found by API key and "host" configuration value).',
+)
+@click.option(
+    '--retries',
+    type=click.IntRange(min=0),
+    help='Max retries of a failed API request (overrides "retry.max_retries" configuration value).',
+)
+@click.option(
+    '--timeout',
+    type=click.FloatRange(min=0),
+    envvar='S2CTL_TIMEOUT',
+    help='Fail the command if it takes longer than the given number of seconds.',
+)
+@click.option(
+    '--shared-rate-limit',
+    is_flag=True,
+    envvar='S2CTL_SHARED_RATE_LIMIT',
+    help='Share request rate limit with other s2ctl processes using the same API key.',
+)
+@click.option('--no-cache', is_flag=True, help="Don't use cached API responses.")
 @click.option('--debug', is_flag=True, hidden=True)
+@click.option('--trace', is_flag=True, help='Print timing breakdown of every API request to stderr.')
+@click.option(
+    '--trace-har',
+    type=click.types.Path(dir_okay=False, writable=True),
+    help='Write timings of all API requests to the HTTP Archive (HAR) file.',
+)
 @click.pass_context
-def entry_point(
-    ctx: Context, config_manager: ConfigManager, apikey: str, debug: bool,
+def entry_point(  # noqa: WPS211
+    ctx: Context,
+    config_manager: Optional[ConfigManager],
+    apikey: str,
+    host: Optional[str],
+    retries: Optional[int],
+    timeout: Optional[float],
+    shared_rate_limit: bool,
+    no_cache: bool,
+    debug: bool,
+    trace: bool,
+    trace_har: Optional[str],
 ):
     ctx.ensure_object(dict)
+    if debug:
+        _setup_debug_logging(ctx)
+    if config_manager is None and apikey and host and ctx.invoked_subcommand != 'context':
+        # runs with API key and host in arguments, e.g. in CI, don't read the config and unlock keyring,
+        # without the host the config may set it and the tuning of requests
+        ctx.obj['config_manager'] = StatelessConfigManager(host)
+        ctx.obj['keyring_pass_setted'] = False
+        ctx.obj['context_manager'] = None
+    else:
+        _setup_contexts(ctx, config_manager or ConfigManager(DEFAULT_CONFIG_PATH), apikey)
+    ctx.obj['host'] = host
+    ctx.obj['apikey_arg'] = apikey
+    ctx.obj['retries'] = retries
+    ctx.obj['shared_rate_limit'] = shared_rate_limit
+    ctx.obj['no_cache'] = no_cache
+    ctx.obj['debug'] = debug
+    # the event loop and the client are made by the first command calling the API
+    ctx.obj['timeout'] = timeout
+    ctx.obj['trace'] = trace
+    ctx.obj['trace_har'] = trace_har
+
+
+def _setup_contexts(ctx: Context, config_manager: ConfigManager, apikey: Optional[str]) -> None:
     ctx.obj['config_manager'] = config_manager
     config = config_manager.get_config()
-    keyring_path = config['keyring']
     keyring_key = os.environ.get('S2CTL_CONTEXT_KEY') or config.get('keyring_key', '')
     if not (keyring_key or apikey):
         ctx.exit(
@@ -46,12 +142,23 @@ def entry_point(
             + 'Also you may set --apikey/S2CTL_APIKEY.',
         )
 
-    context_maanger = ContextManager(
+    ctx.obj['keyring_pass_setted'] = bool(keyring_key)
+    ctx.obj['context_manager'] = ContextManager(
         config_manager=config_manager,
         keyring_key=keyring_key,
-        keyring_path=keyring_path,
+        keyring_path=config['keyring'],
+        agent=ctx.obj.get('agent') or AgentClient(get_agent_socket_path()),
     )
-    ctx.obj['keyring_pass_setted'] = bool(keyring_key)
-    ctx.obj['context_manager'] = context_maanger
-    ctx.obj['apikey_arg'] = apikey
-    ctx.obj['debug'] = debug
+
+
+def _setup_debug_logging(ctx: Context) -> None:
+    logger = logging.getLogger('ssclient')
+    if any(added.get_name() == _DEBUG_HANDLER for added in logger.handlers):
+        return
+    # the handler writes to stderr of the command, so "s2ctl daemon" removes it after every one
+    log_handler = logging.StreamHandler()
+    log_handler.set_name(_DEBUG_HANDLER)
+    log_handler.setFormatter(logging.Formatter('%(asctime)s %(name)s: %(message)s'))
+    logger.addHandler(log_handler)
+    logger.setLevel(logging.DEBUG)
+    ctx.call_on_close(lambda: logger.removeHandler(log_handler))
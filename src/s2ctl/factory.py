@@ -0,0 +1,67 @@
+from typing import Any, Dict, Optional
+
+import click
+from click.core import Context
+
+from s2ctl.config import DEFAULT_CONFIG_DIR
+from s2ctl.policies import make_request_config
+from s2ctl.runtime import Runtime
+from ssclient.client import SSClient
+from ssclient.har import write_har
+from ssclient.http_client import HttpClient
+from ssclient.polling import PollingPolicy, TaskHistory, get_task_poller
+from ssclient.session import ConnectionPoolConfig
+from ssclient.tracing import RequestTrace, RequestTracer, format_trace
+
+
+def make_runtime(ctx: Context, config: Dict[str, Any]) -> Runtime:
+    pool_config = make_pool_config(config)
+    runtime = Runtime(pool_config, _make_tracer(ctx), ctx.obj.get('timeout'))
+    ctx.call_on_close(runtime.close)
+    return runtime
+
+
+def make_client(
+    ctx: Context, runtime: Runtime, config: Dict[str, Any], host: str, apikey: str,
+) -> SSClient:
+    _configure_task_polling(config)
+    return SSClient(_make_http_client(ctx, runtime, config, host, apikey))
+
+
+def make_pool_config(config: Dict[str, Any]) -> ConnectionPoolConfig:
+    return ConnectionPoolConfig(**config.get('connection_pool', {}))
+
+
+def _make_http_client(
+    ctx: Context, runtime: Runtime, config: Dict[str, Any], host: str, apikey: str,
+) -> HttpClient:
+    return HttpClient(
+        host,
+        apikey,
+        make_request_config(ctx, config),
+        session_config=runtime.session_config,
+        session=runtime.open_session(),
+    )
+
+
+def _make_tracer(ctx: Context) -> Optional[RequestTracer]:
+    har_path: Optional[str] = ctx.obj.get('trace_har')
+    if not (ctx.obj.get('trace') or har_path):
+        return None
+    tracer = RequestTracer()
+    if ctx.obj.get('trace'):
+        tracer.listeners.append(_print_trace)
+    if har_path:
+        ctx.call_on_close(lambda: write_har(tracer.traces, har_path))
+    return tracer
+
+
+def _print_trace(request_trace: RequestTrace) -> None:
+    click.echo(format_trace(request_trace), err=True)
+
+
+def _configure_task_polling(config: Dict[str, Any]) -> None:
+    # completion times are kept between invocations to poll tasks near their finish
+    task_poller = get_task_poller()
+    task_poller.policy = PollingPolicy(**config.get('task_polling', {}))
+    task_poller.history = TaskHistory(DEFAULT_CONFIG_DIR / 'task_history.json')
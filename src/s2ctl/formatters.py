@@ -1,10 +1,10 @@
 import json
-from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
-
-import yaml
-from tabulate import tabulate
+import textwrap
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Protocol
 
 INNER_FIELDS_ORDER = ('id', 'name')
+_JSON_INDENT = 4
+_JSON_ITEM_PREFIX = ' ' * _JSON_INDENT
 
 SorterType = Callable[[Any], Any]
 AnyDict = Dict[Any, Any]
@@ -19,6 +19,16 @@ class FormatterPort(Protocol):
             sorter(Optional[SorterType]): function for sorting fields order of raw_obj.
         """
 
+    def format_stream(self, raw_objs: Iterable[Any], sorter: Optional[SorterType] = None) -> Iterator[str]:
+        """Convert items of a list to string as they arrive.
+
+        Joined parts are the same as the formatted list.
+
+        Args:
+            raw_objs(Iterable[Any]): items of the list.
+            sorter(Optional[SorterType]): function for sorting fields order of an item.
+        """
+
 
 def general_fields_sort(
     field_data: Any,
@@ -50,7 +60,16 @@ class JSONFormatter(object):
     ) -> str:
         if sorter:
             raw_obj = sorter(raw_obj)
-        return json.dumps(raw_obj, indent=4, sort_keys=False)
+        return json.dumps(raw_obj, indent=_JSON_INDENT, sort_keys=False)
+
+    def format_stream(self, raw_objs: Iterable[Any], sorter: Optional[SorterType] = None) -> Iterator[str]:
+        separator = '[\n'
+        for raw_obj in raw_objs:
+            formatted = self.format(raw_obj, sorter)
+            yield '{separator}{item}'.format(separator=separator, item=textwrap.indent(formatted, _JSON_ITEM_PREFIX))
+            separator = ',\n'
+        if separator != '[\n':
+            yield '\n]'
 
 
 class YAMLFormatter(object):
@@ -62,8 +81,16 @@ class YAMLFormatter(object):
         if sorter:
             raw_obj = sorter(raw_obj)
         prep_obj = self._prepare_obj(raw_obj)
+        import yaml  # noqa: WPS433
         return yaml.dump(prep_obj, sort_keys=False)
 
+    def format_stream(self, raw_objs: Iterable[Any], sorter: Optional[SorterType] = None) -> Iterator[str]:
+        for raw_obj in raw_objs:
+            if sorter:
+                raw_obj = sorter(raw_obj)
+            # every item is a part of the mapping by id as in the formatted list
+            yield self.format([raw_obj])
+
     def _prepare_obj(self, raw_obj: Any) -> Any:
         if not isinstance(raw_obj, (dict, List)):
             return str(raw_obj)
@@ -111,8 +138,16 @@ class TableFormatter(object):
         if not self._is_list_has_only_dicts(raw_obj):
             raw_obj = [{'value': list_item} for list_item in raw_obj]
 
+        # tabulate is slow to import, so it's loaded only for table output
+        from tabulate import tabulate  # noqa: WPS433
         return tabulate(raw_obj, headers='keys', tablefmt=self.table_foramt)
 
+    def format_stream(self, raw_objs: Iterable[Any], sorter: Optional[SorterType] = None) -> Iterator[str]:
+        # column widths depend on all rows
+        raw_objs = list(raw_objs)
+        if raw_objs:
+            yield self.format(raw_objs, sorter)
+
     def _is_list_has_only_dicts(self, raw_obj: List[Any]) -> bool:
         for list_item in raw_obj:
             if isinstance(list_item, dict):
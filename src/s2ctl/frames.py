@@ -0,0 +1,52 @@
+"""Messages between "s2ctl-thin" and "s2ctl daemon".
+
+Messages are frames of a kind byte and a length-prefixed payload. The client
+sends the request, then prints output frames until the exit one. Stdin is
+sent only if the command asks for it, so scripts may read it after the call.
+Ctrl-C of the client is sent as the interrupt frame.
+"""
+import json
+import socket
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+FRAME_REQUEST = b'r'
+FRAME_STDOUT = b'o'
+FRAME_STDERR = b'e'
+FRAME_STDIN_WANTED = b'i'
+FRAME_STDIN = b'd'
+FRAME_INTERRUPT = b'c'
+FRAME_EXIT = b'x'
+_HEADER = struct.Struct('!cI')
+_CHUNK_SIZE = 64 * 1024  # noqa: WPS432
+
+
+def send_request(peer_socket: socket.socket, request: Dict[str, Any]) -> None:
+    send_frame(peer_socket, FRAME_REQUEST, json.dumps(request).encode())
+
+
+def recv_request(peer_socket: socket.socket) -> Optional[Dict[str, Any]]:
+    kind, payload = recv_frame(peer_socket)
+    if kind != FRAME_REQUEST:
+        return None
+    return json.loads(payload)
+
+
+def send_frame(peer_socket: socket.socket, kind: bytes, payload: bytes = b'') -> None:
+    peer_socket.sendall(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def recv_frame(peer_socket: socket.socket) -> Tuple[bytes, bytes]:
+    kind, size = _HEADER.unpack(_recv_exactly(peer_socket, _HEADER.size))
+    return kind, _recv_exactly(peer_socket, size)
+
+
+def _recv_exactly(peer_socket: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = peer_socket.recv(min(size, _CHUNK_SIZE))
+        if not chunk:
+            raise ConnectionError('connection is closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
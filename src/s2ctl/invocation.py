@@ -0,0 +1,57 @@
+import importlib
+import types
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Iterator, Optional, TypeVar
+
+import click
+from click.core import Context
+
+if TYPE_CHECKING:
+    from s2ctl.runtime import Runtime  # noqa: F401
+    from ssclient.client import SSClient  # noqa: F401
+
+T = TypeVar('T')  # noqa: WPS111
+
+
+def get_runtime(ctx: Context) -> 'Runtime':
+    """Get event loop of the invocation, it's started by the first command which needs it."""
+    runtime = ctx.obj.get('runtime')
+    if runtime is None:
+        runtime = _get_shared_runtime(ctx)
+    if runtime is None:
+        config = ctx.obj['config_manager'].get_config()
+        runtime = import_factory().make_runtime(ctx.find_root(), config)
+    ctx.obj['runtime'] = runtime
+    return runtime
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run coroutine while pooled session of the current client is opened."""
+    ctx = click.get_current_context()
+    client: Optional[SSClient] = ctx.obj.get('client')
+    if client is None:
+        return get_runtime(ctx).run(coro)
+    return get_runtime(ctx).run(_run_in_session(client, coro))
+
+
+def iterate_async(stream: AsyncIterator[T]) -> Iterator[T]:
+    """Iterate over async iterator in the event loop of the invocation."""
+    return get_runtime(click.get_current_context()).iterate(stream)
+
+
+def import_factory() -> types.ModuleType:
+    # aiohttp and the rest of the client are loaded only by commands calling the API
+    return importlib.import_module('s2ctl.factory')
+
+
+def _get_shared_runtime(ctx: Context) -> Optional['Runtime']:
+    # the one of "s2ctl daemon" keeps connections between commands, it has no deadline and tracer
+    if ctx.obj.get('timeout') is not None:
+        return None
+    if ctx.obj.get('trace') or ctx.obj.get('trace_har'):
+        return None
+    return ctx.obj.get('shared_runtime')
+
+
+async def _run_in_session(client: 'SSClient', coro: Awaitable[T]) -> T:
+    async with client:
+        return await coro
@@ -0,0 +1,59 @@
+from typing import Any, Dict
+
+from click.core import Context
+
+from s2ctl.config import DEFAULT_CONFIG_DIR
+from ssclient.cache import CachePolicy
+from ssclient.cachestore import FileCache
+from ssclient.circuitbreaker import CircuitBreakerPolicy
+from ssclient.compression import CompressionConfig
+from ssclient.concurrency import AdaptiveConcurrency
+from ssclient.hedging import HedgingPolicy
+from ssclient.ratelimit import RateLimit
+from ssclient.request_config import RequestConfig, TimeoutConfig
+from ssclient.retry import RetryPolicy
+
+
+def make_request_config(ctx: Context, config: Dict[str, Any]) -> RequestConfig:
+    return RequestConfig(
+        timeout=TimeoutConfig(**config.get('timeouts', {})),
+        retry=_make_retry_policy(ctx, config),
+        rate_limit=_make_rate_limit(ctx, config),
+        concurrency=AdaptiveConcurrency(**config.get('concurrency', {})),
+        circuit_breaker=CircuitBreakerPolicy(**config.get('circuit_breaker', {})),
+        hedging=HedgingPolicy(**config.get('hedging', {})),
+        compression=CompressionConfig(**config.get('compression', {})),
+        **_make_cache_params(ctx, config),
+    )
+
+
+def _make_retry_policy(ctx: Context, config: Dict[str, Any]) -> RetryPolicy:
+    retry_config = dict(config.get('retry', {}))
+    if ctx.obj.get('retries') is not None:
+        retry_config['max_retries'] = ctx.obj['retries']
+    retry_statuses = retry_config.get('retry_statuses')
+    if retry_statuses is not None:
+        retry_config['retry_statuses'] = frozenset(retry_statuses)
+    return RetryPolicy(**retry_config)
+
+
+def _make_rate_limit(ctx: Context, config: Dict[str, Any]) -> RateLimit:
+    rate_limit_config = dict(config.get('rate_limit', {}))
+    shared = rate_limit_config.pop('shared', False)
+    if shared or ctx.obj.get('shared_rate_limit'):
+        rate_limit_config['shared_dir'] = str(DEFAULT_CONFIG_DIR)
+    return RateLimit(**rate_limit_config)
+
+
+def _make_cache_params(ctx: Context, config: Dict[str, Any]) -> Dict[str, Any]:
+    cache_config = dict(config.get('cache', {}))
+    if ctx.obj.get('no_cache') or not cache_config.pop('enabled', True):
+        return {}
+
+    policy = CachePolicy()
+    if 'ttl_rules' in cache_config:
+        policy = CachePolicy(ttl_rules=cache_config.pop('ttl_rules'))
+    return {
+        'cache': FileCache(DEFAULT_CONFIG_DIR / 'cache', **cache_config),
+        'cache_policy': policy,
+    }
@@ -0,0 +1,130 @@
+import io
+import os
+import queue
+import socket
+import sys
+import threading
+from contextlib import contextmanager, suppress
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from s2ctl import frames
+
+
+@contextmanager
+def client_environment(env: Dict[str, str], cwd: str) -> Iterator[None]:
+    saved_env = dict(os.environ)
+    saved_cwd = os.getcwd()
+    os.chdir(cwd)
+    _replace_environ(env)
+    try:  # noqa: WPS501
+        yield
+    finally:
+        _replace_environ(saved_env)
+        os.chdir(saved_cwd)
+
+
+@contextmanager
+def relayed_stdio(connection: socket.socket, on_interrupt: Callable[[], None]) -> Iterator[None]:
+    """Relay stdio of the command to the client and call back when the client interrupts it."""
+    frame_reader = _FrameReader(connection, on_interrupt)
+    frame_reader.start()
+    saved_stdio = {name: getattr(sys, name) for name in ('stdin', 'stdout', 'stderr')}
+    stdin_reader = _StdinReader(connection, frame_reader.stdin)
+    sys.stdin = io.TextIOWrapper(io.BufferedReader(stdin_reader), encoding='utf-8')
+    sys.stdout = _FrameWriter.open_text(connection, frames.FRAME_STDOUT)
+    sys.stderr = _FrameWriter.open_text(connection, frames.FRAME_STDERR)
+    try:  # noqa: WPS501
+        yield
+    finally:
+        for name, stream in saved_stdio.items():
+            setattr(sys, name, stream)
+        frame_reader.stop()
+
+
+def get_exit_code(code: Any) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write('{code}\n'.format(code=code))
+    return 1
+
+
+class _FrameReader(threading.Thread):
+    """Receives frames the client sends while its command runs.
+
+    Ctrl-C of the client and its disconnection interrupt the command.
+    """
+
+    def __init__(self, connection: socket.socket, on_interrupt: Callable[[], None]) -> None:
+        super().__init__(name='s2ctl-frame-reader', daemon=True)
+        self.stdin: 'queue.Queue[bytes]' = queue.Queue()
+        self._connection = connection
+        self._on_interrupt = on_interrupt
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        try:
+            while True:  # noqa: WPS457
+                self._receive()
+        except (OSError, ValueError):
+            # stdin of the gone client is empty
+            self.stdin.put(b'')
+        if not self._stopped.is_set():
+            self._on_interrupt()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        # the client may keep the connection, the reader stops on the end of its input
+        with suppress(OSError):
+            self._connection.shutdown(socket.SHUT_RD)
+        self.join()
+
+    def _receive(self) -> None:
+        kind, payload = frames.recv_frame(self._connection)
+        if kind == frames.FRAME_STDIN:
+            self.stdin.put(payload)
+        elif kind == frames.FRAME_INTERRUPT and not self._stopped.is_set():
+            self._on_interrupt()
+
+
+class _FrameWriter(io.RawIOBase):
+    def __init__(self, connection: socket.socket, kind: bytes) -> None:
+        super().__init__()
+        self._connection = connection
+        self._kind = kind
+
+    @classmethod
+    def open_text(cls, connection: socket.socket, kind: bytes) -> io.TextIOWrapper:
+        # every write is sent at once, so output is streamed as the command prints it
+        return io.TextIOWrapper(cls(connection, kind), encoding='utf-8', write_through=True)  # type: ignore
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, output: Any) -> int:
+        frames.send_frame(self._connection, self._kind, bytes(output))
+        return len(output)
+
+
+class _StdinReader(io.RawIOBase):
+    def __init__(self, connection: socket.socket, stdin: 'queue.Queue[bytes]') -> None:
+        super().__init__()
+        self._connection = connection
+        self._received = stdin
+        self._stdin: Optional[io.BytesIO] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._stdin is None:
+            # the client reads its stdin only when the command does
+            frames.send_frame(self._connection, frames.FRAME_STDIN_WANTED)
+            self._stdin = io.BytesIO(self._received.get())
+        return self._stdin.readinto(buffer)
+
+
+def _replace_environ(env: Dict[str, str]) -> None:
+    os.environ.clear()
+    os.environ.update(env)
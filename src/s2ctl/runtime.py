@@ -0,0 +1,109 @@
+import asyncio
+import time
+from concurrent import futures
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, TypeVar
+
+import aiohttp
+
+from ssclient.deadline import deadline, within_deadline
+from ssclient.loop import LoopThread
+from ssclient.session import ConnectionPoolConfig, SessionConfig, make_session, prewarm_connection
+from ssclient.tracing import RequestTracer
+
+T = TypeVar('T')  # noqa: WPS111
+
+# the first request doesn't wait for a slow host longer, it connects by itself
+PREWARM_WAIT_TIMEOUT = 1
+
+
+class Runtime(object):  # noqa: WPS214
+    """Event loop of a CLI invocation with the connection pool shared by its clients.
+
+    The loop runs in a background thread, so connecting to the API host may start
+    while the main thread is still unlocking keyring.
+    """
+
+    def __init__(
+        self,
+        pool_config: ConnectionPoolConfig,
+        tracer: Optional[RequestTracer] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.pool_config = pool_config
+        self.tracer = tracer
+        # the whole invocation shares one time budget
+        self.expires: Optional[float] = None
+        if timeout is not None:
+            self.expires = time.monotonic() + timeout
+        self._session_config: Optional[SessionConfig] = None
+        self._loop_thread: Optional[LoopThread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._prewarm: Optional['futures.Future[Any]'] = None
+
+    @property
+    def session_config(self) -> SessionConfig:
+        # loading of CA certificates is deferred until the first client is made
+        if self._session_config is None:
+            self._session_config = SessionConfig(self.pool_config, tracer=self.tracer)
+        return self._session_config
+
+    @property
+    def loop_thread(self) -> LoopThread:
+        if self._loop_thread is None:
+            self._loop_thread = LoopThread(name='s2ctl-loop')
+        return self._loop_thread
+
+    def prewarm(self, host: str) -> None:
+        self._prewarm = self.loop_thread.submit(self._prewarm_connection(host, self.session_config))
+
+    def open_session(self) -> aiohttp.ClientSession:
+        return self.loop_thread.run(self._open_session(self.session_config))
+
+    def run(self, coro: Awaitable[T]) -> T:
+        return self.loop_thread.run(self._wrap(coro))
+
+    def iterate(self, stream: AsyncIterator[T]) -> Iterator[T]:
+        return self.loop_thread.iterate(stream, self._wrap)
+
+    def interrupt(self) -> None:
+        if self._loop_thread is not None:
+            self._loop_thread.interrupt()
+
+    def close(self) -> None:
+        if self._loop_thread is None:
+            return
+        # requests left by Ctrl-C are cancelled before their session is closed
+        self._loop_thread.stop(self._close_session)
+        self._loop_thread = None
+
+    async def _open_session(self, session_config: SessionConfig) -> aiohttp.ClientSession:
+        # session is bound to the loop, so it's created inside of it
+        if self._session is None:
+            self._session = make_session(session_config)
+        return self._session
+
+    def _wrap(self, coro: Awaitable[T]) -> Awaitable[T]:
+        return self._run_within_deadline(self._run_after_prewarm(coro))
+
+    async def _run_within_deadline(self, coro: Awaitable[T]) -> T:
+        remaining = None
+        if self.expires is not None:
+            remaining = self.expires - time.monotonic()
+        with deadline(remaining):
+            async with within_deadline():
+                return await coro
+
+    async def _run_after_prewarm(self, coro: Awaitable[T]) -> T:
+        # the first request reuses prewarmed connection instead of opening one more
+        if self._prewarm is not None and not self._prewarm.done():
+            await asyncio.wait([asyncio.wrap_future(self._prewarm)], timeout=PREWARM_WAIT_TIMEOUT)
+        return await coro
+
+    async def _close_session(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _prewarm_connection(self, host: str, session_config: SessionConfig) -> None:
+        session = await self._open_session(session_config)
+        await prewarm_connection(session, host, session_config.sslcontext)
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any, Awaitable, List, Optional, TypeVar
+
+T = TypeVar('T')  # noqa: WPS111
+
+
+class TaskGroup(object):
+    """Runs coroutines concurrently until all of them are done.
+
+    The first failure cancels the other tasks and is raised from the group,
+    so no request outlives the command which started it.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: List['asyncio.Future[Any]'] = []
+
+    async def __aenter__(self) -> 'TaskGroup':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_value is not None:
+            self._cancel()
+        try:  # noqa: WPS501
+            await self._wait_first_error()
+        finally:
+            # cancelled group still waits for its tasks to be done
+            self._cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        error = self._get_first_error()
+        if exc_value is None and error is not None:
+            raise error
+
+    def create_task(self, coro: Awaitable[T]) -> 'asyncio.Future[T]':
+        task = asyncio.ensure_future(coro)
+        self._tasks.append(task)
+        return task
+
+    async def _wait_first_error(self) -> None:
+        pending = [task for task in self._tasks if not task.done()]
+        while pending:
+            await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+            if self._get_first_error() is not None:
+                return
+            # tasks may create more tasks of the group
+            pending = [task for task in self._tasks if not task.done()]
+
+    def _cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    def _get_first_error(self) -> Optional[BaseException]:
+        for task in self._tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                return task.exception()
+        return None
@@ -0,0 +1,81 @@
+"""Thin client of "s2ctl daemon", it's kept small to start fast."""
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from s2ctl import frames
+from s2ctl.completion import is_completion_requested
+from s2ctl.config import DEFAULT_CONFIG_DIR
+
+DAEMON_SOCKET_ENV = 'S2CTL_DAEMON_SOCK'
+
+
+def get_daemon_socket_path() -> Path:
+    return Path(os.environ.get(DAEMON_SOCKET_ENV) or DEFAULT_CONFIG_DIR / 'daemon.sock')
+
+
+def run_thin_cli() -> None:
+    """Run the command in "s2ctl daemon" if it's running, in this process otherwise."""
+    daemon_socket = None
+    # completion is set up by the full CLI only
+    if not is_completion_requested():
+        daemon_socket = connect_daemon(get_daemon_socket_path())
+    if daemon_socket is None:
+        from s2ctl.entrypoint import run_cli  # noqa: WPS433
+        run_cli()
+        return
+
+    with daemon_socket:
+        signal.signal(signal.SIGINT, lambda *_: _interrupt_command(daemon_socket))
+        exit_code = relay_command(
+            daemon_socket,
+            sys.argv[1:],
+            stdin=sys.stdin.buffer,
+            stdout=sys.stdout.buffer,
+            stderr=sys.stderr.buffer,
+        )
+    sys.exit(exit_code)
+
+
+def connect_daemon(socket_path: Path) -> Optional[socket.socket]:
+    if not hasattr(socket, 'AF_UNIX') or not socket_path.exists():
+        return None
+    daemon_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # noqa: WPS432
+    try:
+        daemon_socket.connect(str(socket_path))
+    except OSError:
+        daemon_socket.close()
+        return None
+    return daemon_socket
+
+
+def relay_command(
+    daemon_socket: socket.socket, argv: list, stdin: BinaryIO, stdout: BinaryIO, stderr: BinaryIO,
+) -> int:
+    request = {'argv': argv, 'env': dict(os.environ), 'cwd': os.getcwd()}
+    frames.send_request(daemon_socket, request)
+    outputs = {frames.FRAME_STDOUT: stdout, frames.FRAME_STDERR: stderr}
+    try:
+        while True:  # noqa: WPS457
+            kind, payload = frames.recv_frame(daemon_socket)
+            output = outputs.get(kind)
+            if output is not None:
+                output.write(payload)
+                output.flush()
+            elif kind == frames.FRAME_STDIN_WANTED:
+                frames.send_frame(daemon_socket, frames.FRAME_STDIN, stdin.read())
+            elif kind == frames.FRAME_EXIT:
+                return int(payload)
+    except (OSError, ValueError):
+        stderr.write(b's2ctl daemon closed the connection\n')
+        return 1
+
+
+def _interrupt_command(daemon_socket: socket.socket) -> None:
+    # the daemon cancels the command and still sends its output and exit code,
+    # the next Ctrl-C stops waiting for it
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    frames.send_frame(daemon_socket, frames.FRAME_INTERRUPT)
@@ -0,0 +1,58 @@
+import os
+import socket
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from ssclient.files import ensure_directory
+
+# sockets are made with rw permissions for the owner only
+_SOCKET_UMASK = 0o177
+_PEERCRED_FORMAT = '3i'
+
+
+class SocketInUseError(RuntimeError):
+    def __init__(self, socket_path: Path) -> None:
+        super().__init__('{path} is used by another running process'.format(path=socket_path))
+
+
+@contextmanager
+def private_socket_path(socket_path: Path) -> Iterator[None]:
+    """Prepare the path for a socket which only the user may connect to."""
+    _remove_stale_socket(socket_path)
+    ensure_directory(socket_path.parent)
+    old_umask = os.umask(_SOCKET_UMASK)
+    try:  # noqa: WPS501
+        yield
+    finally:
+        os.umask(old_umask)
+
+
+def is_same_user(peer_socket: socket.socket) -> bool:
+    if not hasattr(socket, 'SO_PEERCRED'):
+        # mode of the socket file still keeps other users out
+        return True
+    credentials = peer_socket.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize(_PEERCRED_FORMAT))
+    _pid, uid, _gid = struct.unpack(_PEERCRED_FORMAT, credentials)
+    return uid == os.getuid()
+
+
+def unlink_socket(socket_path: Path) -> None:
+    try:
+        socket_path.unlink()
+    except FileNotFoundError:
+        return
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe_socket:  # noqa: WPS432
+        try:
+            probe_socket.connect(str(socket_path))
+        except OSError:
+            # left by a process which was killed
+            unlink_socket(socket_path)
+            return
+    raise SocketInUseError(socket_path)
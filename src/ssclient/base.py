@@ -1,14 +1,19 @@
 import asyncio
+import time
+from http import HTTPStatus
 from typing import Any, ClassVar, Dict, Optional, TypedDict
 from urllib.parse import urljoin
 
-from async_timeout import timeout
-
 from ssclient import errors
+from ssclient import journal
+from ssclient.deadline import within_deadline
+from ssclient.polling import get_task_poller
 from ssclient.ports import HttpClientPort
 
 URLFields = Dict[str, Any]
 
+DEFAULT_TASK_TIMEOUT = 60
+
 
 class TaskIDWrap(TypedDict):
     task_id: str
@@ -55,15 +60,50 @@ class BaseService(object):
             path = '{path}/'.format(path=path)
         return urljoin(path, fragment)
 
-    async def _wait_task_completion(self, task_id: str, timeout_secs: int = 60) -> TaskEntity:
-        async with timeout(timeout_secs):
+    def _journal_task(self, task_wrap: TaskIDWrap, kind: str, resource: str) -> None:
+        # waits interrupted before the task finished may be resumed from the journal
+        journal.get_task_journal().record_started(task_wrap['task_id'], kind, resource)
+
+    async def _wait_task_completion(
+        self,
+        task_id: str,
+        timeout_secs: Optional[float] = DEFAULT_TASK_TIMEOUT,
+        kind: Optional[str] = None,
+    ) -> TaskEntity:
+        """Poll the task until it's completed.
+
+        Polls of a task of the kind (e.g. "server.create") are scheduled by
+        completion times of the previous ones.
+        """
+        task_poller = get_task_poller()
+        delays = task_poller.iter_delays(kind)
+        started = time.monotonic()
+        async with within_deadline(timeout_secs):
             while True:
-                path = urljoin('api/v1/tasks/', task_id)
-                task_resp = await self._http_client.get(path)
-                task_data = task_resp['task']
-                status = task_data['is_completed']
-                if status == 'Completed':
-                    return task_data
-                elif status == 'Failed':
-                    raise errors.TaskFailedError(task_id)
-                await asyncio.sleep(1)
+                await asyncio.sleep(next(delays))
+                task_data = await self._poll_task(task_id)
+                if task_data is not None:
+                    break
+        if kind is not None:
+            task_poller.history.record(kind, time.monotonic() - started)
+        return task_data
+
+    async def _poll_task(self, task_id: str) -> Optional[TaskEntity]:
+        """Get the completed task or None if it's still running."""
+        path = urljoin('api/v1/tasks/', task_id)
+        task_journal = journal.get_task_journal()
+        try:
+            task_resp = await self._http_client.get(path)
+        except errors.HttpClientResponseError as exc:
+            if exc.status == HTTPStatus.NOT_FOUND:
+                task_journal.record_finished(task_id, journal.NOT_FOUND)
+            raise
+        task_data = task_resp['task']
+        status = task_data['is_completed']
+        if status == 'Completed':
+            task_journal.record_finished(task_id, journal.COMPLETED)
+            return task_data
+        elif status == 'Failed':
+            task_journal.record_finished(task_id, journal.FAILED)
+            raise errors.TaskFailedError(task_id)
+        return None
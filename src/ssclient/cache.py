@@ -0,0 +1,120 @@
+import hashlib
+import time
+import types
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+from aiohttp import hdrs
+
+from ssclient.ports import CacheBackendPort
+
+DEFAULT_TTL_RULES = types.MappingProxyType({
+    'api/v1/locations': 60 * 60,
+    'api/v1/images': 60 * 60,
+    'api/v1/ssh-keys': 60 * 5,
+})
+_NAMESPACE_LENGTH = 16
+
+
+@dataclass
+class CacheEntry(object):
+    body: Any
+    expires: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+@dataclass(frozen=True)
+class CachePolicy(object):
+    # path prefix -> seconds the response is fresh, the first matched prefix wins
+    ttl_rules: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_TTL_RULES))
+
+    def get_ttl(self, path: str) -> Optional[float]:
+        for prefix, ttl in self.ttl_rules.items():
+            if is_path_prefix(prefix.strip('/'), path):
+                return ttl
+        return None
+
+
+class ResponseCache(object):  # noqa: WPS214
+    def __init__(
+        self, backend: CacheBackendPort, policy: Optional[CachePolicy] = None, namespace: str = '',
+    ) -> None:
+        self.backend = backend
+        self.policy = policy or CachePolicy()
+        # responses of different API keys must never mix
+        self.namespace = hashlib.sha256(namespace.encode()).hexdigest()[:_NAMESPACE_LENGTH]
+
+    def lookup(self, path: str) -> Optional[CacheEntry]:
+        return self.backend.get(self._make_key(path))
+
+    def get_conditional_headers(self, entry: Optional[CacheEntry]) -> Dict[str, str]:
+        headers = {}
+        if entry is not None and entry.etag:
+            headers[hdrs.IF_NONE_MATCH] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = entry.last_modified
+        return headers
+
+    def store(self, path: str, headers: Mapping[str, str], body: Any) -> None:
+        cache_control = headers.get(hdrs.CACHE_CONTROL, '')
+        if 'no-store' in cache_control:
+            return
+        entry = CacheEntry(
+            body=body,
+            expires=time.time() + self._get_ttl(path, cache_control),
+            etag=headers.get(hdrs.ETAG),
+            last_modified=headers.get(hdrs.LAST_MODIFIED),
+        )
+        if entry.is_fresh or entry.has_validators:
+            self.backend.set(self._make_key(path), entry)
+
+    def refresh(self, path: str, headers: Mapping[str, str], entry: CacheEntry) -> None:
+        """Extend lifetime of the entry confirmed by "304 Not Modified" response."""
+        cache_control = headers.get(hdrs.CACHE_CONTROL, '')
+        entry.expires = time.time() + self._get_ttl(path, cache_control)
+        self.backend.set(self._make_key(path), entry)
+
+    def invalidate(self, path: str) -> None:
+        """Drop all entries of the collection the path belongs to.
+
+        Changing any sub-resource (e.g. a volume of a server) changes its parents too.
+        """
+        path_parts = self._normalize(path).split('/')
+        collection = '/'.join(path_parts[:3])
+        self.backend.delete_prefix(self._make_key(collection))
+
+    def _get_ttl(self, path: str, cache_control: str) -> float:
+        ttl = self.policy.get_ttl(self._normalize(path))
+        if ttl is None:
+            return _get_max_age(cache_control)
+        return ttl
+
+    def _make_key(self, path: str) -> str:
+        return '{namespace}:{path}'.format(namespace=self.namespace, path=self._normalize(path))
+
+    def _normalize(self, path: str) -> str:
+        return path.strip('/')
+
+
+def is_path_prefix(prefix: str, path: str) -> bool:
+    if not path.startswith(prefix):
+        return False
+    rest = path[len(prefix):]
+    return not rest or rest[0] in '/?'
+
+
+def _get_max_age(cache_control: str) -> int:
+    for directive in cache_control.split(','):
+        name, _, directive_value = directive.strip().partition('=')
+        if name == 'max-age' and directive_value.isdigit():
+            return int(directive_value)
+    return 0
@@ -0,0 +1,119 @@
+import copy
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+from ssclient.cache import CacheEntry, is_path_prefix
+from ssclient.files import write_private
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024  # noqa: WPS432
+
+
+class MemoryCache(object):
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry)
+
+    def set(self, key: str, entry: CacheEntry) -> None:  # noqa: WPS125
+        self._entries[key] = copy.deepcopy(entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> None:
+        stale_keys = [key for key in self._entries if is_path_prefix(prefix, key)]
+        for stale_key in stale_keys:
+            del self._entries[stale_key]  # noqa: WPS420
+
+
+class FileCache(object):  # noqa: WPS214
+    """Cache keeping every entry in a separate file of the directory.
+
+    The first line of a file is the entry key, so invalidation doesn't have to
+    decode the bodies. Least recently used files are evicted by modification time.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry_path = self._entry_path(key)
+        try:
+            entry = self._read(entry_path, key)
+        except (OSError, ValueError, TypeError):
+            return None
+        if entry is not None:
+            with suppress(OSError):
+                self._touch(entry_path)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:  # noqa: WPS125
+        entry_path = self._entry_path(key)
+        try:
+            self._write(entry_path, key, entry)
+        except OSError:
+            return
+        self._evict()
+
+    def delete_prefix(self, prefix: str) -> None:
+        for entry_path in self._entry_paths():
+            with suppress(OSError):
+                self._delete_if_prefixed(entry_path, prefix)
+
+    def _read(self, entry_path: Path, key: str) -> Optional[CacheEntry]:
+        with open(entry_path) as entry_file:
+            if entry_file.readline().rstrip('\n') != key:
+                return None
+            return CacheEntry(**json.loads(entry_file.read()))
+
+    def _write(self, entry_path: Path, key: str, entry: CacheEntry) -> None:
+        entry_json = json.dumps(asdict(entry))
+        write_private(entry_path, '{key}\n{entry}'.format(key=key, entry=entry_json))
+        self._touch(entry_path)
+
+    def _delete_if_prefixed(self, entry_path: Path, prefix: str) -> None:
+        with open(entry_path) as entry_file:
+            key = entry_file.readline().rstrip('\n')
+        if is_path_prefix(prefix, key):
+            entry_path.unlink()
+
+    def _touch(self, entry_path: Path) -> None:
+        # precise time, file systems may keep coarse timestamps
+        now = time.time()
+        os.utime(entry_path, (now, now))
+
+    def _entry_path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / '{name}.json'.format(name=name)
+
+    def _entry_paths(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob('*.json'))
+
+    def _evict(self) -> None:
+        stats = []
+        for entry_path in self._entry_paths():
+            with suppress(OSError):
+                stats.append((entry_path, entry_path.stat()))
+        total_size = sum(stat.st_size for _, stat in stats)
+        for entry_path, stat in sorted(stats, key=lambda path_stat: path_stat[1].st_mtime):
+            if total_size <= self.max_bytes:
+                break
+            with suppress(OSError):
+                entry_path.unlink()
+            total_size -= stat.st_size
@@ -0,0 +1,143 @@
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+from urllib import parse as urlparse
+
+from ssclient import errors
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy(object):
+    enabled: bool = True
+    failure_threshold: int = 5  # consecutive failures opening the circuit
+    failure_ratio: float = 0.5  # share of failures in the full window opening the circuit
+    window: int = 20  # recent outcomes the failure ratio is counted over
+    reset_timeout: float = 30  # seconds the circuit stays open before probing the host
+    half_open_probes: int = 1  # requests let through at once to probe the host
+
+
+class CircuitBreaker(object):  # noqa: WPS214
+    """Fail fast while the API host is down instead of waiting out timeouts and retries.
+
+    After reset timeout the circuit lets a few probe requests through, their
+    success closes it and their failure opens it again.
+    """
+
+    def __init__(self, host: str, policy: CircuitBreakerPolicy) -> None:
+        self.host = host
+        self.policy = policy
+        self.consecutive_failures = 0
+        self._outcomes: Deque[bool] = deque(maxlen=policy.window)
+        self._opened: Optional[float] = None
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened is None:
+            return CLOSED
+        if self.clock() - self._opened < self.policy.reset_timeout:
+            return OPEN
+        return HALF_OPEN
+
+    def clock(self) -> float:
+        return time.monotonic()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if not self.policy.enabled:
+            yield
+            return
+
+        is_probe = self._admit()
+        try:
+            yield
+        except errors.HttpClientError as exc:
+            self._record(is_host_failure(exc))
+            raise
+        else:
+            self._record(failed=False)
+        finally:
+            if is_probe:
+                self._probes -= 1
+
+    def _admit(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return False
+        if state == OPEN or self._probes >= self.policy.half_open_probes:
+            raise errors.CircuitOpenError(self.host, self._get_retry_after())
+        self._probes += 1
+        return True
+
+    def _record(self, failed: bool) -> None:
+        self._outcomes.append(failed)
+        # late answers to requests sent before opening don't change open circuit
+        state = self.state
+        if not failed:
+            self.consecutive_failures = 0
+            if state == HALF_OPEN:
+                self._close()
+            return
+
+        self.consecutive_failures += 1
+        if state == HALF_OPEN:
+            self._open('probe failed')
+            return
+        reason = self._get_open_reason()
+        if state == CLOSED and reason is not None:
+            self._open(reason)
+
+    def _get_open_reason(self) -> Optional[str]:
+        if self.consecutive_failures >= self.policy.failure_threshold:
+            return '{count} consecutive failures'.format(count=self.consecutive_failures)
+        failures = sum(self._outcomes)
+        is_window_full = len(self._outcomes) == self.policy.window
+        if is_window_full and failures >= self.policy.failure_ratio * self.policy.window:
+            return '{count} of {total} requests failed'.format(count=failures, total=self.policy.window)
+        return None
+
+    def _open(self, reason: str) -> None:
+        self._opened = self.clock()
+        self._outcomes.clear()
+        logger.debug('circuit of %s opened for %.0fs: %s', self.host, self.policy.reset_timeout, reason)
+
+    def _close(self) -> None:
+        self._opened = None
+        self._outcomes.clear()
+        logger.debug('circuit of %s closed: probe succeeded', self.host)
+
+    def _get_retry_after(self) -> float:
+        if self._opened is None:
+            return 0
+        return max(self._opened + self.policy.reset_timeout - self.clock(), 0)
+
+
+def is_host_failure(exc: errors.HttpClientError) -> bool:
+    if isinstance(exc, errors.HttpClientConnectionError):
+        return True
+    if isinstance(exc, errors.HttpClientResponseError):
+        return exc.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+    return False
+
+
+_host_breakers: Dict[Tuple[str, CircuitBreakerPolicy], CircuitBreaker] = {}
+
+
+def get_host_breaker(host: str, policy: CircuitBreakerPolicy) -> CircuitBreaker:
+    """Get circuit breaker shared by all clients of the API host with the same policy."""
+    host_key = urlparse.urlsplit(host).netloc or host
+    breaker = _host_breakers.get((host_key, policy))
+    if breaker is None:
+        breaker = CircuitBreaker(host_key, policy)
+        _host_breakers[(host_key, policy)] = breaker
+    return breaker
@@ -5,13 +5,20 @@ from ssclient.ports import HttpClientPort
 from ssclient.project import ProjectService
 from ssclient.server.server import ServerService
 from ssclient.sshkey import SshkeyService
-from ssclient.task import TaskService
+from ssclient.task import TaskService, TaskWaiter
 
 
 class SSClient(object):  # noqa: WPS214
     def __init__(self, http_client: HttpClientPort) -> None:
         self._http_client = http_client
 
+    async def __aenter__(self) -> 'SSClient':
+        await self._http_client.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._http_client.close()
+
     def locations(self) -> LocationsService:
         return LocationsService(self._http_client)
 
@@ -30,6 +37,9 @@ class SSClient(object):  # noqa: WPS214
     def tasks(self) -> TaskService:
         return TaskService(self._http_client)
 
+    def task_waiter(self) -> TaskWaiter:
+        return TaskWaiter(self._http_client)
+
     def networks(self) -> NetworkService:
         return NetworkService(self._http_client)
 
@@ -0,0 +1,45 @@
+import json
+from typing import Any, Optional
+
+from ssclient.ports import JSONCodecPort
+
+try:
+    import orjson  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    orjson = None  # noqa: WPS440
+
+
+class StdlibJSONCodec(object):
+    name = 'json'
+
+    def loads(self, raw_data: bytes) -> Any:
+        return json.loads(raw_data)
+
+    def dumps(self, raw_obj: Any) -> bytes:
+        return json.dumps(raw_obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+class OrjsonCodec(object):
+    name = 'orjson'
+
+    def loads(self, raw_data: bytes) -> Any:
+        return orjson.loads(raw_data)
+
+    def dumps(self, raw_obj: Any) -> bytes:
+        return orjson.dumps(raw_obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodecPort:
+    """Get JSON codec by name or the fastest installed one.
+
+    orjson is used when installed, stdlib json otherwise.
+    """
+    if name is None:
+        name = StdlibJSONCodec.name if orjson is None else OrjsonCodec.name
+    if name == OrjsonCodec.name:
+        if orjson is None:
+            raise ValueError('orjson is not installed')
+        return OrjsonCodec()
+    if name == StdlibJSONCodec.name:
+        return StdlibJSONCodec()
+    raise ValueError('unknown JSON codec {name!r}'.format(name=name))
@@ -0,0 +1,113 @@
+import codecs
+import gzip
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import brotli  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    brotli = None  # noqa: WPS440
+
+GZIP = 'gzip'
+DEFLATE = 'deflate'
+BROTLI = 'br'
+IDENTITY = 'identity'
+ACCEPTED_ENCODINGS = (GZIP, DEFLATE) if brotli is None else (GZIP, DEFLATE, BROTLI)
+# gzip wraps deflate stream with its own header and trailer
+_GZIP_WBITS = 16 + zlib.MAX_WBITS  # noqa: WPS432
+_UTF8 = 'utf-8'
+_DECOMPRESSION_ERRORS = (zlib.error,) if brotli is None else (zlib.error, brotli.error)
+
+
+@dataclass(frozen=True)
+class CompressionConfig(object):
+    accept_encoding: bool = True  # ask the API for compressed responses
+    compress_requests: bool = False  # gzip request bodies, e.g. of bulk imports
+    min_request_size: int = 1024  # smaller bodies aren't worth compressing
+    level: int = 6
+
+    @property
+    def accept_encoding_header(self) -> str:
+        if not self.accept_encoding:
+            return IDENTITY
+        return ', '.join(ACCEPTED_ENCODINGS)
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """Get gzipped body or None if the body should be sent as is."""
+        if not self.compress_requests or len(body) < self.min_request_size:
+            return None
+        return gzip.compress(body, self.level)
+
+
+@dataclass
+class ByteCounters(object):
+    # bodies only, headers aren't counted
+    sent: int = 0
+    sent_uncompressed: int = 0
+    received: int = 0
+    received_decoded: int = 0
+
+
+class DecompressionError(ValueError):
+    """Response body can't be decompressed."""
+
+
+class StreamDecompressor(object):
+    """Decompress response body chunk by chunk as it arrives."""
+
+    def __init__(self, encoding: str) -> None:
+        if encoding == BROTLI:
+            self._decompress = brotli.Decompressor().process
+            self._flush = _flush_nothing
+        else:
+            # zlib stream of deflate or gzip one
+            zlib_decompressor = zlib.decompressobj(_GZIP_WBITS if encoding == GZIP else zlib.MAX_WBITS)
+            self._decompress = zlib_decompressor.decompress
+            self._flush = zlib_decompressor.flush
+
+    def decompress(self, chunk: bytes) -> bytes:
+        try:
+            return self._decompress(chunk)
+        except _DECOMPRESSION_ERRORS as exc:
+            raise DecompressionError(str(exc)) from exc
+
+    def flush(self) -> bytes:
+        try:
+            return self._flush()
+        except _DECOMPRESSION_ERRORS as exc:
+            raise DecompressionError(str(exc)) from exc
+
+
+def make_decompressor(content_encoding: Optional[str]) -> Optional[StreamDecompressor]:
+    """Get decompressor of the response body or None if it isn't compressed."""
+    encoding = (content_encoding or IDENTITY).strip().lower()
+    if encoding == IDENTITY:
+        return None
+    if encoding not in ACCEPTED_ENCODINGS:
+        raise DecompressionError('unsupported content encoding {encoding!r}'.format(encoding=encoding))
+    return StreamDecompressor(encoding)
+
+
+class ChunkDecoder(object):
+    """Decompress chunks of the response body and transcode them to UTF-8."""
+
+    def __init__(self, content_encoding: Optional[str], charset: Optional[str] = None) -> None:
+        self._decompressor = make_decompressor(content_encoding)
+        self._transcoder: Optional[codecs.IncrementalDecoder] = None
+        if codecs.lookup(charset or _UTF8).name != _UTF8:
+            # fast codecs take UTF-8 only
+            self._transcoder = codecs.getincrementaldecoder(charset)()
+
+    def decode(self, chunk: bytes, final: bool = False) -> bytes:
+        if self._decompressor is not None:
+            chunk = self._decompressor.decompress(chunk)
+            if final:
+                chunk += self._decompressor.flush()
+        if self._transcoder is not None:
+            chunk = self._transcoder.decode(chunk, final).encode()
+        return chunk
+
+
+def _flush_nothing() -> bytes:
+    return b''
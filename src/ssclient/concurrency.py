@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import AsyncIterator, Deque, Optional
+
+from ssclient import errors
+
+logger = logging.getLogger(__name__)
+
+LATENCY_QUANTILE = 0.95
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency(object):
+    enabled: bool = True
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 64
+    increase: float = 1  # added to the limit per limit-sized window of healthy responses
+    decrease: float = 0.5  # multiplier of the limit on overload
+    latency_window: int = 20  # responses used to estimate p95 latency
+    latency_tolerance: float = 2  # p95 growth over baseline treated as overload
+
+
+class AIMDLimiter(object):  # noqa: WPS214
+    """In-flight requests limit tuned by additive increase and multiplicative decrease."""
+
+    def __init__(self, config: AdaptiveConcurrency) -> None:
+        self.config = config
+        self.limit = float(config.initial_limit)
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+        self._slow_window = False
+        self._latencies: Deque[float] = deque(maxlen=config.latency_window)
+        self._last_decrease: float = 0
+        self._waiters: Deque['asyncio.Future[None]'] = deque()
+
+    @property
+    def window(self) -> int:
+        return int(self.limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if not self.config.enabled:
+            yield
+            return
+
+        await self._acquire()
+        started = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except errors.HttpClientError as exc:
+            overloaded = is_overload_error(exc)
+            raise
+        finally:
+            self._release(started, overloaded)
+
+    async def _acquire(self) -> None:
+        while self.in_flight >= self.window:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # pass the wake-up to the next waiter
+                    self._wake_up()
+                raise
+        self.in_flight += 1
+
+    def _release(self, started: float, overloaded: bool) -> None:
+        self.in_flight -= 1
+        self._record(started, overloaded)
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        free_slots = self.window - self.in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    def _record(self, started: float, overloaded: bool) -> None:
+        if started < self._last_decrease:
+            # request was sent before the last decrease, its outcome is already accounted
+            return
+        if overloaded:
+            self._decrease('overload')
+            return
+
+        self._latencies.append(time.monotonic() - started)
+        if len(self._latencies) == self._latencies.maxlen and self._is_latency_spike():
+            return
+
+        if self.in_flight + 1 >= self.window:
+            # grow only when the current window is actually used
+            self._set_limit(self.limit + self.config.increase / self.limit, 'healthy')
+
+    def _is_latency_spike(self) -> bool:
+        p95 = get_quantile(self._latencies, LATENCY_QUANTILE)
+        self._latencies.clear()
+        if self.baseline_latency is None:
+            self.baseline_latency = p95
+            return False
+        if p95 <= self.baseline_latency * self.config.latency_tolerance:
+            self._slow_window = False
+            self.baseline_latency = 0.9 * self.baseline_latency + 0.1 * p95  # noqa: WPS432
+            return False
+        if self._slow_window:
+            # latency stays high with fewer requests in flight, so it's the new normal of the API
+            logger.debug('p95 latency baseline %.3fs -> %.3fs', self.baseline_latency, p95)
+            self._slow_window = False
+            self.baseline_latency = p95
+            return False
+        self._slow_window = True
+        self._decrease('p95 latency {p95:.3f}s'.format(p95=p95))
+        return True
+
+    def _decrease(self, reason: str) -> None:
+        self._last_decrease = time.monotonic()
+        self._set_limit(self.limit * self.config.decrease, reason)
+
+    def _set_limit(self, limit: float, reason: str) -> None:
+        limit = min(max(limit, self.config.min_limit), self.config.max_limit)
+        old_window = self.window
+        self.limit = limit
+        if self.window != old_window:
+            logger.debug('concurrency window %d -> %d (%s)', old_window, self.window, reason)
+            self._wake_up()
+
+
+def is_overload_error(exc: errors.HttpClientError) -> bool:
+    if isinstance(exc, errors.HttpClientConnectionError):
+        return True
+    if isinstance(exc, errors.HttpClientResponseError):
+        return exc.status == HTTPStatus.TOO_MANY_REQUESTS or exc.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+    return False
+
+
+def get_quantile(latencies: Deque[float], quantile: float) -> float:
+    position = int(len(latencies) * quantile) - 1
+    return sorted(latencies)[max(position, 0)]
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator, Optional
+
+from async_timeout import timeout
+
+from ssclient import errors
+
+# monotonic time all requests and task waits of the current call chain must finish by
+_expires: 'ContextVar[Optional[float]]' = ContextVar('ssclient_deadline', default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Limit the time of all requests and task waits made inside of the block.
+
+    Nested deadline can't extend the outer one. Tasks started inside of the block
+    inherit the deadline.
+    """
+    if seconds is None:
+        yield
+        return
+    expires = time.monotonic() + seconds
+    outer_expires = _expires.get()
+    if outer_expires is not None:
+        expires = min(expires, outer_expires)
+    token = _expires.set(expires)
+    try:
+        yield
+    finally:
+        _expires.reset(token)
+
+
+def get_remaining() -> Optional[float]:
+    """Get seconds left until the current deadline or None without deadline."""
+    expires = _expires.get()
+    if expires is None:
+        return None
+    return max(expires - time.monotonic(), 0)
+
+
+@asynccontextmanager
+async def within_deadline(seconds: Optional[float] = None) -> AsyncIterator[None]:
+    """Cancel the block after its own timeout or the current deadline, whichever is earlier.
+
+    Own timeout raises asyncio.TimeoutError, the deadline raises DeadlineExceededError.
+    """
+    remaining = get_remaining()
+    if remaining is None or (seconds is not None and seconds < remaining):
+        async with timeout(seconds):
+            yield
+        return
+    deadline_timeout = timeout(remaining)
+    try:
+        async with deadline_timeout:
+            yield
+    except asyncio.TimeoutError as exc:
+        if deadline_timeout.expired:
+            raise errors.DeadlineExceededError() from exc
+        raise
@@ -1,4 +1,4 @@
-from typing import ClassVar, List, TypedDict, Union
+from typing import AsyncIterator, ClassVar, List, TypedDict, Union
 
 from ssclient.base import BaseService, TaskIDWrap
 from ssclient.domain.record import RecordService
@@ -30,8 +30,9 @@ class BaseDomainService(BaseService):
                 'migrate_records': migrate_records,
             },
         )
+        self._journal_task(task_wrap, 'domain.create', self.path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'], DOMAIN_CREATION_TIMEOUT)
+            task = await self._wait_task_completion(task_wrap['task_id'], DOMAIN_CREATION_TIMEOUT, kind='domain.create')
             return await self.get(task['domain_id'])
         return task_wrap
 
@@ -44,6 +45,9 @@ class BaseDomainService(BaseService):
         domains_resp = await self._http_client.get(self.path)
         return domains_resp['domains']
 
+    def iter_list(self) -> AsyncIterator[DomainEntity]:
+        return self._http_client.iter_list(self.path, 'domains')
+
     async def delete(self, domain_name: str) -> None:
         path = self._make_path(domain_name)
         await self._http_client.delete(path)
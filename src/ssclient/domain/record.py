@@ -1,4 +1,4 @@
-from typing import ClassVar, List, Optional, Union  # noqa: WPS226
+from typing import AsyncIterator, ClassVar, List, Optional, Union  # noqa: WPS226
 
 from ssclient.base import BaseService, TaskIDWrap
 from ssclient.domain import record_entities as entities
@@ -144,6 +144,9 @@ class RecordService(BaseService):  # noqa: WPS214
         domains_resp = await self._http_client.get(self.path)
         return domains_resp['records']
 
+    def iter_list(self) -> AsyncIterator[entities.AnyRecord]:
+        return self._http_client.iter_list(self.path, 'records')
+
     async def update(  # noqa: WPS211
         self,
         record_id: int,
@@ -196,8 +199,9 @@ class RecordService(BaseService):  # noqa: WPS214
             path=path,
             payload=payload,
         )
+        self._journal_task(task_wrap, 'record.update', path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'])
+            task = await self._wait_task_completion(task_wrap['task_id'], kind='record.update')
             return await self.get(task['record_id'])
         return task_wrap
 
@@ -222,7 +226,8 @@ class RecordService(BaseService):  # noqa: WPS214
                 **other_fields,
             },
         )
+        self._journal_task(task_wrap, 'record.create', self.path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'])
+            task = await self._wait_task_completion(task_wrap['task_id'], kind='record.create')
             return await self.get(task['record_id'])
         return task_wrap
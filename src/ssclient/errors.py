@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Mapping, Optional
 
 
 class HttpClientError(Exception):
@@ -6,13 +6,39 @@ class HttpClientError(Exception):
 
 
 class HttpClientResponseError(HttpClientError):
-    def __init__(self, status: int, message: Any) -> None:
+    def __init__(
+        self, status: int, message: Any, headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
         super().__init__(status, message)
         self.status = status
         self.message = message
+        self.headers = headers or {}
+
+
+class HttpClientConnectionError(HttpClientError):
+    def __init__(self, message: Any, request_sent: bool = True) -> None:
+        super().__init__(message)
+        self.message = message
+        self.request_sent = request_sent
+
+
+class CircuitOpenError(HttpClientError):
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(
+            'requests to {host} are stopped after failures, retry in {retry_after:.0f}s'.format(
+                host=host, retry_after=retry_after,
+            ),
+        )
+        self.host = host
+        self.retry_after = retry_after
 
 
 class TaskFailedError(Exception):
     def __init__(self, task_id: str) -> None:
         super().__init__("task '{task_id}' failed".format(task_id=task_id))
         self.task_id = task_id
+
+
+class DeadlineExceededError(Exception):
+    def __init__(self) -> None:
+        super().__init__('deadline exceeded')
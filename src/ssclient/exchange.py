@@ -0,0 +1,164 @@
+import asyncio
+from contextlib import contextmanager
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple
+
+from aiohttp import ClientResponse, client_exceptions, hdrs
+
+from ssclient import errors
+from ssclient.codec import get_codec
+from ssclient.compression import GZIP, ByteCounters, ChunkDecoder, CompressionConfig, DecompressionError
+from ssclient.jsonstream import JSONListParser
+from ssclient.ports import JSONCodecPort
+from ssclient.tracing import RequestTrace, RequestTracer
+
+EncodedBody = Tuple[Optional[bytes], Dict[str, str]]
+
+_BROKEN_RESPONSE_ERRORS = (
+    client_exceptions.ClientConnectionError,
+    client_exceptions.ClientPayloadError,
+    DecompressionError,
+)
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    headers: Mapping[str, str]
+    body: Any
+
+    @property
+    def is_not_modified(self) -> bool:
+        return self.status == HTTPStatus.NOT_MODIFIED
+
+
+class BodyCodec(object):
+    """Encodes payloads of requests and decodes bodies of responses counting their bytes."""
+
+    def __init__(self, codec: Optional[JSONCodecPort] = None, compression: Optional[CompressionConfig] = None) -> None:
+        self.codec = codec or get_codec()
+        self.compression = compression or CompressionConfig()
+        self.byte_counters = ByteCounters()
+
+    def encode(self, payload: Any, trace: RequestTrace) -> EncodedBody:
+        if payload is None:
+            return None, {}
+        body = self.codec.dumps(payload)
+        headers = {hdrs.CONTENT_TYPE: 'application/json'}
+        self.byte_counters.sent_uncompressed += len(body)
+        compressed_body = self.compression.compress(body)
+        if compressed_body is not None:
+            body = compressed_body
+            headers[hdrs.CONTENT_ENCODING] = GZIP
+        self.byte_counters.sent += len(body)
+        trace.request_size = len(body)
+        return body, headers
+
+    async def read_response(self, resp: ClientResponse, trace: RequestTrace, decompress: bool) -> HttpResponse:
+        if resp.status == HTTPStatus.NOT_MODIFIED:
+            return HttpResponse(resp.status, resp.headers, None)
+        body = await self._receive_body(resp, trace, decompress)
+        try:
+            with trace.phase('decode'):
+                msg = _decode(self.codec, resp, body)
+        except ValueError:
+            # error pages of proxies are not JSON
+            if resp.ok:
+                raise
+            msg = None
+        try:
+            resp.raise_for_status()
+        except client_exceptions.ClientResponseError as exc:
+            if isinstance(msg, dict):
+                err_message = msg.get('errors')
+            else:
+                err_message = msg or exc.message  # noqa: B306
+            raise errors.HttpClientResponseError(
+                exc.status, err_message, resp.headers,  # noqa: B306
+            )
+        return HttpResponse(resp.status, resp.headers, msg)
+
+    async def iter_items(
+        self, resp: ClientResponse, trace: RequestTrace, key: str, decompress: bool,
+    ) -> AsyncIterator[Any]:
+        parser = JSONListParser(key)
+        async for chunk in self._iter_body(resp, trace, decompress):
+            for raw_item in parser.feed(chunk):
+                with trace.phase('decode'):
+                    list_item = self.codec.loads(raw_item)
+                yield list_item
+        parser.close()
+
+    async def _receive_body(self, resp: ClientResponse, trace: RequestTrace, decompress: bool) -> bytes:
+        body, received = await _read_body(resp, decompress)
+        trace.measure('receive', since='response')
+        trace.response_size = len(body)
+        trace.response_body_size = received
+        self.byte_counters.received += received
+        self.byte_counters.received_decoded += len(body)
+        return body
+
+    async def _iter_body(self, resp: ClientResponse, trace: RequestTrace, decompress: bool) -> AsyncIterator[bytes]:
+        """Iterate over decompressed chunks of the body transcoded to UTF-8 as they arrive."""
+        content_encoding = resp.headers.get(hdrs.CONTENT_ENCODING) if decompress else None
+        decoder = ChunkDecoder(content_encoding, resp.charset)
+        async for chunk in resp.content.iter_any():
+            trace.response_body_size += len(chunk)
+            self.byte_counters.received += len(chunk)
+            yield self._count_decoded(decoder.decode(chunk), trace)
+        yield self._count_decoded(decoder.decode(b'', final=True), trace)
+        trace.measure('receive', since='response')
+
+    def _count_decoded(self, chunk: bytes, trace: RequestTrace) -> bytes:
+        trace.response_size += len(chunk)
+        self.byte_counters.received_decoded += len(chunk)
+        return chunk
+
+
+@contextmanager
+def translated_errors(method: str, path: str) -> Iterator[None]:
+    try:
+        yield
+    except client_exceptions.ClientConnectorError as conn_exc:
+        raise errors.HttpClientConnectionError(str(conn_exc), request_sent=False) from conn_exc
+    except _BROKEN_RESPONSE_ERRORS as exc:
+        raise errors.HttpClientConnectionError(str(exc) or repr(exc)) from exc
+    except asyncio.TimeoutError as timeout_exc:
+        raise errors.HttpClientConnectionError(
+            '{method} {path} timed out'.format(method=method, path=path),
+        ) from timeout_exc
+
+
+@contextmanager
+def traced(trace: RequestTrace, tracer: Optional[RequestTracer]) -> Iterator[None]:
+    try:
+        yield
+    except Exception as exc:
+        trace.error = trace.error or repr(exc)
+        raise
+    finally:
+        if tracer is not None:
+            tracer.finish(trace)
+
+
+def _decode(codec: JSONCodecPort, resp: ClientResponse, body: bytes) -> Any:
+    body = body.strip()
+    if not body:
+        return None
+    transcoder = ChunkDecoder(content_encoding=None, charset=resp.get_encoding())
+    return codec.loads(transcoder.decode(body, final=True))
+
+
+async def _read_body(resp: ClientResponse, decompress: bool) -> Tuple[bytes, int]:
+    """Read decompressed body and get it with the count of received bytes."""
+    if not decompress or hdrs.CONTENT_ENCODING not in resp.headers:
+        body = await resp.read()
+        return body, len(body)
+
+    decoder = ChunkDecoder(resp.headers[hdrs.CONTENT_ENCODING])
+    received = 0
+    decompressed = bytearray()
+    async for chunk in resp.content.iter_any():
+        received += len(chunk)
+        decompressed += decoder.decode(chunk)
+    decompressed += decoder.decode(b'', final=True)
+    return bytes(decompressed), received
@@ -0,0 +1,59 @@
+"""Files kept by the client between runs, e.g. cache and task history.
+
+They may hold project data, so they are readable by the owner only.
+"""
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+if sys.platform == 'win32':
+    import msvcrt  # noqa: WPS433
+else:
+    import fcntl  # noqa: WPS433
+
+DIRECTORY_MODE = 0o700
+FILE_MODE = 0o600
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+_APPEND_FLAGS = os.O_RDWR | os.O_CREAT | os.O_APPEND
+
+
+def ensure_directory(directory: Path) -> None:
+    directory.mkdir(mode=DIRECTORY_MODE, parents=True, exist_ok=True)
+
+
+def write_private(path: Path, text: str) -> None:
+    """Replace the file at once, readers never see it half-written."""
+    ensure_directory(path.parent)
+    tmp_path = path.with_suffix('.{pid}.tmp'.format(pid=os.getpid()))
+    with os.fdopen(os.open(tmp_path, _WRITE_FLAGS, FILE_MODE), 'w') as tmp_file:
+        tmp_file.write(text)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def locked_file(path: Path) -> Iterator[IO[str]]:
+    """Open the file for reading and appending while other processes wait for it."""
+    ensure_directory(path.parent)
+    with os.fdopen(os.open(path, _APPEND_FLAGS, FILE_MODE), 'a+') as opened_file:
+        with _locked(opened_file):
+            yield opened_file
+
+
+@contextmanager
+def _locked(opened_file: IO[str]) -> Iterator[None]:
+    if sys.platform == 'win32':
+        opened_file.seek(0)
+        msvcrt.locking(opened_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            opened_file.seek(0)
+            msvcrt.locking(opened_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(opened_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(opened_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,83 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping
+
+import aiohttp
+
+from ssclient.tracing import MS_IN_SECOND, PHASES, RequestTrace
+
+REDACTED_HEADERS = frozenset(('x-api-key',))
+# HAR marks optional phases which didn't happen with -1
+_OPTIONAL_HAR_PHASES = frozenset(PHASES[:3])
+
+
+def make_har_log(traces: List[RequestTrace]) -> Dict[str, Any]:
+    """Get traces as HTTP Archive 1.2 log."""
+    return {
+        'log': {
+            'version': '1.2',
+            'creator': {'name': 'ssclient', 'version': aiohttp.__version__},
+            'entries': [_make_entry(trace) for trace in traces],
+        },
+    }
+
+
+def write_har(traces: List[RequestTrace], har_path: str) -> None:
+    with open(har_path, 'w') as har_file:
+        json.dump(make_har_log(traces), har_file, indent=2)
+
+
+def _make_entry(trace: RequestTrace) -> Dict[str, Any]:
+    return {
+        'startedDateTime': datetime.fromtimestamp(trace.started, timezone.utc).isoformat(),
+        'time': trace.total * MS_IN_SECOND,
+        'request': {
+            'method': trace.method,
+            'url': trace.url,
+            'httpVersion': 'HTTP/1.1',
+            'headers': _make_headers(trace.request_headers),
+            'queryString': [],
+            'cookies': [],
+            'headersSize': -1,
+            'bodySize': trace.request_size,
+        },
+        'response': {
+            'status': trace.status or 0,
+            'statusText': trace.error or '',
+            'httpVersion': 'HTTP/1.1',
+            'headers': _make_headers(trace.response_headers),
+            'cookies': [],
+            'content': {
+                'size': trace.response_size,
+                'compression': trace.response_size - trace.response_body_size,
+                'mimeType': trace.response_headers.get('Content-Type', ''),
+            },
+            'redirectURL': '',
+            'headersSize': -1,
+            'bodySize': trace.response_body_size,
+        },
+        'cache': {},
+        'timings': _make_timings(trace),
+    }
+
+
+def _make_timings(trace: RequestTrace) -> Dict[str, float]:
+    har_timings: Dict[str, float] = {}
+    for phase in PHASES:
+        duration = trace.timings.get(phase)
+        if duration is None:
+            har_timings[phase] = -1 if phase in _OPTIONAL_HAR_PHASES else 0
+        else:
+            har_timings[phase] = duration * MS_IN_SECOND
+    # TLS handshake is a part of connect, aiohttp doesn't trace it separately
+    har_timings['ssl'] = -1
+    # custom fields of HAR start with underscore
+    har_timings['_decode'] = har_timings.pop('decode')
+    return har_timings
+
+
+def _make_headers(headers: Mapping[str, str]) -> List[Dict[str, str]]:
+    return [
+        {'name': name, 'value': '***' if name.lower() in REDACTED_HEADERS else header_value}
+        for name, header_value in headers.items()
+    ]
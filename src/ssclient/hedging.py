@@ -0,0 +1,84 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, List, Optional, TypeVar
+
+from ssclient.concurrency import get_quantile
+
+T = TypeVar('T')  # noqa: WPS111
+
+
+@dataclass(frozen=True)
+class HedgingPolicy(object):
+    enabled: bool = False
+    latency_quantile: float = 0.9  # latency after which the request is hedged
+    latency_window: int = 100  # recent latencies the quantile is estimated over
+    min_samples: int = 20  # requests aren't hedged until latency is known
+    budget_ratio: float = 0.05  # max share of hedged requests among all requests
+
+
+class Hedger(object):
+    """Send a copy of the request which is slower than usual, the first response wins.
+
+    The copy is sent only while hedged requests stay under the budget ratio
+    of all requests, so a slow API doesn't get much more load.
+    """
+
+    def __init__(self, policy: HedgingPolicy) -> None:
+        self.policy = policy
+        self.requests = 0
+        self.hedged = 0
+        self._latencies: Deque[float] = deque(maxlen=policy.latency_window)
+
+    @property
+    def delay(self) -> Optional[float]:
+        if len(self._latencies) < self.policy.min_samples:
+            return None
+        return get_quantile(self._latencies, self.policy.latency_quantile)
+
+    async def call(self, send: Callable[[], Awaitable[T]]) -> T:
+        if not self.policy.enabled:
+            return await send()
+
+        self.requests += 1
+        started = time.monotonic()
+        attempts = [asyncio.ensure_future(send())]
+        try:  # noqa: WPS501
+            response = await self._race(attempts, send)
+        finally:
+            # the slower attempt isn't needed anymore
+            for attempt in attempts:
+                attempt.cancel()
+        self._latencies.append(time.monotonic() - started)
+        return response
+
+    async def _race(self, attempts: List['asyncio.Future[T]'], send: Callable[[], Awaitable[T]]) -> T:
+        await self._hedge(attempts, send)
+        return await _wait_first_success(attempts)
+
+    async def _hedge(self, attempts: List['asyncio.Future[T]'], send: Callable[[], Awaitable[T]]) -> None:
+        delay = self.delay
+        if delay is None:
+            return
+        done, _ = await asyncio.wait(attempts, timeout=delay)
+        if not done and self._withdraw():
+            attempts.append(asyncio.ensure_future(send()))
+
+    def _withdraw(self) -> bool:
+        if self.hedged + 1 > self.policy.budget_ratio * self.requests:
+            return False
+        self.hedged += 1
+        return True
+
+
+async def _wait_first_success(attempts: List['asyncio.Future[T]']) -> T:
+    pending = set(attempts)
+    while True:  # noqa: WPS457
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for attempt in done:
+            if attempt.exception() is None:
+                return attempt.result()
+        # error of one attempt doesn't matter while the other may still succeed
+        if not pending:
+            return done.pop().result()
@@ -1,68 +1,261 @@
-import ssl
-from typing import Any, Dict, Optional
-from urllib import parse as urlparse
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-import aiohttp
-import certifi
-from aiohttp import client_exceptions, hdrs
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, hdrs
 
-from ssclient import errors
+from ssclient.cache import ResponseCache
+from ssclient.exchange import BodyCodec, HttpResponse, traced, translated_errors
+from ssclient.pagination import PagePrefetcher
+from ssclient.pipeline import RequestPipeline
+from ssclient.request_config import RequestConfig, TimeoutConfig
+from ssclient.session import SessionConfig, make_session, prewarm_connection
+from ssclient.tracing import RequestTrace
+
+logger = logging.getLogger(__name__)
 
 
 class HttpClient(object):  # noqa: WPS214
-    def __init__(self, host: str, apikey: Optional[str]) -> None:
+    def __init__(
+        self,
+        host: str,
+        apikey: Optional[str],
+        config: Optional[RequestConfig] = None,
+        session_config: Optional[SessionConfig] = None,
+        session: Optional[ClientSession] = None,
+    ) -> None:
+        config = config or RequestConfig()
         self.host = host
         self.apikey = apikey
         self.user_agent = 's2ctl'
-        self._sslcontext = ssl.create_default_context(cafile=certifi.where())
+        self.pipeline = RequestPipeline(host, apikey, config)
+        self.body_codec = BodyCodec(config.codec, config.compression)
+        self.cache: Optional[ResponseCache] = None
+        if config.cache is not None:
+            self.cache = ResponseCache(
+                config.cache, config.cache_policy, namespace='{host}:{apikey}'.format(host=host, apikey=apikey),
+            )
+        self._timeout = config.timeout
+        self._session_config = session_config or SessionConfig()
+        # a session given from outside is shared with other clients and isn't closed by this one
+        self._session: Optional[ClientSession] = session
+        self._owns_session = session is None
+
+    async def __aenter__(self) -> 'HttpClient':
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def is_opened(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    async def open(self) -> None:
+        """Open long-lived session which keeps connections alive between requests.
+
+        Requests made outside of opened session use short-lived session per request.
+        """
+        if not self.is_opened:
+            self._session = make_session(self._session_config)
+            self._owns_session = True
+
+    async def close(self) -> None:
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+            byte_counters = self.body_codec.byte_counters
+            logger.debug(
+                'session closed: %d requests, %d retries, %d hedged, concurrency window %d, '
+                + 'body bytes sent %d of %d, received %d of %d',
+                self.pipeline.retrier.budget.requests,
+                self.pipeline.retrier.budget.retries,
+                self.pipeline.hedger.hedged,
+                self.pipeline.concurrency.window,
+                byte_counters.sent,
+                byte_counters.sent_uncompressed,
+                byte_counters.received,
+                byte_counters.received_decoded,
+            )
+
+    async def prewarm(self) -> None:
+        """Connect to the API host in advance, so the first request skips DNS, TCP and TLS setup."""
+        await self.open()
+        await prewarm_connection(self._session, self.host, self._session_config.sslcontext)
 
     async def make_request(
-        self, method: str, path: str, payload: Any = None,
+        self, method: str, path: str, payload: Any = None, timeout: Optional[TimeoutConfig] = None,
     ) -> Any:
-        async with aiohttp.ClientSession(connector_owner=True) as sess:
-            request_manager = sess.request(
-                method=method,
-                url=urlparse.urljoin(self.host, path),
-                headers=self.headers,
-                json=payload,
-                ssl=self._sslcontext,
-            )
-            async with request_manager as resp:
-                return await self._process_response(resp)
+        """Make request to the API.
+
+        Timeout of the call replaces the client one. All attempts of the request
+        are limited by the current deadline.
+        """
+        if method == hdrs.METH_GET:
+            # concurrent reads of the same resource share one request
+            get = partial(self._get, path, timeout)
+            return await self.pipeline.single_flight.call((method, path), get)
+        try:  # noqa: WPS501
+            response = await self._make_request(method, path, payload, timeout=timeout)
+        finally:
+            # failed write may still have changed the resource
+            if self.cache is not None:
+                self.cache.invalidate(path)
+        return response.body
+
+    async def get(self, path: str, timeout: Optional[TimeoutConfig] = None) -> Any:
+        return await self.make_request(hdrs.METH_GET, path, timeout=timeout)
 
-    async def get(self, path: str) -> Any:
-        return await self.make_request(hdrs.METH_GET, path)
+    async def post(self, path: str, payload: Any, timeout: Optional[TimeoutConfig] = None) -> Any:
+        return await self.make_request(hdrs.METH_POST, path, payload, timeout)
 
-    async def post(self, path: str, payload: Any) -> Any:
-        return await self.make_request(hdrs.METH_POST, path, payload)
+    async def put(self, path: str, payload: Any, timeout: Optional[TimeoutConfig] = None) -> Any:
+        return await self.make_request(hdrs.METH_PUT, path, payload, timeout)
 
-    async def put(self, path: str, payload: Any) -> Any:
-        return await self.make_request(hdrs.METH_PUT, path, payload)
+    async def patch(self, path: str, payload: Any, timeout: Optional[TimeoutConfig] = None) -> Any:
+        return await self.make_request(hdrs.METH_PATCH, path, payload, timeout)
 
-    async def patch(self, path: str, payload: Any) -> Any:
-        return await self.make_request(hdrs.METH_PATCH, path, payload)
+    async def delete(self, path: str, timeout: Optional[TimeoutConfig] = None) -> Any:
+        return await self.make_request(hdrs.METH_DELETE, path, timeout=timeout)
 
-    async def delete(self, path: str) -> Any:
-        return await self.make_request(hdrs.METH_DELETE, path)
+    async def iter_list(
+        self, path: str, key: str, timeout: Optional[TimeoutConfig] = None,
+    ) -> AsyncIterator[Any]:
+        """Get items of the list under the key of the response object as they arrive.
+
+        Pages linked by "next" relation of Link header are followed, the next page
+        is fetched while items of the current one are consumed. Only opening of the
+        first page is retried, streams are neither cached nor hedged.
+        """
+        pages = PagePrefetcher(self.host, partial(self._make_request, hdrs.METH_GET, timeout=timeout))
+        try:  # noqa: WPS501
+            async for list_item in self._iter_pages(path, key, timeout, pages):
+                yield list_item
+        finally:
+            # consumer may stop before the last page
+            pages.cancel()
 
     @property
     def headers(self) -> Dict[str, str]:
         headers = {
             'User-Agent': self.user_agent,
+            'Accept-Encoding': self.body_codec.compression.accept_encoding_header,
         }
         if self.apikey:
             headers.update({'X-API-KEY': self.apikey})
 
         return headers
 
-    async def _process_response(self, resp: aiohttp.ClientResponse) -> Any:
-        msg = await resp.json(content_type=None)
-        try:
-            resp.raise_for_status()
-        except client_exceptions.ClientResponseError as exc:
-            if isinstance(msg, dict):
-                err_message = msg.get('errors')
-            else:
-                err_message = msg or exc.message  # noqa: B306
-            raise errors.HttpClientResponseError(exc.status, err_message)  # noqa: B306
-        return msg
+    async def _get(self, path: str, timeout: Optional[TimeoutConfig]) -> Any:
+        if self.cache is None:
+            response = await self._make_request(hdrs.METH_GET, path, timeout=timeout)
+            return response.body
+
+        entry = self.cache.lookup(path)
+        if entry is not None and entry.is_fresh:
+            return entry.body
+        response = await self._make_request(
+            hdrs.METH_GET, path, headers=self.cache.get_conditional_headers(entry), timeout=timeout,
+        )
+        if entry is not None and response.is_not_modified:
+            self.cache.refresh(path, response.headers, entry)
+            return entry.body
+        self.cache.store(path, response.headers, response.body)
+        return response.body
+
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[TimeoutConfig] = None,
+    ) -> HttpResponse:
+        client_timeout = (timeout or self._timeout).to_client_timeout()
+        async with self._session_scope() as sess:
+            send = partial(self._send, sess, method, path, payload, headers, client_timeout)
+            return await self.pipeline.call(method, path, send, hedged=method == hdrs.METH_GET)
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[ClientSession]:
+        if self._session is not None:
+            yield self._session
+            return
+        async with make_session(self._session_config) as sess:
+            yield sess
+
+    async def _send(  # noqa: WPS211
+        self,
+        sess: ClientSession,
+        method: str,
+        path: str,
+        payload: Any,
+        headers: Optional[Dict[str, str]],
+        client_timeout: ClientTimeout,
+    ) -> HttpResponse:
+        trace = self.pipeline.make_trace(method, path)
+        body, body_headers = self.body_codec.encode(payload, trace)
+        with translated_errors(method, path):
+            with traced(trace, self._session_config.tracer):
+                async with sess.request(
+                    method=method,
+                    url=trace.url,
+                    headers={**self.headers, **body_headers, **(headers or {})},
+                    data=body,
+                    ssl=self._session_config.sslcontext,
+                    timeout=client_timeout,
+                    trace_request_ctx=trace,
+                ) as resp:
+                    return await self.body_codec.read_response(resp, trace, decompress=not sess.auto_decompress)
+
+    async def _iter_pages(
+        self, path: str, key: str, timeout: Optional[TimeoutConfig], pages: PagePrefetcher,
+    ) -> AsyncIterator[Any]:
+        async for list_item in self._stream_page(path, key, timeout, pages):
+            yield list_item
+        page = await pages.get_next()
+        while page is not None:
+            for page_item in page.body[key]:
+                yield page_item
+            page = await pages.get_next()
+
+    async def _stream_page(
+        self, path: str, key: str, timeout: Optional[TimeoutConfig], pages: PagePrefetcher,
+    ) -> AsyncIterator[Any]:
+        async with self._session_scope() as sess:
+            async with AsyncExitStack() as stack:
+                # slots are held until the headers arrive, the body is read at the pace of its consumer
+                resp, trace = await self.pipeline.call(
+                    hdrs.METH_GET, path, partial(self._open_response, stack, sess, path, timeout),
+                )
+                pages.prefetch(trace.url, resp.headers)
+                async for list_item in self.body_codec.iter_items(resp, trace, key, not sess.auto_decompress):
+                    yield list_item
+
+    async def _open_response(
+        self,
+        stack: AsyncExitStack,
+        sess: ClientSession,
+        path: str,
+        timeout: Optional[TimeoutConfig],
+    ) -> Tuple[ClientResponse, RequestTrace]:
+        """Open response of GET request leaving it in the stack until the body is read."""
+        trace = self.pipeline.make_trace(hdrs.METH_GET, path)
+        async with AsyncExitStack() as attempt_stack:
+            attempt_stack.enter_context(translated_errors(hdrs.METH_GET, path))
+            attempt_stack.enter_context(traced(trace, self._session_config.tracer))
+            resp = await attempt_stack.enter_async_context(sess.request(
+                method=hdrs.METH_GET,
+                url=trace.url,
+                headers=self.headers,
+                ssl=self._session_config.sslcontext,
+                timeout=(timeout or self._timeout).to_client_timeout(),
+                trace_request_ctx=trace,
+            ))
+            if not resp.ok:
+                await self.body_codec.read_response(resp, trace, decompress=not sess.auto_decompress)
+            # contexts of failed attempts exit here, the opened one exits with the stream
+            stack.push_async_exit(attempt_stack.pop_all())
+        return resp, trace
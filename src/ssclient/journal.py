@@ -0,0 +1,120 @@
+import json
+import logging
+import os
+from contextlib import suppress
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, List, NamedTuple, Optional
+
+from ssclient.files import locked_file
+
+COMPLETED = 'Completed'
+FAILED = 'Failed'
+# the task is unknown to the API, e.g. it was created with another key
+NOT_FOUND = 'NotFound'
+
+DEFAULT_MAX_SIZE = 256 * 1024  # noqa: WPS432
+
+logger = logging.getLogger(__name__)
+
+_EVENT_FIELD = 'event'
+_STARTED_EVENT = 'started'
+_FINISHED_EVENT = 'finished'
+
+
+class JournalEntry(NamedTuple):
+    task_id: str
+    operation: str  # task kind, e.g. "server.create"
+    resource: str  # path of the request which started the task
+    started: str
+    context: Optional[str] = None
+
+
+class TaskJournal(object):
+    """Append-only log of started and finished tasks.
+
+    A wait interrupted by a crash or Ctrl-C leaves its task pending in the
+    journal, so it may be resumed later. Without the path nothing is kept.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        context: Optional[str] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        self.path = path
+        self.context = context
+        # size of the file in bytes after which finished tasks are dropped from it
+        self.max_size = max_size
+
+    def record_started(self, task_id: str, operation: str, resource: str) -> None:
+        entry = JournalEntry(task_id, operation, resource, started=_now(), context=self.context)
+        self._append({_EVENT_FIELD: _STARTED_EVENT, **entry._asdict()})
+
+    def record_finished(self, task_id: str, status: str) -> None:
+        self._append({_EVENT_FIELD: _FINISHED_EVENT, 'task_id': task_id, 'status': status, 'finished': _now()})
+
+    def get_pending(self) -> List[JournalEntry]:
+        """Get started tasks which weren't seen finished, the oldest first."""
+        if self.path is None or not self.path.exists():
+            return []
+        with locked_file(self.path) as journal_file:
+            return _replay(journal_file)
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        if self.path is None:
+            return
+        # journal is a convenience, failing to keep it doesn't fail the operation
+        try:
+            with locked_file(self.path) as journal_file:
+                _write_event(journal_file, event)
+                if journal_file.tell() > self.max_size:
+                    _compact(journal_file)
+        except OSError as exc:
+            logger.debug('task journal is not saved to %s: %r', self.path, exc)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _replay(journal_file: IO[str]) -> List[JournalEntry]:
+    journal_file.seek(0)
+    pending: Dict[str, JournalEntry] = {}
+    for line in journal_file.read().splitlines():
+        # the last line of a crashed writer may be cut
+        with suppress(ValueError, KeyError, TypeError):
+            event = json.loads(line)
+            if event[_EVENT_FIELD] == _STARTED_EVENT:
+                entry = JournalEntry(**{field: event[field] for field in JournalEntry._fields})
+                pending[entry.task_id] = entry
+            else:
+                pending.pop(event['task_id'], None)
+    return list(pending.values())
+
+
+def _compact(journal_file: IO[str]) -> None:
+    # appending writers wait for the lock, so nothing is lost between reading and truncating
+    pending = _replay(journal_file)
+    journal_file.truncate(0)
+    for entry in pending:
+        _write_event(journal_file, {_EVENT_FIELD: _STARTED_EVENT, **entry._asdict()})
+
+
+def _write_event(journal_file: IO[str], event: Dict[str, Any]) -> None:
+    # the line cut by a crashed writer is ended, so it doesn't swallow the event
+    end = journal_file.seek(0, os.SEEK_END)
+    if end:
+        journal_file.seek(end - 1)
+        if journal_file.read(1) != '\n':
+            journal_file.write('\n')
+    journal_file.write('{event}\n'.format(event=json.dumps(event)))
+
+
+_task_journal = TaskJournal()
+
+
+def get_task_journal() -> TaskJournal:
+    """Get journal shared by services of all clients, its path and context may be replaced."""
+    return _task_journal
@@ -0,0 +1,118 @@
+import json
+import re
+from typing import List, Optional
+
+_STRUCTURE = re.compile(rb'[\[\]{}",]')
+_STRING_END = re.compile(rb'["\\]')
+_OPENING = frozenset(b'[{')
+_QUOTE = ord('"')
+_BACKSLASH = ord('\\')
+_COMMA = ord(',')
+_OPENING_BRACKET = ord('[')
+_TOP_LEVEL = 1
+
+
+class JSONListParser(object):  # noqa: WPS214, WPS230
+    """Split the list under the key of a JSON object into raw items as its chunks arrive.
+
+    Only the structure is tracked, items are decoded by a codec afterwards.
+    Parsed part of the buffer is dropped, so the memory is bound by the largest item.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = json.dumps(key).encode()
+        self.is_finished = False
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._string_start: Optional[int] = None
+        self._last_string = b''
+        self._list_depth: Optional[int] = None
+        self._item_start = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add the next chunk of the document and get items completed by it."""
+        self._buffer += chunk
+        raw_items: List[bytes] = []
+        has_progress = True
+        while has_progress and not self.is_finished:
+            has_progress = self._step(raw_items)
+        self._drop_parsed()
+        return raw_items
+
+    def close(self) -> None:
+        if not self.is_finished:
+            raise ValueError('list {key} is not found or incomplete'.format(key=self.key.decode()))
+
+    def _step(self, raw_items: List[bytes]) -> bool:
+        if self._string_start is not None:
+            return self._skip_string()
+        match = _STRUCTURE.search(self._buffer, self._pos)
+        if match is None:
+            self._pos = len(self._buffer)
+            return False
+        self._pos = match.end()
+        self._on_structure(match.start(), raw_items)
+        return True
+
+    def _on_structure(self, position: int, raw_items: List[bytes]) -> None:
+        char = self._buffer[position]
+        if char == _QUOTE:
+            self._string_start = self._pos
+        elif char == _COMMA:
+            self._separate(position, raw_items)
+        elif char in _OPENING:
+            self._open(char)
+        else:
+            self._close(position, raw_items)
+
+    def _skip_string(self) -> bool:
+        match = _STRING_END.search(self._buffer, self._pos)
+        if match is None or match.end() == len(self._buffer):
+            # escaped character may be in the next chunk
+            self._pos = len(self._buffer) if match is None else match.start()
+            return False
+        if self._buffer[match.start()] == _BACKSLASH:
+            self._pos = match.end() + 1
+            return True
+        if self._depth == _TOP_LEVEL:
+            # the key is the last string before its value
+            key_start = self._string_start - 1
+            self._last_string = bytes(self._buffer[key_start:match.end()])
+        self._string_start = None
+        self._pos = match.end()
+        return True
+
+    def _open(self, char: int) -> None:
+        self._depth += 1
+        is_top_level_list = self._depth == _TOP_LEVEL + 1 and char == _OPENING_BRACKET
+        if self._list_depth is None and is_top_level_list and self._last_string == self.key:
+            self._list_depth = self._depth
+            self._item_start = self._pos
+
+    def _close(self, position: int, raw_items: List[bytes]) -> None:
+        if self._depth == self._list_depth:
+            self._add_item(position, raw_items)
+            self.is_finished = True
+        self._depth -= 1
+
+    def _separate(self, position: int, raw_items: List[bytes]) -> None:
+        if self._depth == self._list_depth:
+            self._add_item(position, raw_items)
+
+    def _add_item(self, position: int, raw_items: List[bytes]) -> None:
+        raw_item = bytes(self._buffer[self._item_start:position]).strip()
+        if raw_item:
+            raw_items.append(raw_item)
+        self._item_start = position + 1
+
+    def _drop_parsed(self) -> None:
+        if self._list_depth is None or self.is_finished:
+            return
+        # everything before the current item is parsed
+        parsed = self._item_start
+        del self._buffer[:parsed]  # noqa: WPS420
+        self._pos -= parsed
+        self._item_start = 0
+        if self._string_start is not None:
+            self._string_start -= parsed
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+from concurrent import futures
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Set, TypeVar
+
+T = TypeVar('T')  # noqa: WPS111
+Wrapper = Callable[[Awaitable[Any]], Awaitable[Any]]
+Cleanup = Callable[[], Awaitable[None]]
+
+# returned instead of raising StopAsyncIteration, it can't leave a future
+EXHAUSTED: Any = object()
+
+
+class LoopThread(object):  # noqa: WPS214
+    """Event loop running in a background daemon thread.
+
+    Coroutines may be submitted from any thread, so blocking code can share
+    one loop and everything bound to it (sessions, connections, limiters).
+    """
+
+    def __init__(self, name: str = 'ssclient-loop') -> None:
+        self.loop = asyncio.new_event_loop()
+        self._waited: Set['futures.Future[Any]'] = set()
+        self._waited_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run_loop, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def submit(self, coro: Awaitable[T]) -> 'futures.Future[T]':
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)  # type: ignore
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run coroutine in the loop and wait for its result.
+
+        The coroutine is cancelled when waiting is interrupted (e.g. by Ctrl-C).
+        """
+        with self._waited_lock:
+            # the coroutine may start before it's added, interrupt() waits for it
+            future = self.submit(coro)
+            self._waited.add(future)
+        try:
+            return future.result(timeout)
+        except futures.CancelledError:
+            if future in self._waited:
+                raise
+            raise KeyboardInterrupt() from None
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._waited.discard(future)
+
+    def interrupt(self) -> None:
+        """Cancel coroutines waited by run(), the waiting threads get KeyboardInterrupt as on Ctrl-C."""
+        with self._waited_lock:
+            interrupted = list(self._waited)
+            # the waiting thread tells interrupted future from cancelled one by this
+            self._waited.clear()
+        for future in interrupted:
+            future.cancel()
+
+    def iterate(self, stream: AsyncIterator[T], wrapper: Optional[Wrapper] = None) -> Iterator[T]:
+        """Get items of async iterator in the calling thread as they arrive.
+
+        The wrapper gets the coroutine getting every item, e.g. to limit its time.
+        """
+        try:  # noqa: WPS501
+            while True:  # noqa: WPS457
+                next_item = get_next(stream)
+                stream_item = self.run(next_item if wrapper is None else wrapper(next_item))
+                if stream_item is EXHAUSTED:
+                    return
+                yield stream_item
+        finally:
+            # stopped early stream releases its response
+            aclose = getattr(stream, 'aclose', None)
+            if aclose is not None and self.is_running:
+                self.run(aclose())
+
+    def stop(self, cleanup: Optional[Cleanup] = None) -> None:
+        """Cancel pending tasks, run the cleanup in the loop and stop it."""
+        if not self.is_running:
+            return
+        self.submit(self._shutdown(cleanup)).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _shutdown(self, cleanup: Optional[Cleanup]) -> None:
+        current_task = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current_task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if cleanup is not None:
+            await cleanup()
+        await self.loop.shutdown_asyncgens()
+
+
+async def get_next(stream: AsyncIterator[T]) -> T:
+    """Get the next item of the stream or EXHAUSTED after the last one."""
+    try:
+        return await stream.__anext__()
+    except StopAsyncIteration:
+        return EXHAUSTED
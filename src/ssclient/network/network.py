@@ -1,4 +1,4 @@
-from typing import ClassVar, List, TypedDict, Union
+from typing import AsyncIterator, ClassVar, List, TypedDict, Union
 
 from ssclient.base import BaseService, TaskIDWrap
 from ssclient.network.tag import TagService
@@ -40,8 +40,9 @@ class BaseNetworkService(BaseService):
                 'mask': mask,
             },
         )
+        self._journal_task(task_wrap, 'network.create', self.path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'])
+            task = await self._wait_task_completion(task_wrap['task_id'], kind='network.create')
             return await self.get(task['network_id'])
         return task_wrap
 
@@ -54,6 +55,9 @@ class BaseNetworkService(BaseService):
         networks_resp = await self._http_client.get(self.path)
         return networks_resp['isolated_networks']
 
+    def iter_list(self) -> AsyncIterator[NetworkEntity]:
+        return self._http_client.iter_list(self.path, 'isolated_networks')
+
     async def update(
         self,
         network_id: str,
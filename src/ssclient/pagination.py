@@ -0,0 +1,75 @@
+import asyncio
+import logging
+import re
+from typing import Any, Awaitable, Callable, List, Mapping, Optional, Tuple
+from urllib import parse as urlparse
+
+from aiohttp import hdrs
+
+logger = logging.getLogger(__name__)
+
+_NEXT = 'next'
+_LINK = re.compile(r'<(?P<url>[^>]*)>(?P<params>[^,]*)')
+
+# fetches page by URL and gets the response with headers and body
+PageFetcher = Callable[[str], Awaitable[Any]]
+# URL of the page and its fetching
+_PendingPage = Tuple[str, 'asyncio.Future[Any]']
+
+
+class PagePrefetcher(object):
+    """Follows pages linked by "next" relation of Link header.
+
+    The next page is fetched in background while the current one is consumed,
+    so at most one page is kept ahead of the consumer.
+    """
+
+    def __init__(self, host: str, fetch: PageFetcher) -> None:
+        self.host_netloc = urlparse.urlsplit(host).netloc
+        self._fetch = fetch
+        self._next_page: Optional[_PendingPage] = None
+
+    def prefetch(self, url: str, headers: Mapping[str, str]) -> None:
+        """Start fetching the page next to the one got from the URL with the headers."""
+        next_link = get_next_link(headers)
+        if next_link is None:
+            return
+        # relative links are resolved against the page they come from
+        next_url = urlparse.urljoin(url, next_link)
+        if urlparse.urlsplit(next_url).netloc != self.host_netloc:
+            # API key must not be sent to other hosts
+            logger.debug('link to the next page on other host is ignored: %s', next_url)
+            return
+        self._next_page = (next_url, asyncio.ensure_future(self._fetch(next_url)))
+
+    async def get_next(self) -> Optional[Any]:
+        """Get the prefetched page or None after the last one, its next page is prefetched then."""
+        if self._next_page is None:
+            return None
+        url, fetching = self._next_page
+        self._next_page = None
+        page = await fetching
+        self.prefetch(url, page.headers)
+        return page
+
+    def cancel(self) -> None:
+        if self._next_page is not None:
+            self._next_page[1].cancel()
+            self._next_page = None
+
+
+def get_next_link(headers: Mapping[str, str]) -> Optional[str]:
+    """Get URL of the next page from RFC 8288 Link header or None on the last page."""
+    for link in _LINK.finditer(headers.get(hdrs.LINK, '')):
+        if _NEXT in _get_relations(link.group('params')):
+            return link.group('url')
+    return None
+
+
+def _get_relations(link_params: str) -> List[str]:
+    for link_param in link_params.split(';'):
+        name, _, param_value = link_param.partition('=')
+        if name.strip().lower() == 'rel':
+            # a link may have several space separated relations
+            return param_value.strip().strip('"').lower().split()
+    return []
@@ -0,0 +1,54 @@
+from functools import partial
+from typing import Awaitable, Callable, Optional, TypeVar
+from urllib import parse as urlparse
+
+from ssclient.circuitbreaker import CLOSED, get_host_breaker
+from ssclient.concurrency import AIMDLimiter
+from ssclient.deadline import within_deadline
+from ssclient.hedging import Hedger
+from ssclient.ratelimit import get_host_limiter
+from ssclient.request_config import RequestConfig
+from ssclient.retry import Retrier
+from ssclient.singleflight import SingleFlight
+from ssclient.tracing import RequestTrace
+
+T = TypeVar('T')  # noqa: WPS111
+Send = Callable[[], Awaitable[T]]
+
+
+class RequestPipeline(object):
+    """Stages which every request of a client passes before it's sent.
+
+    A request is limited by the current deadline and its failed attempts are
+    retried. Every attempt may be hedged and waits for the circuit, a rate
+    limit token and a concurrency slot.
+    """
+
+    def __init__(self, host: str, apikey: Optional[str], config: RequestConfig) -> None:
+        self.single_flight = SingleFlight()
+        self.retrier = Retrier(config.retry)
+        self.hedger = Hedger(config.hedging)
+        self.circuit_breaker = get_host_breaker(host, config.circuit_breaker)
+        self.rate_limiter = get_host_limiter(host, config.rate_limit, apikey)
+        self.concurrency = AIMDLimiter(config.concurrency)
+        self._host = host
+
+    async def call(self, method: str, path: str, send: Send[T], hedged: bool = False) -> T:
+        attempt = partial(self._paced, send)
+        if hedged:
+            attempt = partial(self.hedger.call, attempt)
+        async with within_deadline():
+            return await self.retrier.call(method, path, attempt)
+
+    def make_trace(self, method: str, path: str) -> RequestTrace:
+        trace = RequestTrace(method, urlparse.urljoin(self._host, path))
+        if self.circuit_breaker.state != CLOSED:
+            trace.notes.append('probe of {state} circuit'.format(state=self.circuit_breaker.state))
+        return trace
+
+    async def _paced(self, send: Send[T]) -> T:
+        # open circuit rejects requests before they take rate limit tokens
+        async with self.circuit_breaker.slot():
+            async with self.rate_limiter.slot():
+                async with self.concurrency.slot():
+                    return await send()
@@ -0,0 +1,108 @@
+import json
+import logging
+import random
+import statistics
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Dict, Iterator, Optional
+
+from ssclient.files import write_private
+
+KindDurations = Dict[str, Deque[float]]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PollingPolicy(object):
+    initial_delay: float = 0.25  # seconds before the first poll of a task of unknown kind
+    multiplier: float = 1.6  # growth of the delay after every poll
+    max_delay: float = 10
+    jitter: float = 0.2  # share of the delay randomized both ways, so waiters don't poll in step
+    expected_ratio: float = 0.8  # the first poll of a known kind is at this share of its typical duration
+
+
+class TaskHistory(object):
+    """Recent completion times of tasks by kind, e.g. "server.create".
+
+    Times are kept in the file if it's given, so the next invocations know them too.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_samples: int = 20) -> None:
+        self.path = path
+        self.max_samples = max_samples
+        self._durations: Optional[KindDurations] = None
+
+    def get_expected(self, kind: str) -> Optional[float]:
+        """Get typical duration of the task kind or None if it wasn't seen yet."""
+        durations = self._load().get(kind)
+        if not durations:
+            return None
+        return statistics.median(durations)
+
+    def record(self, kind: str, duration: float) -> None:
+        durations = self._load()
+        durations.setdefault(kind, deque(maxlen=self.max_samples)).append(duration)
+        if self.path is not None:
+            try:
+                self._write(self.path, durations)
+            except OSError as exc:
+                logger.debug('task history is not saved to %s: %r', self.path, exc)
+
+    def _load(self) -> KindDurations:
+        if self._durations is None:
+            self._durations = {}
+            if self.path is not None:
+                with suppress(OSError, ValueError, TypeError):
+                    self._durations = self._read(self.path)
+        return self._durations
+
+    def _read(self, path: Path) -> KindDurations:
+        with open(path) as history_file:
+            stored = json.load(history_file)
+        return {
+            kind: deque(map(float, durations), maxlen=self.max_samples)
+            for kind, durations in stored.items()
+        }
+
+    def _write(self, path: Path, durations: KindDurations) -> None:
+        stored = {kind: list(kind_durations) for kind, kind_durations in durations.items()}
+        write_private(path, json.dumps(stored))
+
+
+class TaskPoller(object):
+    """Schedule of polls of a task status."""
+
+    def __init__(self, policy: Optional[PollingPolicy] = None, history: Optional[TaskHistory] = None) -> None:
+        self.policy = policy or PollingPolicy()
+        self.history = history or TaskHistory()
+
+    def iter_delays(self, kind: Optional[str] = None) -> Iterator[float]:
+        """Get delays before every poll of the task.
+
+        Task of a known kind is polled first near its typical finish, then
+        polls become rare exponentially up to the max delay.
+        """
+        expected = None if kind is None else self.history.get_expected(kind)
+        delay = self.policy.initial_delay
+        if expected is not None:
+            expected_delay = expected * self.policy.expected_ratio
+            if expected_delay > delay:
+                yield self._jitter(expected_delay)
+        while True:  # noqa: WPS457
+            yield self._jitter(min(delay, self.policy.max_delay))
+            delay *= self.policy.multiplier
+
+    def _jitter(self, delay: float) -> float:
+        spread = delay * self.policy.jitter
+        return random.uniform(delay - spread, delay + spread)  # noqa: S311
+
+
+_task_poller = TaskPoller()
+
+
+def get_task_poller() -> TaskPoller:
+    """Get poller shared by task waiters of all services, its policy and history may be replaced."""
+    return _task_poller
@@ -1,27 +1,71 @@
 from abc import abstractmethod
-from typing import Any, Optional, Protocol
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Protocol
 
+if TYPE_CHECKING:
+    from ssclient.cache import CacheEntry  # noqa: F401
+    from ssclient.request_config import TimeoutConfig  # noqa: F401
 
-class HttpClientPort(Protocol):
+
+class SessionPort(Protocol):
+    @abstractmethod
+    async def open(self) -> None:
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        ...
+
+
+class HttpClientPort(SessionPort, Protocol):
     def __init__(self, host: str, apikey: Optional[str]) -> None:
         ...
 
     @abstractmethod
-    async def get(self, path: str) -> Any:
+    async def get(self, path: str, timeout: Optional['TimeoutConfig'] = None) -> Any:
+        ...
+
+    @abstractmethod
+    async def post(self, path: str, payload: Any, timeout: Optional['TimeoutConfig'] = None) -> Any:
+        ...
+
+    @abstractmethod
+    async def put(self, path: str, payload: Any, timeout: Optional['TimeoutConfig'] = None) -> Any:
         ...
 
     @abstractmethod
-    async def post(self, path: str, payload: Any) -> Any:
+    async def patch(self, path: str, payload: Any, timeout: Optional['TimeoutConfig'] = None) -> Any:
         ...
 
     @abstractmethod
-    async def put(self, path: str, payload: Any) -> Any:
+    async def delete(self, path: str, timeout: Optional['TimeoutConfig'] = None) -> Any:
         ...
 
     @abstractmethod
-    async def patch(self, path: str, payload: Any) -> Any:
+    def iter_list(self, path: str, key: str, timeout: Optional['TimeoutConfig'] = None) -> AsyncIterator[Any]:
+        ...
+
+
+class CacheBackendPort(Protocol):
+    @abstractmethod
+    def get(self, key: str) -> Optional['CacheEntry']:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: 'CacheEntry') -> None:  # noqa: WPS125
+        ...
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete the entry of the key and of its sub-paths and queries."""
+
+
+class JSONCodecPort(Protocol):
+    name: str
+
+    @abstractmethod
+    def loads(self, raw_data: bytes) -> Any:
         ...
 
     @abstractmethod
-    async def delete(self, path: str) -> Any:
+    def dumps(self, raw_obj: Any) -> bytes:
         ...
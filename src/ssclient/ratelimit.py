@@ -0,0 +1,170 @@
+import asyncio
+import hashlib
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, AsyncIterator, Dict, Optional, Tuple
+from urllib import parse as urlparse
+
+from ssclient.files import locked_file
+
+
+@dataclass(frozen=True)
+class RateLimit(object):
+    rate: Optional[float] = 10  # requests per second, None disables pacing
+    burst: int = 20
+    max_in_flight: Optional[int] = 10
+    # directory of bucket state files shared by processes using the same API key
+    shared_dir: Optional[str] = None
+
+
+class TokenBucket(object):
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._updated = self.clock()
+
+    def reserve(self) -> float:
+        """Take a token and get delay after which it may be spent.
+
+        Tokens may go negative, so waiters are served in order of reservation.
+        """
+        now = self.clock()
+        refilled = (now - self._updated) * self.rate
+        self.tokens = min(self.burst, self.tokens + refilled)
+        self._updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+    def refund(self) -> None:
+        self.tokens = min(self.burst, self.tokens + 1)
+
+    def clock(self) -> float:
+        return time.monotonic()
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if not delay:
+            return
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.refund()
+            raise
+
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket which state is kept in a locked file shared between processes."""
+
+    def __init__(self, rate: float, burst: int, path: Path) -> None:
+        super().__init__(rate, burst)
+        self.path = path
+
+    def reserve(self) -> float:
+        with locked_file(self.path) as state_file:
+            self._load(state_file)
+            delay = super().reserve()
+            self._dump(state_file)
+        return delay
+
+    def refund(self) -> None:
+        with locked_file(self.path) as state_file:
+            self._load(state_file)
+            super().refund()
+            self._dump(state_file)
+
+    def clock(self) -> float:
+        # processes share wall clock only
+        return time.time()
+
+    def _load(self, state_file: IO[str]) -> None:
+        state_file.seek(0)
+        try:
+            state = json.loads(state_file.read())
+        except ValueError:
+            # new or broken state starts with full bucket
+            self.tokens = float(self.burst)
+            self._updated = self.clock()
+        else:
+            self.tokens = state['tokens']
+            self._updated = state['updated']
+
+    def _dump(self, state_file: IO[str]) -> None:
+        state_file.seek(0)
+        state_file.truncate()
+        state_file.write(json.dumps({'tokens': self.tokens, 'updated': self._updated}))
+        state_file.flush()
+
+
+class HostRateLimiter(object):
+    def __init__(self, rate_limit: RateLimit, bucket_key: str = '') -> None:
+        self.rate_limit = rate_limit
+        self.bucket: Optional[TokenBucket] = None
+        if rate_limit.rate and rate_limit.shared_dir:
+            state_path = Path(rate_limit.shared_dir) / 'ratelimit-{key}.json'.format(key=bucket_key)
+            self.bucket = SharedTokenBucket(rate_limit.rate, rate_limit.burst, state_path)
+        elif rate_limit.rate:
+            self.bucket = TokenBucket(rate_limit.rate, rate_limit.burst)
+        self.in_flight = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        semaphore = self._get_semaphore()
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            async with self._paced_slot():
+                yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    @asynccontextmanager
+    async def _paced_slot(self) -> AsyncIterator[None]:
+        if self.bucket is not None:
+            await self.bucket.acquire()
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if not self.rate_limit.max_in_flight:
+            return None
+        # semaphore is bound to the loop it was created in
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.rate_limit.max_in_flight)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+
+_BUCKET_KEY_LENGTH = 16
+_host_limiters: Dict[Tuple[str, RateLimit], HostRateLimiter] = {}
+
+
+def get_host_limiter(
+    host: str, rate_limit: RateLimit, apikey: Optional[str] = None,
+) -> HostRateLimiter:
+    """Get limiter shared by all clients of the API host with the same limits.
+
+    Shared limiters also draw from one budget per API key across processes.
+    """
+    host_key = urlparse.urlsplit(host).netloc or host
+    if rate_limit.shared_dir:
+        host_key = hashlib.sha256(
+            '{host}:{apikey}'.format(host=host_key, apikey=apikey or '').encode(),
+        ).hexdigest()[:_BUCKET_KEY_LENGTH]
+    limiter = _host_limiters.get((host_key, rate_limit))
+    if limiter is None:
+        limiter = HostRateLimiter(rate_limit, host_key)
+        _host_limiters[(host_key, rate_limit)] = limiter
+    return limiter
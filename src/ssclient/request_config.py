@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from aiohttp import ClientTimeout
+
+from ssclient.cache import CachePolicy
+from ssclient.circuitbreaker import CircuitBreakerPolicy
+from ssclient.compression import CompressionConfig
+from ssclient.concurrency import AdaptiveConcurrency
+from ssclient.hedging import HedgingPolicy
+from ssclient.ports import CacheBackendPort, JSONCodecPort
+from ssclient.ratelimit import RateLimit
+from ssclient.retry import RetryPolicy
+
+
+@dataclass(frozen=True)
+class TimeoutConfig(object):
+    # seconds, None disables the timeout
+    connect: Optional[float] = 10
+    sock_read: Optional[float] = 30
+    total: Optional[float] = 60
+
+    def to_client_timeout(self) -> ClientTimeout:
+        return ClientTimeout(total=self.total, connect=self.connect, sock_read=self.sock_read)
+
+
+@dataclass(frozen=True)
+class RequestConfig(object):
+    """How requests of a client are timed, paced, retried, hedged, encoded and cached."""
+
+    timeout: TimeoutConfig = field(default_factory=TimeoutConfig)
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limit: RateLimit = field(default_factory=RateLimit)
+    concurrency: AdaptiveConcurrency = field(default_factory=AdaptiveConcurrency)
+    circuit_breaker: CircuitBreakerPolicy = field(default_factory=CircuitBreakerPolicy)
+    hedging: HedgingPolicy = field(default_factory=HedgingPolicy)
+    compression: CompressionConfig = field(default_factory=CompressionConfig)
+    codec: Optional[JSONCodecPort] = None  # the fastest installed one by default
+    cache: Optional[CacheBackendPort] = None  # responses aren't cached without it
+    cache_policy: CachePolicy = field(default_factory=CachePolicy)
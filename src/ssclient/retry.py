@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Awaitable, Callable, FrozenSet, Optional, TypeVar
+
+from aiohttp import hdrs
+
+from ssclient import errors
+from ssclient.deadline import get_remaining
+
+T = TypeVar('T')  # noqa: WPS111
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset((
+    hdrs.METH_GET,
+    hdrs.METH_HEAD,
+    hdrs.METH_OPTIONS,
+    hdrs.METH_PUT,
+    hdrs.METH_DELETE,
+))
+# the API has not started processing request answering with these statuses
+REJECTED_STATUSES = frozenset((
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+))
+RETRYABLE_STATUSES = frozenset((
+    HTTPStatus.REQUEST_TIMEOUT,
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+))
+
+
+@dataclass(frozen=True)
+class RetryPolicy(object):
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30
+    budget_ratio: float = 0.2
+    budget_min_retries: int = 10
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+
+    def get_delay(self, method: str, exc: errors.HttpClientError, attempt: int) -> Optional[float]:
+        """Get delay before next attempt or None if the error must not be retried.
+
+        Args:
+            method(str): HTTP method of failed request.
+            exc(errors.HttpClientError): error of the failed attempt.
+            attempt(int): number of already made retries.
+        """
+        if not self._is_retryable(method, exc):
+            return None
+
+        backoff = random.uniform(  # noqa: S311
+            0, min(self.backoff_max, self.backoff_base * 2 ** attempt),
+        )
+        if isinstance(exc, errors.HttpClientResponseError):
+            retry_after = parse_retry_after(exc.headers.get(hdrs.RETRY_AFTER))
+            if retry_after is not None:
+                if retry_after > self.backoff_max:
+                    return None
+                return max(retry_after, backoff)
+        return backoff
+
+    def _is_retryable(self, method: str, exc: errors.HttpClientError) -> bool:
+        if isinstance(exc, errors.HttpClientConnectionError):
+            return not exc.request_sent or method in IDEMPOTENT_METHODS
+        if isinstance(exc, errors.HttpClientResponseError):
+            if exc.status not in self.retry_statuses:
+                return False
+            return exc.status in REJECTED_STATUSES or method in IDEMPOTENT_METHODS
+        return False
+
+
+class RetryBudget(object):
+    """Budget of retries shared by all calls of a client.
+
+    Retries are allowed while their count stays under the fixed reserve plus
+    the ratio of all made requests, so an outage can't multiply the load.
+    """
+
+    def __init__(self, ratio: float, min_retries: int) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+
+    def record_request(self) -> None:
+        self.requests += 1
+
+    def withdraw(self) -> bool:
+        if self.retries >= self.min_retries + self.ratio * self.requests:
+            return False
+        self.retries += 1
+        return True
+
+
+class Retrier(object):
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self.budget = RetryBudget(policy.budget_ratio, policy.budget_min_retries)
+
+    async def call(
+        self, method: str, path: str, send: Callable[[], Awaitable[T]],
+    ) -> T:
+        self.budget.record_request()
+        attempt = 0
+        while True:  # noqa: WPS457
+            try:
+                return await send()
+            except errors.HttpClientError as exc:
+                delay = self._get_delay(method, exc, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.debug(
+                    'retry %d/%d of %s %s in %.2fs: %s',
+                    attempt,
+                    self.policy.max_retries,
+                    method,
+                    path,
+                    delay,
+                    exc,
+                )
+                await asyncio.sleep(delay)
+
+    def _get_delay(self, method: str, exc: errors.HttpClientError, attempt: int) -> Optional[float]:
+        if attempt >= self.policy.max_retries:
+            return None
+        delay = self.policy.get_delay(method, exc, attempt)
+        if delay is None or not _is_before_deadline(delay) or not self.budget.withdraw():
+            return None
+        return delay
+
+
+def _is_before_deadline(delay: float) -> bool:
+    # retry which can't finish in time would only replace the error with the deadline one
+    remaining = get_remaining()
+    return remaining is None or delay < remaining
+
+
+def parse_retry_after(header_value: Optional[str]) -> Optional[float]:
+    """Parse Retry-After header given either in seconds or as HTTP-date."""
+    if not header_value:
+        return None
+    try:
+        return max(float(header_value), 0)
+    except ValueError:
+        pass  # noqa: WPS420
+    try:
+        retry_date = parsedate_to_datetime(header_value)
+    except (TypeError, ValueError):
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max((retry_date - datetime.now(timezone.utc)).total_seconds(), 0)
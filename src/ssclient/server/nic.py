@@ -1,4 +1,4 @@
-from typing import ClassVar, List, Optional, TypedDict, Union
+from typing import AsyncIterator, ClassVar, List, Optional, TypedDict, Union
 
 from ssclient.base import BaseService, TaskIDWrap
 from ssclient.ports import HttpClientPort
@@ -29,8 +29,9 @@ class NicService(BaseService):
                 'bandwidth_mbps': bandwidth,
             },
         )
+        self._journal_task(task_wrap, 'nic.create', self.path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'])
+            task = await self._wait_task_completion(task_wrap['task_id'], kind='nic.create')
             return await self.get(task['nic_id'])
 
         return task_wrap
@@ -44,6 +45,9 @@ class NicService(BaseService):
         nics_resp = await self._http_client.get(self.path)
         return nics_resp['nics']
 
+    def iter_list(self) -> AsyncIterator[NicEntity]:
+        return self._http_client.iter_list(self.path, 'nics')
+
     async def delete(self, nic_id: int, wait: bool = False) -> None:
         path = self._make_path(str(nic_id))
         await self._http_client.delete(path)
@@ -16,9 +16,10 @@ class ServerPowerService(BaseService):
             path=path,
             payload={},
         )
+        self._journal_task(task_wrap, 'server.power_on', path)
         if wait:
             task_id = self._extrac_task_id(task_wrap)
-            await self._wait_task_completion(task_id)
+            await self._wait_task_completion(task_id, kind='server.power_on')
             return None
         return task_wrap
 
@@ -28,9 +29,10 @@ class ServerPowerService(BaseService):
             path=path,
             payload={},
         )
+        self._journal_task(task_wrap, 'server.power_off', path)
         if wait:
             task_id = self._extrac_task_id(task_wrap)
-            await self._wait_task_completion(task_id)
+            await self._wait_task_completion(task_id, kind='server.power_off')
             return None
         return task_wrap
 
@@ -40,9 +42,10 @@ class ServerPowerService(BaseService):
             path=path,
             payload={},
         )
+        self._journal_task(task_wrap, 'server.shutdown', path)
         if wait:
             task_id = self._extrac_task_id(task_wrap)
-            await self._wait_task_completion(task_id)
+            await self._wait_task_completion(task_id, kind='server.shutdown')
             return None
         return task_wrap
 
@@ -52,9 +55,10 @@ class ServerPowerService(BaseService):
             path=path,
             payload={},
         )
+        self._journal_task(task_wrap, 'server.reboot', path)
         if wait:
             task_id = self._extrac_task_id(task_wrap)
-            await self._wait_task_completion(task_id)
+            await self._wait_task_completion(task_id, kind='server.reboot')
             return None
         return task_wrap
 
@@ -64,8 +68,9 @@ class ServerPowerService(BaseService):
             path=path,
             payload={},
         )
+        self._journal_task(task_wrap, 'server.reset', path)
         if wait:
-            await self._wait_task_completion(task_wrap['task_id'])
+            await self._wait_task_completion(task_wrap['task_id'], kind='server.reset')
             return None
         return task_wrap
 
@@ -1,5 +1,5 @@
 from dataclasses import asdict, dataclass
-from typing import Iterable, List, Optional, TypedDict, Union
+from typing import AsyncIterator, Iterable, List, Optional, TypedDict, Union
 
 from ssclient.base import BaseService, TaskIDWrap
 from ssclient.server.nic import NicService
@@ -78,8 +78,9 @@ class BaseServerService(BaseService):
                 'ssh_key_ids': ssh_key_ids,
             },
         )
+        self._journal_task(task_wrap, 'server.create', self.path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'])
+            task = await self._wait_task_completion(task_wrap['task_id'], kind='server.create')
             return await self.get(task['server_id'])
         return task_wrap
 
@@ -93,6 +94,10 @@ class BaseServerService(BaseService):
         servers_resp = await self._http_client.get(self.path)
         return servers_resp['servers']
 
+    def iter_list(self) -> AsyncIterator[ServerEntity]:
+        # items are yielded while the rest of the list is still being received
+        return self._http_client.iter_list(self.path, 'servers')
+
     async def update(
         self,
         server_id: str,
@@ -114,8 +119,9 @@ class BaseServerService(BaseService):
             path=path,
             payload=payload,
         )
+        self._journal_task(task_wrap, 'server.update', path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'])
+            task = await self._wait_task_completion(task_wrap['task_id'], kind='server.update')
             return await self.get(task['server_id'])
         return task_wrap
 
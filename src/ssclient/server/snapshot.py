@@ -1,4 +1,4 @@
-from typing import ClassVar, List, Optional, TypedDict
+from typing import AsyncIterator, ClassVar, List, Optional, TypedDict
 
 from ssclient.base import BaseService, TaskIDWrap
 from ssclient.ports import HttpClientPort
@@ -25,8 +25,9 @@ class SnapshotService(BaseService):
                 'name': name,
             },
         )
+        self._journal_task(task_wrap, 'snapshot.create', self.path)
         if wait:
-            await self._wait_task_completion(task_wrap['task_id'])
+            await self._wait_task_completion(task_wrap['task_id'], kind='snapshot.create')
             return None
         return task_wrap
 
@@ -39,6 +40,9 @@ class SnapshotService(BaseService):
         snaps_resp = await self._http_client.get(self.path)
         return snaps_resp['snapshots']
 
+    def iter_list(self) -> AsyncIterator[SnapshotEntity]:
+        return self._http_client.iter_list(self.path, 'snapshots')
+
     async def delete(self, snapshot_id: int) -> None:
         path = self._make_path(str(snapshot_id))
         await self._http_client.delete(path)
@@ -47,7 +51,8 @@ class SnapshotService(BaseService):
         fragment = '{snap_id}/rollback'.format(snap_id=snapshot_id)
         path = self._make_path(fragment)
         task_wrap: TaskIDWrap = await self._http_client.post(path, {})
+        self._journal_task(task_wrap, 'snapshot.rollback', path)
         if wait:
-            await self._wait_task_completion(task_wrap['task_id'])
+            await self._wait_task_completion(task_wrap['task_id'], kind='snapshot.rollback')
             return None
         return task_wrap
@@ -1,4 +1,4 @@
-from typing import ClassVar, List, TypedDict, Union
+from typing import AsyncIterator, ClassVar, List, TypedDict, Union
 
 from ssclient.base import BaseService, TaskIDWrap
 from ssclient.ports import HttpClientPort
@@ -32,8 +32,9 @@ class VolumeService(BaseService):
                 'size_mb': size_mb,
             },
         )
+        self._journal_task(task_wrap, 'volume.create', self.path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'])
+            task = await self._wait_task_completion(task_wrap['task_id'], kind='volume.create')
             return await self.get(task['volume_id'])
         return task_wrap
 
@@ -46,6 +47,9 @@ class VolumeService(BaseService):
         volumes_resp = await self._http_client.get(self.path)
         return volumes_resp['volumes']
 
+    def iter_list(self) -> AsyncIterator[VolumeEntity]:
+        return self._http_client.iter_list(self.path, 'volumes')
+
     async def update(
         self, volume_id: int, *, size_mb: int, wait: bool = False,
     ) -> Union[TaskIDWrap, VolumeEntity]:
@@ -56,8 +60,9 @@ class VolumeService(BaseService):
                 'size_mb': size_mb,
             },
         )
+        self._journal_task(task_wrap, 'volume.update', path)
         if wait:
-            task = await self._wait_task_completion(task_wrap['task_id'])
+            task = await self._wait_task_completion(task_wrap['task_id'], kind='volume.update')
             return await self.get(task['volume_id'])
         return task_wrap
 
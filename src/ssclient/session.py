@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import ssl
+from dataclasses import dataclass, field
+from typing import Optional
+
+import certifi
+from aiohttp import ClientError, ClientRequest, ClientSession, ClientTimeout, TCPConnector, hdrs
+from yarl import URL
+
+from ssclient.tracing import RequestTracer
+
+logger = logging.getLogger(__name__)
+
+PREWARM_TIMEOUT = 10
+
+
+def create_ssl_context() -> ssl.SSLContext:
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig(object):
+    limit: int = 100
+    limit_per_host: int = 10
+    keepalive_timeout: float = 30
+    ttl_dns_cache: int = 300
+
+
+@dataclass(frozen=True)
+class SessionConfig(object):
+    """How pooled sessions of clients are made.
+
+    Pooled connections are keyed by SSL context too, so clients sharing
+    a session must share the context to reuse connections.
+    """
+
+    pool: ConnectionPoolConfig = field(default_factory=ConnectionPoolConfig)
+    sslcontext: ssl.SSLContext = field(default_factory=create_ssl_context)
+    tracer: Optional[RequestTracer] = None
+
+
+def make_session(session_config: SessionConfig) -> ClientSession:
+    pool_config = session_config.pool
+    connector = TCPConnector(
+        limit=pool_config.limit,
+        limit_per_host=pool_config.limit_per_host,
+        keepalive_timeout=pool_config.keepalive_timeout,
+        ttl_dns_cache=pool_config.ttl_dns_cache,
+        ssl=session_config.sslcontext,
+    )
+    tracer = session_config.tracer
+    return ClientSession(
+        connector=connector,
+        connector_owner=True,
+        # clients decompress by themselves to count received bytes
+        auto_decompress=False,
+        trace_configs=None if tracer is None else [tracer.trace_config],
+    )
+
+
+async def prewarm_connection(session: ClientSession, host: str, sslcontext: ssl.SSLContext) -> None:
+    """Leave a ready keep-alive connection to the host in the session pool.
+
+    Only DNS, TCP and TLS setup is done, nothing is sent to the API.
+    Failures are ignored: the real request will report them.
+    """
+    loop = asyncio.get_event_loop()
+    request = ClientRequest(hdrs.METH_HEAD, URL(host), loop=loop, ssl=sslcontext)
+    try:
+        connection = await session.connector.connect(  # type: ignore
+            request, [], ClientTimeout(connect=PREWARM_TIMEOUT),
+        )
+    except (ClientError, asyncio.TimeoutError, OSError) as exc:
+        logger.debug('prewarming of %s failed: %r', host, exc)
+        return
+    # released connection stays in the pool as an idle one
+    connection.release()
+    logger.debug('connection to %s is prewarmed', host)
@@ -0,0 +1,46 @@
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Flight(object):
+    def __init__(self, task: 'asyncio.Future[Any]') -> None:
+        self.task = task
+        self.followers = 0
+
+
+class SingleFlight(object):
+    """Deduplicates concurrent calls with the same key into one in-flight call.
+
+    Every caller gets its own copy of the result when the call is shared, so
+    callers are free to modify it.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def call(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is not None:
+            flight.followers += 1
+            return copy.deepcopy(await asyncio.shield(flight.task))
+
+        flight = _Flight(asyncio.ensure_future(func()))
+        self._flights[key] = flight
+        try:
+            call_result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            # nobody else waits for the result, so the call is abandoned
+            if not flight.followers:
+                flight.task.cancel()
+            raise
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]  # noqa: WPS420
+        if flight.followers:
+            return copy.deepcopy(call_result)
+        return call_result
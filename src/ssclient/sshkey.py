@@ -1,4 +1,4 @@
-from typing import List, TypedDict
+from typing import AsyncIterator, List, TypedDict
 
 from ssclient.base import BaseService
 
@@ -30,6 +30,9 @@ class SshkeyService(BaseService):
         sshs_resp = await self._http_client.get(self.path)
         return sshs_resp['ssh_keys']
 
+    def iter_list(self) -> AsyncIterator[SshkeyEntity]:
+        return self._http_client.iter_list(self.path, 'ssh_keys')
+
     async def delete(self, sshkey_id: int) -> None:
         path = self._make_path(str(sshkey_id))
         await self._http_client.delete(path)
@@ -0,0 +1,86 @@
+import inspect
+from collections.abc import AsyncIterator
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from ssclient.base import BaseService
+from ssclient.client import SSClient
+from ssclient.http_client import HttpClient
+from ssclient.loop import LoopThread
+from ssclient.task import TaskWaiter
+
+# results of these types are wrapped too, so nested services block as well
+_PROXIED_TYPES = (BaseService, TaskWaiter)
+
+
+class SyncProxy(object):
+    """Blocking view of an async object of the client, e.g. a service.
+
+    Methods run in the loop thread, both coroutine and plain ones, and async
+    iterators are iterated from it, so the proxy may be used from any thread.
+    """
+
+    def __init__(self, target: Any, loop_thread: LoopThread) -> None:
+        self._target = target
+        self._loop_thread = loop_thread
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        return self._make_blocking(attr)
+
+    def __repr__(self) -> str:
+        return 'SyncProxy({target!r})'.format(target=self._target)
+
+    def _make_blocking(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(method)
+        def blocking_method(*args, **kwargs):  # noqa: WPS430
+            method_result = self._loop_thread.run(_call(method, *args, **kwargs))
+            return self._to_sync(method_result)
+
+        return blocking_method
+
+    def _to_sync(self, method_result: Any) -> Any:
+        if isinstance(method_result, AsyncIterator):
+            return self._loop_thread.iterate(method_result)
+        if isinstance(method_result, _PROXIED_TYPES):
+            return SyncProxy(method_result, self._loop_thread)
+        return method_result
+
+
+class SyncSSClient(SyncProxy):
+    """SSClient for blocking code, e.g. scripts and notebooks.
+
+    One background loop keeps the pooled session of the client, so threads
+    sharing the client reuse its connections. Options are the HttpClient ones.
+    """
+
+    def __init__(self, host: str, apikey: Optional[str], **http_client_options) -> None:
+        loop_thread = LoopThread(name='ssclient-sync')
+        # limiters and the session are bound to the loop, so the client is made inside of it
+        self._http_client: HttpClient = loop_thread.run(_open_http_client(host, apikey, http_client_options))
+        super().__init__(SSClient(self._http_client), loop_thread)
+
+    def __enter__(self) -> 'SyncSSClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._loop_thread.stop(self._http_client.close)
+
+
+async def _call(method: Callable[..., Any], *args, **kwargs) -> Any:
+    # plain methods change state the loop uses too, e.g. tasks of TaskWaiter
+    method_result = method(*args, **kwargs)
+    if inspect.isawaitable(method_result):
+        return await method_result
+    return method_result
+
+
+async def _open_http_client(host: str, apikey: Optional[str], http_client_options: Any) -> HttpClient:
+    http_client = HttpClient(host, apikey, **http_client_options)
+    await http_client.open()
+    return http_client
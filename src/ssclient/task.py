@@ -1,4 +1,13 @@
+import asyncio
+import heapq
+import time
+from typing import AsyncIterator, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from ssclient import errors
 from ssclient.base import BaseService, TaskEntity
+from ssclient.polling import TaskPoller, get_task_poller
+from ssclient.ports import HttpClientPort
+from ssclient.ratelimit import TokenBucket
 
 
 class TaskService(BaseService):
@@ -9,5 +18,114 @@ class TaskService(BaseService):
         task_resp = await self._http_client.get(path)
         return task_resp['task']
 
+    async def poll(self, task_id: str) -> Optional[TaskEntity]:
+        """Get the completed task or None if it's still running.
+
+        Raises:
+            TaskFailedError: if the task failed.
+        """
+        return await self._poll_task(task_id)
+
     def _task_path(self, task_id: str):
         return '{path}/{task_id}'.format(path=self.path, task_id=task_id)
+
+
+class TaskOutcome(NamedTuple):
+    task_id: str
+    task: Optional[TaskEntity] = None
+    error: Optional[Exception] = None
+
+
+Poll = 'asyncio.Future[Optional[TaskOutcome]]'
+# due time of the next poll and the task ID
+Schedule = List[Tuple[float, str]]
+
+
+class _PendingTask(NamedTuple):
+    kind: Optional[str]
+    delays: Iterator[float]
+    started: float
+
+
+class TaskWaiter(object):
+    """Waits for many tasks polling them from one loop.
+
+    Polls of all tasks are paced by one token bucket. Outcomes are yielded in
+    order of completion, a failed task doesn't stop waiting for the others.
+    """
+
+    def __init__(
+        self,
+        http_client: HttpClientPort,
+        polls_per_second: float = 5,
+        task_poller: Optional[TaskPoller] = None,
+    ) -> None:
+        self.task_poller = task_poller or get_task_poller()
+        self._task_service = TaskService(http_client)
+        self._bucket = TokenBucket(polls_per_second, burst=max(int(polls_per_second), 1))
+        self._schedule: Schedule = []
+        self._pending: Dict[str, _PendingTask] = {}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, task_id: str, kind: Optional[str] = None) -> None:
+        """Start waiting for the task, it may be added while outcomes are iterated."""
+        if task_id in self._pending:
+            return
+        delays = self.task_poller.iter_delays(kind)
+        self._pending[task_id] = _PendingTask(kind, delays, time.monotonic())
+        self._schedule_poll(task_id)
+
+    async def as_completed(self) -> AsyncIterator[TaskOutcome]:
+        polls: Set[Poll] = set()
+        try:  # noqa: WPS501
+            while self._schedule or polls:
+                self._start_due_polls(polls)
+                for outcome in await _wait_outcomes(polls, self._schedule):
+                    yield outcome
+        finally:
+            # consumer may stop before the last outcome
+            for poll in polls:
+                poll.cancel()
+
+    def _schedule_poll(self, task_id: str) -> None:
+        delay = next(self._pending[task_id].delays)
+        heapq.heappush(self._schedule, (time.monotonic() + delay, task_id))
+
+    def _start_due_polls(self, polls: Set[Poll]) -> None:
+        now = time.monotonic()
+        while self._schedule and self._schedule[0][0] <= now:
+            _, task_id = heapq.heappop(self._schedule)
+            polls.add(asyncio.ensure_future(self._poll(task_id)))
+
+    async def _poll(self, task_id: str) -> Optional[TaskOutcome]:
+        await self._bucket.acquire()
+        try:
+            task = await self._task_service.poll(task_id)
+        except (errors.TaskFailedError, errors.HttpClientError) as exc:
+            self._pending.pop(task_id)
+            return TaskOutcome(task_id, error=exc)
+        if task is None:
+            self._schedule_poll(task_id)
+            return None
+
+        pending_task = self._pending.pop(task_id)
+        if pending_task.kind is not None:
+            self.task_poller.history.record(pending_task.kind, time.monotonic() - pending_task.started)
+        return TaskOutcome(task_id, task)
+
+
+async def _wait_outcomes(polls: Set[Poll], schedule: Schedule) -> List[TaskOutcome]:
+    """Wait until any of the polls is done or the next one is due, done polls are removed."""
+    timeout = None
+    if schedule:
+        timeout = max(schedule[0][0] - time.monotonic(), 0)
+    if not polls:
+        await asyncio.sleep(timeout)  # type: ignore
+        return []
+    done_polls, _ = await asyncio.wait(polls, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    polls -= done_polls
+    outcomes = [done_poll.result() for done_poll in done_polls]
+    return [outcome for outcome in outcomes if outcome is not None]
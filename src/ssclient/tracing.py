@@ -0,0 +1,162 @@
+import time
+import types
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+import aiohttp
+
+# phases of a request in order, durations are kept in seconds
+PHASES = ('blocked', 'dns', 'connect', 'send', 'wait', 'receive', 'decode')  # noqa: WPS226
+MS_IN_SECOND = 1000
+_CONNECTED = 'connected'
+
+TraceListener = Callable[['RequestTrace'], None]
+
+
+@dataclass
+class RequestTrace(object):  # noqa: WPS214
+    method: str
+    url: str
+    started: float = field(default_factory=time.time)
+    status: Optional[int] = None
+    reused_connection: bool = False
+    error: Optional[str] = None
+    request_headers: Dict[str, str] = field(default_factory=dict)
+    response_headers: Dict[str, str] = field(default_factory=dict)
+    # body sizes, response size is the decompressed one
+    request_size: int = 0
+    response_size: int = 0
+    response_body_size: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+    marks: Dict[str, float] = field(default_factory=dict)
+    # notes of other client layers, e.g. circuit breaker state
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        started = self.marks.get('start')
+        if started is None:
+            return sum(self.timings.values())
+        return self.marks.get('end', time.monotonic()) - started
+
+    def mark(self, event: str) -> None:
+        self.marks[event] = time.monotonic()
+
+    def measure(self, phase: str, since: str) -> None:
+        """Add time passed since the marked event to the phase duration."""
+        mark = self.marks.get(since)
+        if mark is not None:
+            elapsed = time.monotonic() - mark
+            self.timings[phase] = self.timings.get(phase, 0) + elapsed
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        self.mark(phase)
+        try:
+            yield
+        finally:
+            self.measure(phase, since=phase)
+
+    def on_start(self, headers: Mapping[str, str]) -> None:
+        self.mark('start')
+        self.request_headers = dict(headers)
+
+    def on_connection_created(self) -> None:
+        # resolving is a part of connection creation, TLS handshake is counted in connect
+        self.measure('connect', since='connect')
+        resolving = self.timings.get('dns', 0)
+        self.timings['connect'] = self.timings.get('connect', 0) - resolving
+        self.mark(_CONNECTED)
+
+    def on_connection_reused(self) -> None:
+        self.reused_connection = True
+        self.mark(_CONNECTED)
+
+    def on_headers_sent(self) -> None:
+        self.measure('send', since=_CONNECTED)
+        self.mark('sent')
+
+    def on_response(self, response: aiohttp.ClientResponse) -> None:
+        # without "headers sent" signal of old aiohttp sending is counted in waiting
+        self.measure('wait', since='sent' if 'sent' in self.marks else _CONNECTED)
+        self.mark('response')
+        self.status = response.status
+        self.response_headers = dict(response.headers)
+
+
+class RequestTracer(object):
+    """Collects timings of requests made by sessions with its trace config.
+
+    Listeners are called with every finished trace, e.g. to print it.
+    """
+
+    def __init__(self, listeners: Optional[List[TraceListener]] = None) -> None:
+        self.listeners = listeners or []
+        self.traces: List[RequestTrace] = []
+        self.trace_config = _make_trace_config()
+
+    def finish(self, trace: RequestTrace) -> None:
+        trace.mark('end')
+        self.traces.append(trace)
+        for listener in self.listeners:
+            listener(trace)
+
+
+def format_trace(trace: RequestTrace) -> str:
+    phases = ' '.join(
+        '{phase} {duration:.1f}ms'.format(phase=phase, duration=trace.timings[phase] * MS_IN_SECOND)
+        for phase in PHASES
+        if phase in trace.timings
+    )
+    line = '{method} {url} {outcome} in {total:.1f}ms: {phases}'.format(
+        method=trace.method,
+        url=trace.url,
+        outcome=trace.status or trace.error,
+        total=trace.total * MS_IN_SECOND,
+        phases=phases or '-',
+    )
+    if trace.response_body_size != trace.response_size:
+        line = '{line}, received {received} of {size} bytes'.format(
+            line=line, received=trace.response_body_size, size=trace.response_size,
+        )
+    if trace.reused_connection:
+        line = '{line} (reused connection)'.format(line=line)
+    for note in trace.notes:
+        line = '{line}\n  {note}'.format(line=line, note=note)
+    return line
+
+
+_SIGNAL_HANDLERS = types.MappingProxyType({
+    'on_request_start': lambda trace, event: trace.on_start(event.headers),
+    'on_connection_queued_start': lambda trace, _: trace.mark('queued'),
+    'on_connection_queued_end': lambda trace, _: trace.measure('blocked', since='queued'),
+    'on_connection_create_start': lambda trace, _: trace.mark('connect'),
+    'on_dns_resolvehost_start': lambda trace, _: trace.mark('dns'),
+    'on_dns_resolvehost_end': lambda trace, _: trace.measure('dns', since='dns'),
+    'on_connection_create_end': lambda trace, _: trace.on_connection_created(),
+    'on_connection_reuseconn': lambda trace, _: trace.on_connection_reused(),
+    # the signal appeared in aiohttp 3.8
+    'on_request_headers_sent': lambda trace, _: trace.on_headers_sent(),
+    'on_request_end': lambda trace, event: trace.on_response(event.response),
+    'on_request_exception': lambda trace, event: setattr(trace, 'error', repr(event.exception)),
+})
+
+
+def _make_trace_config() -> aiohttp.TraceConfig:
+    trace_config = aiohttp.TraceConfig()
+    for signal_name, on_signal in _SIGNAL_HANDLERS.items():
+        signal = getattr(trace_config, signal_name, None)
+        if signal is not None:
+            signal.append(_make_callback(on_signal))
+    return trace_config
+
+
+def _make_callback(on_signal: Callable[[RequestTrace, Any], None]) -> Callable[..., Any]:
+    async def callback(_session, trace_config_ctx, event) -> None:  # noqa: WPS430
+        # sessions are shared, requests of clients without tracer have no trace
+        trace = trace_config_ctx.trace_request_ctx
+        if isinstance(trace, RequestTrace):
+            on_signal(trace, event)
+
+    return callback
@@ -14,6 +14,7 @@ async def _server_handelr(request: Request):
             'headers': dict(request.headers),
             'method': request.method,
             'path': request.path,
+            'peer': list(request.transport.get_extra_info('peername')),
             'payload': await (request.json() if request.has_body else request.text()),
         }
     )
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import stat
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from s2ctl.agent import AgentClient, make_key_id
+from s2ctl.agent_server import KeyAgent
+from s2ctl.config import ConfigManager
+from s2ctl.context import ContextManager
+from s2ctl.entrypoint import entry_point
+from s2ctl.unix_socket import SocketInUseError
+from ssclient.loop import LoopThread
+
+KEY_ID = make_key_id('keyring.cfg', 'keyring-key', 'prod')
+
+
+@pytest.fixture
+def agent_path(tmp_path):
+    socket_path = tmp_path / 'agent.sock'
+    loop_thread = LoopThread(name='test-agent')
+    serving = loop_thread.submit(KeyAgent(socket_path, ttl=0.2).serve())
+    while not socket_path.exists():
+        time.sleep(0.01)
+    yield socket_path
+    serving.cancel()
+    loop_thread.stop()
+
+
+def test_agent_keeps_keys(agent_path):
+    client = AgentClient(agent_path)
+    assert client.get(KEY_ID) is None
+    client.add(KEY_ID, 'apikey')
+    assert client.get(KEY_ID) == 'apikey'
+    # the key isn't given without the keyring key
+    assert client.get(make_key_id('keyring.cfg', 'wrong-key', 'prod')) is None
+    client.remove(KEY_ID)
+    assert client.get(KEY_ID) is None
+
+
+def test_agent_keys_expire(agent_path):
+    client = AgentClient(agent_path)
+    client.add(KEY_ID, 'apikey')
+    time.sleep(0.3)
+    assert client.get(KEY_ID) is None
+
+
+def test_agent_socket_is_private(agent_path):
+    assert stat.S_IMODE(os.stat(agent_path).st_mode) == 0o600
+
+
+async def test_second_agent_fails(agent_path):
+    with pytest.raises(SocketInUseError):
+        await KeyAgent(agent_path).serve()
+
+
+async def test_stale_socket_is_replaced(tmp_path):
+    socket_path = tmp_path / 'agent.sock'
+    socket_path.touch()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(KeyAgent(socket_path).serve(), 0.1)
+    assert not socket_path.exists()
+
+
+def test_missing_agent(tmp_path):
+    assert AgentClient(tmp_path / 'agent.sock').get(KEY_ID) is None
+
+
+def test_context_manager_asks_agent(tmp_path):
+    config_manager = ConfigManager(tmp_path / 'config.yaml')
+    config_manager.save_config({'keyring': 'keyring.cfg', 'contexts': ['prod'], 'current_context': 'prod'})
+    agent = Mock(get=Mock(return_value=None))
+    context_manager = ContextManager(config_manager, 'keyring-key', 'keyring.cfg', agent=agent)
+    context_manager._keyring = Mock(get_password=Mock(return_value='apikey'))
+
+    assert context_manager.get_current_apikey() == 'apikey'
+    agent.add.assert_called_once_with(KEY_ID, 'apikey')
+
+    agent.get.return_value = 'apikey'
+    context_manager._keyring.get_password.reset_mock()
+    assert context_manager.get_current_apikey() == 'apikey'
+    context_manager._keyring.get_password.assert_not_called()
+
+
+async def _serve(self):
+    return None
+
+
+def test_agent_prints_nothing_to_evaluate(tmp_path):
+    socket_path = tmp_path / 'agent.sock'
+    with patch.object(KeyAgent, 'serve', _serve):
+        cli_result = CliRunner(mix_stderr=False).invoke(entry_point, ('agent', '--socket', str(socket_path)))
+    assert cli_result.exit_code == 0
+    # "eval $(s2ctl agent)" would wait for the agent to exit
+    assert not cli_result.stdout
+    assert str(socket_path) in cli_result.stderr
@@ -0,0 +1,164 @@
+import asyncio
+import io
+import logging
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from s2ctl import frames
+from s2ctl.agent import KeyStore
+from s2ctl.daemon import Daemon
+from s2ctl.entrypoint import entry_point
+from s2ctl.runtime import Runtime
+from s2ctl.thin import connect_daemon, relay_command
+from ssclient.server.server import ServerService
+from ssclient.session import ConnectionPoolConfig
+from ssclient.sshkey import SshkeyService
+
+API_HOST = 'https://api.serverspace.by'
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    runtime = Runtime(ConnectionPoolConfig())
+    command_daemon = Daemon(tmp_path / 'daemon.sock', runtime, KeyStore())
+    serving = threading.Thread(target=command_daemon.serve_forever)
+    serving.start()
+    yield command_daemon
+    command_daemon.shutdown()
+    serving.join()
+    command_daemon.server_close()
+    runtime.close()
+
+
+def _run(daemon, *argv, stdin=b''):
+    stdout, stderr = io.BytesIO(), io.BytesIO()
+    with connect_daemon(daemon.socket_path) as daemon_socket:
+        exit_code = relay_command(daemon_socket, list(argv), io.BytesIO(stdin), stdout, stderr)
+    return exit_code, stdout.getvalue().decode(), stderr.getvalue().decode()
+
+
+async def _iter_servers(self):
+    yield {'id': 'l1s1'}
+
+
+def test_commands_share_runtime(daemon):
+    with patch.object(ServerService, 'iter_list', _iter_servers):
+        for _ in range(2):
+            exit_code, stdout, _ = _run(daemon, '-k', '02dadsd', '--host', API_HOST, 'server', 'list')
+            assert exit_code == 0
+            assert 'l1s1' in stdout
+    # the session of the daemon is opened by the first command and kept
+    assert daemon.runtime._session is not None
+    assert not daemon.runtime._session.closed
+
+
+async def _create_sshkey(self, name, public_key):
+    return {'id': 1, 'name': name, 'public_key': public_key}
+
+
+def test_stdin_is_sent_on_demand(daemon):
+    with patch.object(SshkeyService, 'create', _create_sshkey):
+        exit_code, stdout, _ = _run(
+            daemon,
+            '-k', '02dadsd', '--host', API_HOST, 'ssh-key', 'create', '--name', 'k', '--file', '-',
+            stdin=b'ssh-ed25519 AAAA',
+        )
+    assert exit_code == 0
+    assert 'ssh-ed25519 AAAA' in stdout
+
+
+def test_errors_and_exit_code(daemon, tmp_path):
+    exit_code, stdout, stderr = _run(daemon, '-c', str(tmp_path / 'config.yaml'), '-k', 'zz', 'server', 'list')
+    assert exit_code == 2
+    assert not stdout
+    assert 'Wrong apikey format' in stderr
+
+
+def test_client_environment(daemon, tmp_path):
+    with patch.dict(os.environ, {'S2CTL_APIKEY': '02dadsd', 'S2CTL_HOST': API_HOST}):
+        with patch.object(ServerService, 'iter_list', _iter_servers):
+            exit_code, _, _ = _run(daemon, 'server', 'list')
+    assert exit_code == 0
+    # env of the daemon is restored after the command
+    assert 'S2CTL_APIKEY' not in os.environ
+    assert 'S2CTL_HOST' not in os.environ
+
+
+def test_debug_handler_is_removed_after_command(daemon):
+    logger = logging.getLogger('ssclient')
+    handlers = list(logger.handlers)
+    with patch.object(ServerService, 'iter_list', _iter_servers):
+        for _ in range(2):
+            exit_code, _, _ = _run(daemon, '--debug', '-k', '02dadsd', '--host', API_HOST, 'server', 'list')
+            assert exit_code == 0
+    assert logger.handlers == handlers
+    logger.setLevel(logging.NOTSET)
+
+
+class _HangingList(object):
+    def __init__(self):
+        self.started = threading.Event()
+        self.cancelled = threading.Event()
+
+    async def iter_list(self, *args, **kwargs):
+        self.started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        yield {'id': 'l1s1'}  # pragma: no cover
+
+
+def _start_hanging_command(daemon, hanging):
+    daemon_socket = connect_daemon(daemon.socket_path)
+    frames.send_request(daemon_socket, {
+        'argv': ['-k', '02dadsd', '--host', API_HOST, 'server', 'list'],
+        'env': dict(os.environ),
+        'cwd': os.getcwd(),
+    })
+    assert hanging.started.wait(5)
+    return daemon_socket
+
+
+def test_interrupt_cancels_command(daemon):
+    hanging = _HangingList()
+    with patch.object(ServerService, 'iter_list', hanging.iter_list):
+        with _start_hanging_command(daemon, hanging) as daemon_socket:
+            frames.send_frame(daemon_socket, frames.FRAME_INTERRUPT)
+            stderr = b''
+            kind, payload = frames.recv_frame(daemon_socket)
+            while kind != frames.FRAME_EXIT:
+                if kind == frames.FRAME_STDERR:
+                    stderr += payload
+                kind, payload = frames.recv_frame(daemon_socket)
+    assert hanging.cancelled.is_set()
+    assert int(payload) == 1
+    assert b'Aborted' in stderr
+
+
+def test_disconnect_cancels_command(daemon):
+    hanging = _HangingList()
+    with patch.object(ServerService, 'iter_list', hanging.iter_list):
+        _start_hanging_command(daemon, hanging).close()
+        assert hanging.cancelled.wait(5)
+
+
+def test_missing_daemon(tmp_path):
+    assert connect_daemon(tmp_path / 'daemon.sock') is None
+
+
+def test_daemon_prints_nothing_to_evaluate(tmp_path):
+    socket_path = tmp_path / 'daemon.sock'
+    with patch.object(Daemon, 'serve_forever'):
+        cli_result = CliRunner(mix_stderr=False).invoke(
+            entry_point, ('-c', str(tmp_path / 'config.yaml'), 'daemon', '--socket', str(socket_path)),
+        )
+    assert cli_result.exit_code == 0
+    assert not cli_result.stdout
+    assert str(socket_path) in cli_result.stderr
+    assert not socket_path.exists()
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from s2ctl.formatters import JSONFormatter, TableFormatter, YAMLFormatter, general_fields_sort
+
+SERVERS = (
+    {'name': 'first', 'id': 'l1s1', 'nics': [{'ip_address': '10.0.0.1', 'id': 1}]},
+    {'name': 'second ✓', 'id': 'l1s2', 'nics': []},
+)
+FORMATTERS = (JSONFormatter(), YAMLFormatter(), TableFormatter())
+
+
+@pytest.mark.parametrize('formatter', FORMATTERS)
+def test_stream_as_formatted_list(formatter):
+    formatted = formatter.format(list(SERVERS), general_fields_sort)
+    assert ''.join(formatter.format_stream(iter(SERVERS), general_fields_sort)) == formatted
+
+
+@pytest.mark.parametrize('formatter', FORMATTERS)
+def test_empty_stream(formatter):
+    assert not list(formatter.format_stream(iter(())))
+
+
+def test_json_stream_is_incremental():
+    stream = JSONFormatter().format_stream(iter(SERVERS))
+    assert next(stream).startswith('[\n    {')
+    assert next(stream).startswith(',\n    {')
+
+
+def test_json_output_is_kept():
+    # scripts parse "-o json" output, non-ASCII is escaped as it always was
+    formatted = JSONFormatter().format(list(SERVERS))
+    assert formatted == json.dumps(list(SERVERS), indent=4)
+    assert '\\u2713' in formatted
@@ -3,12 +3,13 @@ from unittest.mock import patch
 from click.testing import CliRunner
 
 from s2ctl.entrypoint import entry_point
+from s2ctl.runtime import Runtime
 from ssclient.http_client import HttpClient
 from ssclient.metainfo import LocationEntity
 
 
 def test_get_locations():
-    with patch.object(HttpClient, 'make_request') as make_request:
+    with patch.object(HttpClient, 'make_request') as make_request, patch.object(Runtime, 'prewarm') as prewarm:
         id_ = 'test_id'
         make_request.return_value = {
             'locations': [LocationEntity(
@@ -30,3 +31,5 @@ def test_get_locations():
         assert args[0] == 'GET'
         assert 'locations' in args[1]
         assert result.exit_code == 0
+        # host is known from the given key, there is no keyring unlocking to overlap
+        prewarm.assert_not_called()
@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from s2ctl.entrypoint import entry_point
+from s2ctl.runtime import Runtime
+from s2ctl.taskgroup import TaskGroup
+from ssclient import errors
+from ssclient.network.network import NetworkService
+from ssclient.server.server import ServerService
+from ssclient.session import ConnectionPoolConfig
+
+
+async def test_task_group_results():
+    async with TaskGroup() as task_group:
+        slow = task_group.create_task(asyncio.sleep(0.02, result='slow'))
+        fast = task_group.create_task(asyncio.sleep(0, result='fast'))
+    assert (slow.result(), fast.result()) == ('slow', 'fast')
+
+
+async def test_task_group_failure_cancels_others():
+    async def fail():  # noqa: WPS430
+        await asyncio.sleep(0.01)
+        raise ValueError('fail')
+
+    with pytest.raises(ValueError):
+        async with TaskGroup() as task_group:
+            sleeping = task_group.create_task(asyncio.sleep(10))
+            task_group.create_task(fail())
+    assert sleeping.cancelled()
+
+
+async def test_task_group_cancelled_with_body():
+    with pytest.raises(KeyError):
+        async with TaskGroup() as task_group:
+            sleeping = task_group.create_task(asyncio.sleep(10))
+            raise KeyError('body')
+    assert sleeping.cancelled()
+
+
+def test_close_cancels_running_requests():
+    runtime = Runtime(ConnectionPoolConfig())
+    session = runtime.open_session()
+    request = runtime.loop_thread.submit(asyncio.sleep(10))
+    runtime.close()
+    assert request.cancelled()
+    assert session.closed
+
+
+def test_iterate_within_deadline():
+    async def stream():  # noqa: WPS430
+        yield 'first'
+        await asyncio.sleep(10)
+        yield 'second'
+
+    runtime = Runtime(ConnectionPoolConfig(), timeout=0.05)
+    iterated = []
+    with pytest.raises(errors.DeadlineExceededError):
+        for stream_item in runtime.iterate(stream()):
+            iterated.append(stream_item)
+    runtime.close()
+    assert iterated == ['first']
+
+
+async def _list_networks(_self):
+    return [{'id': 'isolated'}]
+
+
+async def _list_servers(_self):
+    return [{
+        'tags': ['web'],
+        'nics': [
+            {'id': 1, 'network_id': 'isolated', 'ip_address': '10.0.0.1'},
+            {'id': 2, 'network_id': 'public', 'ip_address': '1.2.3.4'},
+        ],
+    }]
+
+
+def test_async_command_body():
+    with patch.object(NetworkService, 'list', _list_networks), patch.object(ServerService, 'list', _list_servers):
+        result = CliRunner().invoke(entry_point, ('-k', '02dadsd', 'ansible', 'get-inventory'))
+    assert result.exit_code == 0
+    assert yaml.safe_load(result.output) == {'all': {'children': {'web': {'hosts': {'1.2.3.4': {}}}}}}
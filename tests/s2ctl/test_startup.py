@@ -0,0 +1,122 @@
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from s2ctl.completion import is_completion_requested
+from s2ctl.config import ConfigManager
+from s2ctl.context import ContextManager
+from s2ctl.entrypoint import entry_point
+from s2ctl.runtime import Runtime
+from ssclient.server.server import ServerService
+
+# generous for slow CI machines, cold start with eager imports took several times more
+STARTUP_BUDGET = 2
+API_HOST = 'https://api.example.com'
+HEAVY_MODULES = ('aiohttp', 'click_completion', 'keyrings', 'tabulate', 's2ctl.factory')
+_RUN_CLI = """
+import json, sys
+from s2ctl.entrypoint import entry_point
+exit_code = entry_point(sys.argv[1:], prog_name='s2ctl', standalone_mode=False)
+print(json.dumps({'exit_code': exit_code, 'modules': sorted(sys.modules)}))
+"""
+
+
+@pytest.mark.parametrize('args', [
+    ('--help',),
+    ('server', '--help'),
+    ('context', 'list'),
+])
+def test_startup_imports(tmp_path, args):
+    started = time.monotonic()
+    run_info = _run_cli(tmp_path, args)
+    elapsed = time.monotonic() - started
+
+    assert not run_info['exit_code']
+    assert not set(HEAVY_MODULES) & set(run_info['modules'])
+    assert elapsed < STARTUP_BUDGET
+
+
+def test_apikey_run_is_stateless(tmp_path):
+    run_info = _run_cli(
+        tmp_path, ('server', '--help'), S2CTL_APIKEY='02dadsd', S2CTL_HOST='https://api.serverspace.by',
+    )
+    assert not run_info['exit_code']
+    assert 'yaml' not in run_info['modules']
+    # the config isn't created
+    assert not list(tmp_path.iterdir())
+
+
+def test_config_directory_is_private(tmp_path):
+    assert not _run_cli(tmp_path, ('context', 'list'))['exit_code']
+    config_dir = next(tmp_path.rglob('config.yaml')).parent
+    assert config_dir.stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.parametrize('prog_path, complete_var, requested', [
+    ('/usr/bin/s2ctl', '_S2CTL_COMPLETE', True),
+    ('/usr/bin/s2ctl-thin', '_S2CTL_THIN_COMPLETE', True),
+    ('/usr/bin/s2ctl-thin', '_OTHER_COMPLETE', False),
+])
+def test_completion_requested(prog_path, complete_var, requested):
+    with patch.object(sys, 'argv', [prog_path]), patch.dict(os.environ, {complete_var: 'source'}):
+        assert is_completion_requested() is requested
+
+
+async def _iter_hosts(self):
+    yield {'id': self._http_client.host}
+
+
+def test_apikey_run_skips_config():
+    with patch.object(ConfigManager, 'get_config', side_effect=AssertionError), \
+            patch.object(ServerService, 'iter_list', _iter_hosts):
+        cli_result = CliRunner().invoke(entry_point, ('-k', 'ffdadsd', '--host', API_HOST, 'server', 'list'))
+    assert cli_result.exit_code == 0
+    assert API_HOST in cli_result.output
+
+
+@pytest.mark.parametrize(('config', 'host'), [
+    ({}, 'https://api.serverspace.by'),
+    ({'host': API_HOST}, API_HOST),
+])
+def test_configured_host_wins_over_apikey(tmp_path, config, host):
+    config_manager = ConfigManager(tmp_path / 'config.yaml')
+    config_manager.save_config({'keyring_key': 'keyring-key', **config})
+    with patch.object(ServerService, 'iter_list', _iter_hosts):
+        cli_result = CliRunner().invoke(
+            entry_point, ('-c', str(config_manager.path), '-k', '02dadsd', 'server', 'list'),
+        )
+    assert cli_result.exit_code == 0
+    assert host in cli_result.output
+
+
+def test_context_host_is_prewarmed(tmp_path):
+    config_manager = ConfigManager(tmp_path / 'config.yaml')
+    config_manager.save_config({'keyring_key': 'keyring-key', 'contexts': ['prod'], 'current_context': 'prod'})
+    args = ('-c', str(config_manager.path), 'server', 'list')
+    with patch.object(ContextManager, 'get_current_apikey', return_value='02dadsd'), \
+            patch.object(ServerService, 'iter_list', _iter_hosts), \
+            patch.object(Runtime, 'prewarm') as prewarm:
+        assert not CliRunner().invoke(entry_point, ('--host', API_HOST, *args)).exit_code
+        prewarm.assert_called_once_with(API_HOST)
+        # the host of the context is stored by the first unlocked key
+        assert config_manager.get_config()['context_hosts'] == {'prod': 'https://api.serverspace.by'}
+        prewarm.reset_mock()
+        assert not CliRunner().invoke(entry_point, args).exit_code
+        prewarm.assert_called_once_with('https://api.serverspace.by')
+
+
+def _run_cli(tmp_path, args, **env_vars):
+    env = dict(os.environ, XDG_CONFIG_HOME=str(tmp_path), HOME=str(tmp_path), **env_vars)
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', _RUN_CLI, *args],
+        env=env,
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return json.loads(completed.stdout.decode().splitlines()[-1])
@@ -0,0 +1,67 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from s2ctl.entrypoint import entry_point
+from s2ctl.runtime import Runtime
+from ssclient import errors
+from ssclient.http_client import HttpClient
+from ssclient.journal import TaskJournal
+from ssclient.task import TaskService
+
+API_HOST = 'https://api.serverspace.by'
+
+
+async def _poll(task_id):
+    if task_id == 'failing':
+        raise errors.TaskFailedError(task_id)
+    return {'id': task_id, 'is_completed': 'Completed'}
+
+
+@pytest.mark.parametrize('task_ids, wait_mode, completed, exit_code', [
+    (('first', 'second'), '--all', ['first', 'second'], 0),
+    (('first', 'failing'), '--all', ['first'], -1),
+    (('first', 'failing'), '--any', ['first'], 0),
+    (('failing',), '--any', [], -1),
+])
+def test_wait(task_ids, wait_mode, completed, exit_code):
+    with patch.object(TaskService, 'poll', side_effect=_poll), patch.object(Runtime, 'prewarm'):
+        result = CliRunner(mix_stderr=False).invoke(
+            entry_point, ('-k', '02dadsd', '--host', API_HOST, 'task', 'wait', *task_ids, wait_mode, '-o', 'json'),
+        )
+    assert result.exit_code == exit_code
+    printed = json.loads(result.stdout) if result.stdout else []
+    # jittered polls complete in any order
+    assert sorted(printed_task['id'] for printed_task in printed) == completed
+    if exit_code:
+        assert "task 'failing' failed" in result.stderr
+
+
+async def _get_task(path):
+    task_id = path.rsplit('/', 1)[-1]
+    return {'task': {'id': task_id, 'is_completed': 'Completed'}}
+
+
+def test_resume_pending(tmp_path):
+    task_journal = TaskJournal(tmp_path / 'task_journal.jsonl')
+    for task_id in ('first', 'second'):
+        task_journal.record_started(task_id, 'server.create', 'api/v1/servers')
+    TaskJournal(tmp_path / 'task_journal.jsonl', context='other').record_started(
+        'another', 'server.create', 'api/v1/servers',
+    )
+
+    runner = CliRunner(mix_stderr=False)
+    with patch('s2ctl.client.DEFAULT_CONFIG_DIR', tmp_path), patch.object(Runtime, 'prewarm'):
+        with patch.object(HttpClient, 'get', side_effect=_get_task):
+            resumed = runner.invoke(entry_point, ('-k', '02dadsd', '--host', API_HOST, 'task', 'resume', '-o', 'json'))
+        # no API key is needed to read the journal
+        pending = runner.invoke(
+            entry_point, ('-c', str(tmp_path / 'config.yaml'), 'task', 'pending', '-o', 'json'),
+        )
+
+    assert resumed.exit_code == 0
+    assert sorted(printed_task['id'] for printed_task in json.loads(resumed.stdout)) == ['first', 'second']
+    # tasks of other contexts are polled with their own keys
+    assert [entry['task_id'] for entry in json.loads(pending.stdout)] == ['another']
@@ -0,0 +1,118 @@
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient.cache import CacheEntry, CachePolicy
+from ssclient.cachestore import FileCache, MemoryCache
+from ssclient.http_client import HttpClient
+from ssclient.request_config import RequestConfig
+
+ETAG = '"v1"'
+
+
+@pytest.fixture
+async def cache_server(aiohttp_server):
+    hits = {'full': 0, 'not_modified': 0}
+
+    async def handler(request: Request):  # noqa: WPS430
+        if request.method != 'GET':
+            return web.json_response({})
+        if request.headers.get('If-None-Match') == ETAG:
+            hits['not_modified'] += 1
+            return web.Response(status=304, headers={'ETag': ETAG})
+        hits['full'] += 1
+        headers = {'ETag': ETAG} if 'servers' in request.path else {}
+        return web.json_response({'path': request.path}, headers=headers)
+
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handler)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/')), hits
+
+
+def _make_client(root: str, backend) -> HttpClient:
+    policy = CachePolicy(ttl_rules={'api/v1/locations': 60})
+    return HttpClient(root, 'key', config=RequestConfig(cache=backend, cache_policy=policy))
+
+
+async def test_fresh_entry_served_from_cache(cache_server):
+    root, hits = cache_server
+    client = _make_client(root, MemoryCache())
+    first_answer = await client.get('api/v1/locations')
+    first_answer['path'] = 'changed'
+    assert await client.get('/api/v1/locations') == {'path': '/api/v1/locations'}
+    assert hits['full'] == 1
+
+
+async def test_revalidation_with_etag(cache_server):
+    root, hits = cache_server
+    client = _make_client(root, MemoryCache())
+    await client.get('api/v1/servers')
+    assert await client.get('api/v1/servers') == {'path': '/api/v1/servers'}
+    assert hits == {'full': 1, 'not_modified': 1}
+
+
+async def test_not_cacheable_response(cache_server):
+    root, hits = cache_server
+    client = _make_client(root, MemoryCache())
+    await client.get('api/v1/project')
+    await client.get('api/v1/project')
+    assert hits['full'] == 2
+
+
+async def test_write_invalidates_collection(cache_server, tmp_path):
+    root, hits = cache_server
+    client = _make_client(root, FileCache(tmp_path))
+    await client.get('api/v1/servers/l1s1')
+    await client.post('api/v1/servers/l1s1/volumes', {})
+    await client.get('api/v1/servers/l1s1')
+    assert hits == {'full': 2, 'not_modified': 0}
+
+
+def test_file_cache_lru_eviction(tmp_path):
+    cache = FileCache(tmp_path, max_bytes=250)
+    for key in ('first', 'second', 'third'):
+        cache.set(key, CacheEntry(body='x' * 50, expires=0))
+        cache.get('first')
+    assert cache.get('first') is not None
+    assert cache.get('second') is None
+    assert cache.get('third') is not None
+
+
+def test_cache_namespaced_by_apikey(tmp_path):
+    backend = FileCache(tmp_path)
+    first = HttpClient('https://api.serverspace.io', 'first', config=RequestConfig(cache=backend))
+    second = HttpClient('https://api.serverspace.io', 'second', config=RequestConfig(cache=backend))
+    first.cache.store('api/v1/images', {}, ['image'])
+    assert first.cache.lookup('api/v1/images').body == ['image']
+    assert second.cache.lookup('api/v1/images') is None
+
+
+def test_file_cache_private(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache = FileCache(cache_dir)
+    cache.set('key', CacheEntry(body={'ssh': 'key'}, expires=0))
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    assert all(entry_path.stat().st_mode & 0o777 == 0o600 for entry_path in cache_dir.iterdir())
+
+
+@pytest.mark.parametrize('path,ttl', [
+    ('api/v1/images', 60),
+    ('api/v1/images/1', 60),
+    ('api/v1/images?limit=5', 60),
+    ('api/v1/imagesfoo', None),
+])
+def test_ttl_rule_matches_path_segments(path, ttl):
+    assert CachePolicy(ttl_rules={'/api/v1/images': 60}).get_ttl(path) == ttl
+
+
+@pytest.mark.parametrize('make_backend', [lambda _: MemoryCache(), FileCache])
+def test_delete_prefix_matches_path_segments(make_backend, tmp_path):
+    backend = make_backend(tmp_path)
+    for key in ('ns:servers/1', 'ns:servers/1/volumes', 'ns:servers/1?limit=5', 'ns:servers/10'):
+        backend.set(key, CacheEntry(body=key, expires=0))
+    backend.delete_prefix('ns:servers/1')
+    assert backend.get('ns:servers/10') is not None
+    assert backend.get('ns:servers/1') is None
+    assert backend.get('ns:servers/1/volumes') is None
+    assert backend.get('ns:servers/1?limit=5') is None
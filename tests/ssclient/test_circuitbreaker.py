@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient import errors
+from ssclient.circuitbreaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerPolicy
+from ssclient.http_client import HttpClient
+from ssclient.request_config import RequestConfig
+from ssclient.retry import RetryPolicy
+
+POLICY = CircuitBreakerPolicy(failure_threshold=3, window=4, failure_ratio=0.5, reset_timeout=0.05)
+
+
+async def _call(breaker: CircuitBreaker, exc=None):
+    async with breaker.slot():
+        if exc is not None:
+            raise exc
+
+
+async def _fail(breaker: CircuitBreaker, status=503):
+    with pytest.raises(errors.HttpClientError):
+        await _call(breaker, errors.HttpClientResponseError(status, 'error'))
+
+
+async def test_opened_by_consecutive_failures():
+    breaker = CircuitBreaker('host', POLICY)
+    for _ in range(3):
+        await _fail(breaker)
+    assert breaker.state == OPEN
+    with pytest.raises(errors.CircuitOpenError) as exc_info:
+        await _call(breaker)
+    assert exc_info.value.retry_after > 0
+
+
+async def test_opened_by_failure_ratio():
+    breaker = CircuitBreaker('host', POLICY)
+    await _fail(breaker)
+    await _call(breaker)
+    await _call(breaker)
+    assert breaker.state == CLOSED
+    await _fail(breaker)
+    assert breaker.state == OPEN
+
+
+async def test_client_errors_not_counted():
+    breaker = CircuitBreaker('host', POLICY)
+    for _ in range(5):
+        await _fail(breaker, status=404)
+    assert breaker.state == CLOSED
+
+
+async def test_half_open_probe():
+    breaker = CircuitBreaker('host', POLICY)
+    for _ in range(3):
+        await _fail(breaker)
+    await asyncio.sleep(POLICY.reset_timeout)
+    assert breaker.state == HALF_OPEN
+    await _fail(breaker)
+    assert breaker.state == OPEN
+
+    await asyncio.sleep(POLICY.reset_timeout)
+    probe_started = asyncio.Event()
+    probe_finished = asyncio.Event()
+
+    async def probe():  # noqa: WPS430
+        async with breaker.slot():
+            probe_started.set()
+            await probe_finished.wait()
+
+    probe_task = asyncio.ensure_future(probe())
+    await probe_started.wait()
+    with pytest.raises(errors.CircuitOpenError):
+        await _call(breaker)
+    probe_finished.set()
+    await probe_task
+    assert breaker.state == CLOSED
+
+
+async def test_client_fails_fast(aiohttp_server):
+    requests = []
+
+    async def handler(request: Request):  # noqa: WPS430
+        requests.append(request.path)
+        return web.json_response({'errors': 'unavailable'}, status=500)
+
+    app = web.Application()
+    app.router.add_route('*', '/{any}', handler)
+    server = await aiohttp_server(app)
+    client = HttpClient(
+        str(server.make_url('/')),
+        None,
+        config=RequestConfig(retry=RetryPolicy(max_retries=0), circuit_breaker=POLICY),
+    )
+    for _ in range(3):
+        with pytest.raises(errors.HttpClientResponseError):
+            await client.get('any')
+    with pytest.raises(errors.CircuitOpenError):
+        await client.get('any')
+    assert len(requests) == 3
@@ -0,0 +1,39 @@
+import pytest
+
+from ssclient.codec import OrjsonCodec, StdlibJSONCodec, get_codec
+from ssclient.http_client import HttpClient
+from ssclient.request_config import RequestConfig
+
+SERVER = {
+    'id': 'l1s1',
+    'name': 'сервер',
+    'cpu': 2,
+    'is_power_on': True,
+    'tags': [],
+    'nics': [{'id': 1, 'mask': 24, 'ip_address': '10.0.0.1'}],
+    'price': 1.5,
+    'login': None,
+}
+
+
+@pytest.fixture(params=[StdlibJSONCodec.name, OrjsonCodec.name])
+def codec(request):
+    if request.param == OrjsonCodec.name:
+        pytest.importorskip('orjson')
+    return get_codec(request.param)
+
+
+def test_round_trip(codec):
+    assert codec.loads(codec.dumps(SERVER)) == SERVER
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec('pickle')
+
+
+async def test_client_codec(codec, server_root):
+    client = HttpClient(host=server_root, apikey=None, config=RequestConfig(codec=codec))
+    server_answer = await client.post('post', SERVER)
+    assert server_answer['payload'] == SERVER
+    assert server_answer['headers']['Content-Type'] == 'application/json'
@@ -0,0 +1,111 @@
+import gzip
+import zlib
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient import errors
+from ssclient.compression import CompressionConfig, DecompressionError, make_decompressor
+from ssclient.http_client import HttpClient
+from ssclient.request_config import RequestConfig
+from ssclient.retry import RetryPolicy
+from ssclient.session import SessionConfig
+from ssclient.tracing import RequestTracer, format_trace
+
+LISTING = {'servers': [{'id': 'l1s{index}'.format(index=index), 'state': 'Active'} for index in range(200)]}
+
+
+@pytest.fixture
+async def compressing_server_root(aiohttp_server):
+    async def listing_handler(request: Request):  # noqa: WPS430
+        response = web.json_response(
+            {'accept_encoding': request.headers.get('Accept-Encoding'), **LISTING},
+        )
+        response.enable_compression()
+        return response
+
+    async def echo_handler(request: Request):  # noqa: WPS430
+        return web.json_response({
+            'content_encoding': request.headers.get('Content-Encoding'),
+            'size': request.content_length,
+            'payload': await request.json(),
+        })
+
+    async def broken_handler(request: Request):  # noqa: WPS430
+        return web.Response(body=b'not gzip', headers={'Content-Encoding': 'gzip'})
+
+    app = web.Application()
+    app.router.add_route('GET', '/servers', listing_handler)
+    app.router.add_route('POST', '/echo', echo_handler)
+    app.router.add_route('GET', '/broken', broken_handler)
+    server = await aiohttp_server(app)
+    return str(server.make_url('/'))
+
+
+@pytest.mark.parametrize('encoding,compress', [
+    ('gzip', gzip.compress),
+    ('deflate', zlib.compress),
+])
+def test_stream_decompression(encoding, compress):
+    raw_data = b'{"servers": []}' * 100
+    compressed = compress(raw_data)
+    decompressor = make_decompressor(encoding)
+    chunks = [compressed[index:index + 7] for index in range(0, len(compressed), 7)]
+    decompressed = b''.join(decompressor.decompress(chunk) for chunk in chunks) + decompressor.flush()
+    assert decompressed == raw_data
+
+
+def test_unsupported_encoding():
+    assert make_decompressor(None) is None
+    assert make_decompressor('identity') is None
+    with pytest.raises(DecompressionError):
+        make_decompressor('zstd')
+
+
+async def test_compressed_response(compressing_server_root):
+    tracer = RequestTracer()
+    async with HttpClient(compressing_server_root, None, session_config=SessionConfig(tracer=tracer)) as client:
+        answer = await client.get('servers')
+
+    assert answer['servers'] == LISTING['servers']
+    assert 'gzip' in answer['accept_encoding']
+    counters = client.body_codec.byte_counters
+    assert 0 < counters.received < counters.received_decoded
+    trace = tracer.traces[0]
+    assert trace.response_body_size == counters.received
+    assert 'received {received} of'.format(received=counters.received) in format_trace(trace)
+
+
+async def test_compression_not_accepted(compressing_server_root):
+    config = RequestConfig(compression=CompressionConfig(accept_encoding=False))
+    client = HttpClient(compressing_server_root, None, config=config)
+    answer = await client.get('servers')
+    assert answer['accept_encoding'] == 'identity'
+    assert client.body_codec.byte_counters.received == client.body_codec.byte_counters.received_decoded
+
+
+@pytest.mark.parametrize('compress_requests,expected_encoding', [(True, 'gzip'), (False, None)])
+async def test_request_compression(compressing_server_root, compress_requests, expected_encoding):
+    client = HttpClient(
+        compressing_server_root,
+        None,
+        config=RequestConfig(compression=CompressionConfig(compress_requests=compress_requests)),
+    )
+    answer = await client.post('echo', LISTING)
+    assert answer['payload'] == LISTING
+    assert answer['content_encoding'] == expected_encoding
+    assert answer['size'] == client.body_codec.byte_counters.sent
+
+
+async def test_small_request_not_compressed(compressing_server_root):
+    config = RequestConfig(compression=CompressionConfig(compress_requests=True))
+    client = HttpClient(compressing_server_root, None, config=config)
+    answer = await client.post('echo', {'name': 'small'})
+    assert answer['content_encoding'] is None
+
+
+async def test_broken_compression(compressing_server_root):
+    client = HttpClient(compressing_server_root, None, config=RequestConfig(retry=RetryPolicy(max_retries=0)))
+    with pytest.raises(errors.HttpClientConnectionError):
+        await client.get('broken')
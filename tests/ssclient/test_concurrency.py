@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from ssclient import errors
+from ssclient.concurrency import AdaptiveConcurrency, AIMDLimiter
+
+
+async def _request(limiter: AIMDLimiter, status: int = 200, duration: float = 0):
+    async with limiter.slot():
+        await asyncio.sleep(duration)
+        if status >= 400:
+            raise errors.HttpClientResponseError(status, 'error')
+
+
+async def test_window_limits_in_flight():
+    limiter = AIMDLimiter(AdaptiveConcurrency(initial_limit=2, max_limit=2))
+    max_seen = 0
+
+    async def request():  # noqa: WPS430
+        nonlocal max_seen
+        async with limiter.slot():
+            max_seen = max(max_seen, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(request() for _ in range(8)))
+    assert max_seen == 2
+    assert limiter.in_flight == 0
+
+
+async def test_additive_increase():
+    limiter = AIMDLimiter(AdaptiveConcurrency(initial_limit=2, latency_window=1000))
+    await asyncio.gather(*(_request(limiter, duration=0.001) for _ in range(40)))
+    assert limiter.window > 2
+
+
+async def test_multiplicative_decrease_on_overload():
+    limiter = AIMDLimiter(AdaptiveConcurrency(initial_limit=8))
+    with pytest.raises(errors.HttpClientResponseError):
+        await _request(limiter, status=503)
+    assert limiter.window == 4
+    with pytest.raises(errors.HttpClientResponseError):
+        await _request(limiter, status=404)
+    assert limiter.window == 4
+
+
+async def test_decrease_on_latency_spike():
+    limiter = AIMDLimiter(AdaptiveConcurrency(initial_limit=8, latency_window=2))
+    for _ in range(2):
+        await _request(limiter)
+    assert limiter.baseline_latency is not None
+    for _ in range(2):  # noqa: WPS440
+        await _request(limiter, duration=0.05)
+    assert limiter.window == 4
+
+
+async def test_lasting_latency_is_new_baseline():
+    limiter = AIMDLimiter(AdaptiveConcurrency(initial_limit=8, latency_window=2))
+    for _ in range(2):
+        await _request(limiter)
+    for _ in range(6):  # noqa: WPS440
+        await _request(limiter, duration=0.05)
+    # the decrease didn't help, so the second slow window replaced the baseline
+    assert limiter.window == 4
+    assert limiter.baseline_latency >= 0.05
@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient import errors
+from ssclient.base import BaseService
+from ssclient.deadline import deadline, get_remaining, within_deadline
+from ssclient.http_client import HttpClient
+from ssclient.request_config import RequestConfig, TimeoutConfig
+from ssclient.retry import RetryPolicy
+
+
+@pytest.fixture
+async def slow_server_root(aiohttp_server):
+    async def slow_handler(request: Request):  # noqa: WPS430
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    async def task_handler(request: Request):  # noqa: WPS430
+        return web.json_response({'task': {'id': 'task-1', 'is_completed': 'InProgress'}})
+
+    app = web.Application()
+    app.router.add_route('*', '/slow', slow_handler)
+    app.router.add_route('*', '/api/v1/tasks/{task_id}', task_handler)
+    server = await aiohttp_server(app)
+    return str(server.make_url('/'))
+
+
+def test_nested_deadline_not_extended():
+    assert get_remaining() is None
+    with deadline(1):
+        with deadline(10):
+            assert get_remaining() <= 1
+        with deadline(None):
+            assert get_remaining() <= 1
+    assert get_remaining() is None
+
+
+async def test_own_timeout_differs_from_deadline():
+    with deadline(1):
+        with pytest.raises(asyncio.TimeoutError) as exc_info:
+            async with within_deadline(0.01):
+                await asyncio.sleep(1)
+    assert not isinstance(exc_info.value, errors.DeadlineExceededError)
+
+    with deadline(0.01):
+        with pytest.raises(errors.DeadlineExceededError):
+            async with within_deadline(1):
+                await asyncio.sleep(1)
+
+
+async def test_request_stopped_by_deadline(slow_server_root):
+    client = HttpClient(slow_server_root, None, config=RequestConfig(retry=RetryPolicy(backoff_base=0.01)))
+    with deadline(0.1):
+        with pytest.raises(errors.DeadlineExceededError):
+            await client.get('slow')
+
+
+async def test_retry_not_started_after_deadline(slow_server_root):
+    client = HttpClient(
+        slow_server_root,
+        None,
+        config=RequestConfig(retry=RetryPolicy(backoff_base=10, backoff_max=10), timeout=TimeoutConfig(total=0.05)),
+    )
+    # full jitter may pick a short backoff, the longest one never fits the deadline
+    with patch('ssclient.retry.random.uniform', side_effect=lambda low, high: high):
+        with deadline(0.5):
+            with pytest.raises(errors.HttpClientConnectionError):
+                await client.get('slow')
+    assert client.pipeline.retrier.budget.retries == 0
+
+
+async def test_call_timeout_replaces_client_one(slow_server_root):
+    client = HttpClient(slow_server_root, None, config=RequestConfig(retry=RetryPolicy(max_retries=0)))
+    with pytest.raises(errors.HttpClientConnectionError):
+        await client.get('slow', timeout=TimeoutConfig(total=0.05))
+
+
+async def test_task_wait_stopped_by_deadline(slow_server_root):
+    service = BaseService(HttpClient(slow_server_root, None))
+    with deadline(0.1):
+        with pytest.raises(errors.DeadlineExceededError):
+            await service._wait_task_completion('task-1')
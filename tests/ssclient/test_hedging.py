@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient.hedging import Hedger, HedgingPolicy
+from ssclient.http_client import HttpClient
+from ssclient.request_config import RequestConfig
+
+POLICY = HedgingPolicy(enabled=True, min_samples=3, budget_ratio=1)
+
+
+async def _learn_latency(hedger: Hedger) -> None:
+    async def send():  # noqa: WPS430
+        await asyncio.sleep(0.01)
+
+    for _ in range(hedger.policy.min_samples):
+        await hedger.call(send)
+
+
+def _make_send(*delays):
+    calls = []
+
+    async def send():  # noqa: WPS430
+        attempt = len(calls)
+        calls.append(attempt)
+        await asyncio.sleep(delays[attempt])
+        return attempt
+
+    return send, calls
+
+
+async def test_slow_request_hedged():
+    hedger = Hedger(POLICY)
+    await _learn_latency(hedger)
+    send, calls = _make_send(1, 0)
+    started = time.monotonic()
+    assert await hedger.call(send) == 1
+    assert time.monotonic() - started < 0.5
+    assert hedger.hedged == 1
+
+
+async def test_failed_attempt_waits_for_other():
+    hedger = Hedger(POLICY)
+    await _learn_latency(hedger)
+
+    async def failed_send():  # noqa: WPS430
+        await asyncio.sleep(0.05)
+        raise ValueError('failed')
+
+    async def slow_send():  # noqa: WPS430
+        await asyncio.sleep(0.1)
+        return 'ok'
+
+    attempts = iter((failed_send, slow_send))
+    assert await hedger.call(lambda: next(attempts)()) == 'ok'
+
+
+async def test_hedging_budget():
+    hedger = Hedger(HedgingPolicy(enabled=True, min_samples=3, budget_ratio=0))
+    await _learn_latency(hedger)
+    send, calls = _make_send(0.1, 0)
+    assert await hedger.call(send) == 0
+    assert calls == [0]
+    assert hedger.hedged == 0
+
+
+async def test_disabled_by_default():
+    hedger = Hedger(HedgingPolicy())
+    await _learn_latency(hedger)
+    assert hedger.requests == 0
+    assert hedger.delay is None
+
+
+async def test_client_hedges_get(aiohttp_server):
+    seen = {'slow': 0}
+
+    async def handler(request: Request):  # noqa: WPS430
+        if request.match_info['any'] == 'slow':
+            seen['slow'] += 1
+            if seen['slow'] == 1:
+                await asyncio.sleep(1)
+        return web.json_response({'attempt': seen['slow']})
+
+    app = web.Application()
+    app.router.add_route('*', '/{any}', handler)
+    server = await aiohttp_server(app)
+    async with HttpClient(str(server.make_url('/')), None, config=RequestConfig(hedging=POLICY)) as client:
+        for _ in range(POLICY.min_samples):
+            await client.get('fast')
+        assert await client.get('slow') == {'attempt': 2}
+        await client.post('slow', {})
+    assert client.pipeline.hedger.hedged == 1
+
+
+@pytest.mark.parametrize('budget_ratio,requests,expected', [(0.1, 9, False), (0.1, 10, True)])
+def test_budget_ratio(budget_ratio, requests, expected):
+    hedger = Hedger(HedgingPolicy(enabled=True, budget_ratio=budget_ratio))
+    hedger.requests = requests
+    assert hedger._withdraw() is expected
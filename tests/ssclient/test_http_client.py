@@ -1,7 +1,12 @@
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
 from ssclient import errors
+from ssclient.compression import ACCEPTED_ENCODINGS
 from ssclient.http_client import HttpClient
+from ssclient.session import SessionConfig, make_session, prewarm_connection
 
 TESTS_PAYLOAD = (
     {},
@@ -87,10 +92,51 @@ async def test_request_error(http_client):
         ('test_apikey', {
             'X-API-KEY': 'test_apikey',
             'User-Agent': 's2ctl',
+            'Accept-Encoding': ', '.join(ACCEPTED_ENCODINGS),
         }),
-        (None, {'User-Agent': 's2ctl'}),
+        (None, {'User-Agent': 's2ctl', 'Accept-Encoding': ', '.join(ACCEPTED_ENCODINGS)}),
     ],
 )
 def test_request_headers(apikey, headers):
     client = HttpClient(host='', apikey=apikey)
     assert client.headers == headers
+
+
+async def test_opened_session_reuses_connection(http_client):
+    client: HttpClient = http_client(TEST_APIKEY)
+    async with client:
+        assert client.is_opened
+        first_answer = await client.get('/first')
+        second_answer = await client.get('/second')
+    assert not client.is_opened
+    assert first_answer['peer'] == second_answer['peer']
+
+
+async def test_concurrent_gets_coalesced(http_client):
+    client: HttpClient = http_client(TEST_APIKEY)
+    with patch.object(HttpClient, '_send', wraps=client._send) as send:
+        async with client:
+            answers = await asyncio.gather(*(client.get('/same') for _ in range(5)))
+            await client.get('/other')
+    assert send.call_count == 2
+    assert all(answer == answers[0] for answer in answers)
+    answers[0]['path'] = 'changed'
+    assert answers[1]['path'] == '/same'
+
+
+async def test_prewarmed_connection_reused(server_root):
+    session_config = SessionConfig()
+    session = make_session(session_config)
+    await prewarm_connection(session, server_root, session_config.sslcontext)
+    prewarmed = [
+        proto.transport.get_extra_info('sockname')
+        for conns in session.connector._conns.values()
+        for proto, _ in conns
+    ]
+    client = HttpClient(server_root, TEST_APIKEY, session_config=session_config, session=session)
+    server_answer = await client.get('/first')
+    await client.close()
+    assert client.is_opened
+    await session.close()
+    assert len(prewarmed) == 1
+    assert server_answer['peer'][1] == prewarmed[0][1]
@@ -0,0 +1,102 @@
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient import errors, journal
+from ssclient.http_client import HttpClient
+from ssclient.journal import TaskJournal, get_task_journal
+from ssclient.request_config import RequestConfig
+from ssclient.retry import RetryPolicy
+from ssclient.server.power import ServerPowerService
+
+
+def test_finished_tasks_not_pending(tmp_path):
+    task_journal = TaskJournal(tmp_path / 'journal.jsonl', context='prod')
+    task_journal.record_started('first', 'server.create', 'api/v1/servers')
+    task_journal.record_started('second', 'server.reboot', 'api/v1/servers/s1/power/reboot')
+    task_journal.record_finished('first', journal.COMPLETED)
+
+    pending = TaskJournal(tmp_path / 'journal.jsonl').get_pending()
+    assert [(entry.task_id, entry.operation, entry.context) for entry in pending] == [
+        ('second', 'server.reboot', 'prod'),
+    ]
+
+
+def test_cut_line_ignored(tmp_path):
+    journal_path = tmp_path / 'journal.jsonl'
+    task_journal = TaskJournal(journal_path)
+    task_journal.record_started('first', 'server.create', 'api/v1/servers')
+    with open(journal_path, 'a') as journal_file:
+        journal_file.write('{"event": "finished", "task_')
+    task_journal.record_started('second', 'server.create', 'api/v1/servers')
+    assert [entry.task_id for entry in task_journal.get_pending()] == ['first', 'second']
+
+
+def test_compacted(tmp_path):
+    journal_path = tmp_path / 'journal.jsonl'
+    task_journal = TaskJournal(journal_path, max_size=2048)
+    task_journal.record_started('kept', 'server.create', 'api/v1/servers')
+    for task_number in range(50):
+        task_id = 'task-{number}'.format(number=task_number)
+        task_journal.record_started(task_id, 'server.create', 'api/v1/servers')
+        task_journal.record_finished(task_id, journal.COMPLETED)
+
+    assert journal_path.stat().st_size <= 2048
+    assert [entry.task_id for entry in task_journal.get_pending()] == ['kept']
+
+
+def test_directory_created(tmp_path):
+    journal_path = tmp_path / 's2ctl' / 'journal.jsonl'
+    TaskJournal(journal_path).record_started('first', 'server.create', 'api/v1/servers')
+    assert [entry.task_id for entry in TaskJournal(journal_path).get_pending()] == ['first']
+
+
+def test_nothing_kept_without_path():
+    task_journal = TaskJournal()
+    task_journal.record_started('first', 'server.create', 'api/v1/servers')
+    assert task_journal.get_pending() == []
+
+
+@pytest.fixture
+def task_journal(tmp_path):
+    shared_journal = get_task_journal()
+    shared_journal.path = tmp_path / 'journal.jsonl'
+    yield shared_journal
+    shared_journal.path = None
+
+
+@pytest.fixture
+async def power_root(aiohttp_server):
+    async def power_handler(request: Request):  # noqa: WPS430
+        return web.json_response({'task_id': request.match_info['action']})
+
+    async def task_handler(request: Request):  # noqa: WPS430
+        task_id = request.match_info['task_id']
+        if task_id == 'reset':
+            return web.json_response({'errors': ['not found']}, status=404)
+        status = 'Failed' if task_id == 'reboot' else 'Completed'
+        return web.json_response({'task': {'id': task_id, 'is_completed': status}})
+
+    app = web.Application()
+    app.router.add_route('POST', '/api/v1/servers/s1/power/{action}', power_handler)
+    app.router.add_route('GET', '/api/v1/tasks/{task_id}', task_handler)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/'))
+    await server.close()
+
+
+async def test_service_tasks_journaled(task_journal, power_root):
+    http_client = HttpClient(power_root, None, config=RequestConfig(retry=RetryPolicy(max_retries=0)))
+    power_service = ServerPowerService(http_client, 's1')
+    async with http_client:
+        await power_service.power_on()
+        await power_service.shutdown(wait=True)
+        with pytest.raises(errors.TaskFailedError):
+            await power_service.reboot(wait=True)
+        with pytest.raises(errors.HttpClientResponseError):
+            await power_service.reset(wait=True)
+
+    pending = task_journal.get_pending()
+    assert [(entry.task_id, entry.operation, entry.resource) for entry in pending] == [
+        ('on', 'server.power_on', 'api/v1/servers/s1/power/on'),
+    ]
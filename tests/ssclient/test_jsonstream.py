@@ -0,0 +1,168 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient import errors
+from ssclient.http_client import HttpClient
+from ssclient.jsonstream import JSONListParser
+from ssclient.request_config import RequestConfig
+from ssclient.retry import RetryPolicy
+from ssclient.session import SessionConfig
+from ssclient.tracing import RequestTracer
+
+DOCUMENT = {
+    'meta': {'servers': ['nested key is not the list']},
+    'note': 'string with "servers" inside',
+    'servers': [
+        {'id': 'l1s1', 'name': 'quoted \\"}],[{ and unicode ✓', 'nics': [{'id': 1}, {'id': 2}]},
+        {'id': 'l1s2', 'volumes': [[], {}]},
+        42,
+        'plain',
+        None,
+    ],
+    'total': 5,
+}
+RAW_DOCUMENT = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+SERVERS = [{'id': 'l1s{index}'.format(index=index), 'state': 'Active'} for index in range(100)]
+
+
+def _parse(chunks, key='servers'):
+    parser = JSONListParser(key)
+    raw_items = []
+    for chunk in chunks:
+        raw_items.extend(parser.feed(chunk))
+    parser.close()
+    return [json.loads(raw_item) for raw_item in raw_items]
+
+
+def test_whole_document():
+    assert _parse([RAW_DOCUMENT]) == DOCUMENT['servers']
+
+
+def test_every_split():
+    for split in range(len(RAW_DOCUMENT) + 1):
+        assert _parse([RAW_DOCUMENT[:split], RAW_DOCUMENT[split:]]) == DOCUMENT['servers']
+
+
+def test_byte_by_byte():
+    chunks = [RAW_DOCUMENT[index:index + 1] for index in range(len(RAW_DOCUMENT))]
+    assert _parse(chunks) == DOCUMENT['servers']
+
+
+def test_items_before_end():
+    parser = JSONListParser('servers')
+    raw_items = parser.feed(b'{"servers": [{"id": 1}, {"id": 2}, {"id"')
+    assert [json.loads(raw_item) for raw_item in raw_items] == [{'id': 1}, {'id': 2}]
+    assert not parser.is_finished
+
+
+@pytest.mark.parametrize('document', [b'{"servers": []}', b'{"servers":[ ] }'])
+def test_empty_list(document):
+    assert _parse([document]) == []
+
+
+@pytest.mark.parametrize('document', [
+    b'{"domains": []}',
+    b'{"servers": [{"id": 1}',
+    b'{"meta": {"servers": []}}',
+])
+def test_missing_list(document):
+    with pytest.raises(ValueError):
+        _parse([document])
+
+
+@pytest.fixture
+async def listing_server_root(aiohttp_server):
+    first_item_received = asyncio.Event()
+    calls = {'flaky': 0}
+
+    async def chunked_handler(request: Request):  # noqa: WPS430
+        response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+        if request.query.get('compress'):
+            response.enable_compression()
+        await response.prepare(request)
+        body = json.dumps({'servers': SERVERS}).encode()
+        half = len(body) // 2
+        await response.write(body[:half])
+        if request.query.get('wait'):
+            await asyncio.wait_for(first_item_received.wait(), timeout=5)
+        await response.write(body[half:])
+        await response.write_eof()
+        return response
+
+    async def flaky_handler(request: Request):  # noqa: WPS430
+        calls['flaky'] += 1
+        if calls['flaky'] == 1:
+            return web.json_response({'errors': ['try again']}, status=503)
+        return web.json_response({'servers': SERVERS[:2]})
+
+    async def missing_handler(request: Request):  # noqa: WPS430
+        return web.json_response({'errors': ['not found']}, status=404)
+
+    app = web.Application()
+    app.router.add_route('GET', '/servers', chunked_handler)
+    app.router.add_route('GET', '/flaky', flaky_handler)
+    app.router.add_route('GET', '/missing', missing_handler)
+    server = await aiohttp_server(app)
+    root = str(server.make_url('/'))
+    yield root, first_item_received, calls
+    await server.close()
+
+
+@pytest.mark.parametrize('query', ['', '?compress=1'])
+async def test_iter_list(listing_server_root, query):
+    root, _, _ = listing_server_root
+    tracer = RequestTracer()
+    client = HttpClient(root, None, session_config=SessionConfig(tracer=tracer))
+    servers = [server async for server in client.iter_list('servers{query}'.format(query=query), 'servers')]
+    assert servers == SERVERS
+    trace = tracer.traces[-1]
+    assert trace.status == 200
+    assert trace.response_size == len(json.dumps({'servers': SERVERS}))
+    assert client.body_codec.byte_counters.received == trace.response_body_size
+
+
+async def test_iter_list_before_body_end(listing_server_root):
+    root, first_item_received, _ = listing_server_root
+    async with HttpClient(root, None) as client:
+        servers = []
+        async for server in client.iter_list('servers?wait=1', 'servers'):
+            # the server sends the rest only after the first item is yielded
+            first_item_received.set()
+            servers.append(server)
+    assert servers == SERVERS
+
+
+async def test_iter_list_stopped_early(listing_server_root):
+    root, _, _ = listing_server_root
+    async with HttpClient(root, None) as client:
+        stream = client.iter_list('servers', 'servers')
+        assert await stream.__anext__() == SERVERS[0]
+        await stream.aclose()
+        assert client.pipeline.concurrency.in_flight == 0
+
+
+async def test_iter_list_opening_retried(listing_server_root):
+    root, _, calls = listing_server_root
+    client = HttpClient(root, None, config=RequestConfig(retry=RetryPolicy(backoff_base=0, backoff_max=0)))
+    servers = [server async for server in client.iter_list('flaky', 'servers')]
+    assert servers == SERVERS[:2]
+    assert calls['flaky'] == 2
+
+
+async def test_iter_list_error(listing_server_root):
+    root, _, _ = listing_server_root
+    client = HttpClient(root, None)
+    with pytest.raises(errors.HttpClientResponseError) as exc_info:
+        [server async for server in client.iter_list('missing', 'servers')]  # noqa: WPS428
+    assert exc_info.value.status == 404
+
+
+async def test_iter_list_wrong_key(listing_server_root):
+    root, _, _ = listing_server_root
+    client = HttpClient(root, None)
+    with pytest.raises(ValueError):
+        [domain async for domain in client.iter_list('servers', 'domains')]  # noqa: WPS428
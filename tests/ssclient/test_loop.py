@@ -0,0 +1,41 @@
+import asyncio
+import threading
+
+import pytest
+
+from ssclient.loop import LoopThread
+
+
+def test_loop_thread_runs_coroutines():
+    loop_thread = LoopThread()
+
+    async def get_thread_name():  # noqa: WPS430
+        await asyncio.sleep(0)
+        return threading.current_thread().name
+
+    assert loop_thread.run(get_thread_name()) == 'ssclient-loop'
+    loop_thread.stop()
+    assert not loop_thread.is_running
+
+
+def test_loop_thread_propagates_errors():
+    loop_thread = LoopThread()
+
+    async def fail():  # noqa: WPS430
+        raise ValueError('fail')
+
+    with pytest.raises(ValueError):
+        loop_thread.run(fail())
+    loop_thread.stop()
+
+
+def test_loop_thread_cleanup_runs_after_cancel():
+    loop_thread = LoopThread()
+    sleeping = loop_thread.submit(asyncio.sleep(10))
+    cleaned = []
+
+    async def cleanup():  # noqa: WPS430
+        cleaned.append(sleeping.cancelled())
+
+    loop_thread.stop(cleanup)
+    assert cleaned == [True]
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient.http_client import HttpClient
+from ssclient.pagination import get_next_link
+
+PAGE_SIZE = 3
+PAGES = 4
+SERVERS = [{'id': 'l1s{index}'.format(index=index)} for index in range(PAGE_SIZE * PAGES)]
+
+
+@pytest.mark.parametrize('link_header, next_link', [
+    ('</servers?page=2>; rel="next"', '/servers?page=2'),
+    ('</servers?page=1>; rel="prev", <?page=3>; rel=next', '?page=3'),
+    ('<https://api.example.com/servers?page=4>; rel="next last"', 'https://api.example.com/servers?page=4'),
+    ('</servers?page=1>; rel="first"', None),
+    ('', None),
+])
+def test_next_link(link_header, next_link):
+    assert get_next_link({'Link': link_header}) == next_link
+
+
+@pytest.fixture
+async def paged_server_root(aiohttp_server):
+    requested = []
+
+    async def paged_handler(request: Request):  # noqa: WPS430
+        page = int(request.query.get('page', 1))
+        requested.append(page)
+        headers = {}
+        if page < PAGES:
+            headers['Link'] = '<?page={next}>; rel="next"'.format(next=page + 1)
+        page_servers = SERVERS[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        return web.json_response({'servers': page_servers}, headers=headers)
+
+    async def foreign_handler(request: Request):  # noqa: WPS430
+        return web.json_response(
+            {'servers': SERVERS[:1]}, headers={'Link': '<https://example.com/servers>; rel="next"'},
+        )
+
+    app = web.Application()
+    app.router.add_route('GET', '/servers', paged_handler)
+    app.router.add_route('GET', '/foreign', foreign_handler)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/')), requested
+    await server.close()
+
+
+async def test_pages_followed(paged_server_root):
+    root, requested = paged_server_root
+    async with HttpClient(root, None) as client:
+        servers = [server async for server in client.iter_list('servers', 'servers')]
+    assert servers == SERVERS
+    assert requested == list(range(1, PAGES + 1))
+
+
+async def test_next_page_prefetched(paged_server_root):
+    root, requested = paged_server_root
+    async with HttpClient(root, None) as client:
+        stream = client.iter_list('servers', 'servers')
+        assert await stream.__anext__() == SERVERS[0]
+        await asyncio.sleep(0.1)
+        # only one page is fetched ahead of the consumer
+        assert requested == [1, 2]
+        await stream.aclose()
+    await asyncio.sleep(0.1)
+    assert requested == [1, 2]
+
+
+async def test_other_host_not_followed(paged_server_root):
+    root, _ = paged_server_root
+    async with HttpClient(root, None) as client:
+        servers = [server async for server in client.iter_list('foreign', 'servers')]
+    assert servers == SERVERS[:1]
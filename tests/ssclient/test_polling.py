@@ -0,0 +1,107 @@
+import itertools
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient import errors
+from ssclient.base import BaseService
+from ssclient.http_client import HttpClient
+from ssclient.polling import PollingPolicy, TaskHistory, TaskPoller, get_task_poller
+
+POLICY = PollingPolicy(initial_delay=0.01, multiplier=2, max_delay=0.05, jitter=0)
+
+
+def _get_delays(task_poller, kind=None, count=6):
+    return list(itertools.islice(task_poller.iter_delays(kind), count))
+
+
+def test_delays_grow_up_to_cap():
+    assert _get_delays(TaskPoller(POLICY)) == pytest.approx([0.01, 0.02, 0.04, 0.05, 0.05, 0.05])
+
+
+def test_delays_jittered():
+    task_poller = TaskPoller(PollingPolicy(initial_delay=1, multiplier=1, jitter=0.2))
+    delays = _get_delays(task_poller, count=100)
+    assert all(0.8 <= delay <= 1.2 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_first_poll_near_expected_finish():
+    history = TaskHistory()
+    for duration in (20, 30, 100):
+        history.record('server.create', duration)
+    task_poller = TaskPoller(PollingPolicy(initial_delay=0.25, expected_ratio=0.8, jitter=0), history)
+    assert _get_delays(task_poller, 'server.create', count=2) == pytest.approx([24, 0.25])
+    # kinds are independent
+    assert _get_delays(task_poller, 'server.reboot', count=1) == pytest.approx([0.25])
+
+
+def test_history_persisted(tmp_path):
+    history_path = tmp_path / 'task_history.json'
+    history = TaskHistory(history_path, max_samples=2)
+    for duration in (1, 5, 7):
+        history.record('nic.create', duration)
+    assert json.loads(history_path.read_text()) == {'nic.create': [5, 7]}
+    assert TaskHistory(history_path).get_expected('nic.create') == 6
+
+
+def test_history_directory_created(tmp_path):
+    history_path = tmp_path / 's2ctl' / 'task_history.json'
+    TaskHistory(history_path).record('nic.create', 1)
+    assert TaskHistory(history_path).get_expected('nic.create') == 1
+
+
+def test_broken_history_ignored(tmp_path):
+    history_path = tmp_path / 'task_history.json'
+    history_path.write_text('{not json')
+    history = TaskHistory(history_path)
+    assert history.get_expected('nic.create') is None
+    history.record('nic.create', 1)
+    assert TaskHistory(history_path).get_expected('nic.create') == 1
+
+
+@pytest.fixture
+def task_poller():
+    shared_poller = get_task_poller()
+    policy, history = shared_poller.policy, shared_poller.history
+    shared_poller.policy, shared_poller.history = POLICY, TaskHistory()
+    yield shared_poller
+    shared_poller.policy, shared_poller.history = policy, history
+
+
+@pytest.fixture
+async def task_server_root(aiohttp_server):
+    polls = {}
+
+    async def task_handler(request: Request):  # noqa: WPS430
+        task_id = request.match_info['task_id']
+        polls[task_id] = polls.get(task_id, 0) + 1
+        status = 'InProgress'
+        if polls[task_id] == 3:
+            status = 'Failed' if task_id == 'failing' else 'Completed'
+        return web.json_response({'task': {'id': task_id, 'is_completed': status}})
+
+    app = web.Application()
+    app.router.add_route('GET', '/api/v1/tasks/{task_id}', task_handler)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/')), polls
+    await server.close()
+
+
+async def test_completion_time_recorded(task_server_root, task_poller):
+    root, polls = task_server_root
+    service = BaseService(HttpClient(root, None))
+    task = await service._wait_task_completion('task-1', kind='server.create')  # noqa: WPS437
+    assert task['is_completed'] == 'Completed'
+    assert polls['task-1'] == 3
+    assert task_poller.history.get_expected('server.create') >= 0.07
+
+
+async def test_failed_task_not_recorded(task_server_root, task_poller):
+    root, _ = task_server_root
+    service = BaseService(HttpClient(root, None))
+    with pytest.raises(errors.TaskFailedError):
+        await service._wait_task_completion('failing', kind='server.create')  # noqa: WPS437
+    assert task_poller.history.get_expected('server.create') is None
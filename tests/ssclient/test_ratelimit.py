@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+from ssclient.http_client import HttpClient
+from ssclient.ratelimit import HostRateLimiter, RateLimit, TokenBucket, get_host_limiter
+from ssclient.request_config import RequestConfig
+
+
+def test_bucket_burst_then_paced():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+    assert 0.19 < bucket.reserve() <= 0.2
+
+
+def test_limiter_shared_by_host():
+    rate_limit = RateLimit(rate=5, burst=1)
+    first = HttpClient('https://api.serverspace.io', None, config=RequestConfig(rate_limit=rate_limit))
+    second = HttpClient('https://api.serverspace.io/', 'key', config=RequestConfig(rate_limit=rate_limit))
+    third = HttpClient('https://api.serverspace.ru', None, config=RequestConfig(rate_limit=rate_limit))
+    assert first.pipeline.rate_limiter is second.pipeline.rate_limiter
+    assert first.pipeline.rate_limiter is not third.pipeline.rate_limiter
+    assert get_host_limiter('https://api.serverspace.io', rate_limit) is first.pipeline.rate_limiter
+
+
+async def test_max_in_flight():
+    limiter = HostRateLimiter(RateLimit(rate=None, max_in_flight=2))
+    max_seen = 0
+
+    async def request():  # noqa: WPS430
+        nonlocal max_seen
+        async with limiter.slot():
+            max_seen = max(max_seen, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(request() for _ in range(6)))
+    assert max_seen == 2
+    assert limiter.in_flight == 0
+
+
+async def test_requests_paced(http_client):
+    client: HttpClient = http_client(None)
+    client.pipeline.rate_limiter = HostRateLimiter(RateLimit(rate=50, burst=1))
+    started = time.monotonic()
+    async with client:
+        await asyncio.gather(*(client.get('paced/{n}'.format(n=num)) for num in range(6)))
+    assert time.monotonic() - started >= 0.09
+
+
+def test_shared_bucket_across_instances(tmp_path):
+    rate_limit = RateLimit(rate=10, burst=2, shared_dir=str(tmp_path))
+    first = HostRateLimiter(rate_limit, 'key')
+    second = HostRateLimiter(rate_limit, 'key')
+    assert first.bucket.reserve() == 0
+    assert second.bucket.reserve() == 0
+    assert first.bucket.reserve() > 0
+    assert list(tmp_path.iterdir()) == [tmp_path / 'ratelimit-key.json']
+
+
+def test_shared_dir_is_created(tmp_path):
+    shared_dir = tmp_path / 'config' / 's2ctl'
+    bucket = HostRateLimiter(RateLimit(rate=10, burst=2, shared_dir=str(shared_dir)), 'key').bucket
+    assert bucket.reserve() == 0
+    assert shared_dir.stat().st_mode & 0o777 == 0o700
+
+
+def test_shared_limiter_keyed_by_apikey(tmp_path):
+    rate_limit = RateLimit(shared_dir=str(tmp_path))
+    first = get_host_limiter('https://api.serverspace.io', rate_limit, 'first')
+    second = get_host_limiter('https://api.serverspace.io', rate_limit, 'second')
+    assert first is not second
+    assert get_host_limiter('https://api.serverspace.io', rate_limit, 'first') is first
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient import errors
+from ssclient.http_client import HttpClient
+from ssclient.request_config import RequestConfig, TimeoutConfig
+from ssclient.retry import RetryPolicy, parse_retry_after
+
+FAST_POLICY = RetryPolicy(max_retries=2, backoff_base=0.01, backoff_max=1)
+
+
+@pytest.fixture
+async def flaky_server(aiohttp_server):
+    attempts = {'count': 0}
+
+    async def handler(request: Request):  # noqa: WPS430
+        attempts['count'] += 1
+        if attempts['count'] <= int(request.match_info['failures']):
+            return web.json_response(
+                {'errors': 'unavailable'},
+                status=int(request.match_info['status']),
+                headers={'Retry-After': '0'},
+            )
+        return web.json_response({'attempts': attempts['count']})
+
+    app = web.Application()
+    app.router.add_route('*', '/{status}/{failures}', handler)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/')), attempts
+
+
+async def test_retry_until_success(flaky_server):
+    root, _attempts = flaky_server
+    client = HttpClient(root, None, config=RequestConfig(retry=FAST_POLICY))
+    server_answer = await client.get('503/2')
+    assert server_answer == {'attempts': 3}
+    assert client.pipeline.retrier.budget.retries == 2
+
+
+async def test_retries_exhausted(flaky_server):
+    root, attempts = flaky_server
+    client = HttpClient(root, None, config=RequestConfig(retry=FAST_POLICY))
+    with pytest.raises(errors.HttpClientResponseError) as exc_info:
+        await client.get('502/5')
+    assert exc_info.value.status == 502
+    assert attempts['count'] == 3
+
+
+async def test_unsafe_method_not_retried_after_processing(flaky_server):
+    root, attempts = flaky_server
+    client = HttpClient(root, None, config=RequestConfig(retry=FAST_POLICY))
+    with pytest.raises(errors.HttpClientResponseError):
+        await client.post('500/1', {})
+    assert attempts['count'] == 1
+
+
+async def test_unsafe_method_retried_when_rejected(flaky_server):
+    root, attempts = flaky_server
+    client = HttpClient(root, None, config=RequestConfig(retry=FAST_POLICY))
+    await client.post('429/1', {})
+    assert attempts['count'] == 2
+
+
+async def test_connection_error_wrapped():
+    client = HttpClient('http://127.0.0.1:1', None, config=RequestConfig(retry=FAST_POLICY))
+    with pytest.raises(errors.HttpClientConnectionError) as exc_info:
+        await client.post('path', {})
+    assert not exc_info.value.request_sent
+    assert client.pipeline.retrier.budget.retries == 2
+
+
+async def test_timeout_wrapped(aiohttp_server):
+    async def handler(request: Request):  # noqa: WPS430
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_route('*', '/slow', handler)
+    server = await aiohttp_server(app)
+    client = HttpClient(
+        str(server.make_url('/')),
+        None,
+        config=RequestConfig(retry=FAST_POLICY, timeout=TimeoutConfig(total=0.05)),
+    )
+    with pytest.raises(errors.HttpClientConnectionError):
+        await client.get('slow')
+    assert client.pipeline.retrier.budget.retries == 2
+
+
+@pytest.mark.parametrize('header_value,expected', [
+    (None, None),
+    ('', None),
+    ('5', 5),
+    ('-1', 0),
+    ('Wed, 21 Oct 2015 07:28:00 GMT', 0),
+    ('garbage', None),
+])
+def test_parse_retry_after(header_value, expected):
+    assert parse_retry_after(header_value) == expected
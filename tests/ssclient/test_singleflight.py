@@ -0,0 +1,39 @@
+import asyncio
+
+from ssclient.singleflight import SingleFlight
+
+
+async def test_calls_shared():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def fetch():  # noqa: WPS430
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {'items': []}
+
+    call_results = await asyncio.gather(*(single_flight.call('key', fetch) for _ in range(3)))
+    assert len(calls) == 1
+    assert call_results[0] == call_results[2]
+    assert call_results[0] is not call_results[2]
+    assert not single_flight.in_flight
+
+
+async def test_abandoned_call_cancelled():
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch():  # noqa: WPS430
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.ensure_future(single_flight.call('key', fetch))
+    await started.wait()
+    caller.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert not single_flight.in_flight
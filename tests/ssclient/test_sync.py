@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aiohttp.web_request import Request
+
+from ssclient.loop import LoopThread
+from ssclient.request_config import RequestConfig
+from ssclient.retry import RetryPolicy
+from ssclient.session import ConnectionPoolConfig
+from ssclient.sync import SyncProxy, SyncSSClient
+
+SERVERS = [{'id': 's1'}, {'id': 's2'}]
+
+
+@pytest.fixture
+def api_root():
+    peers = set()
+
+    async def servers_handler(request: Request):  # noqa: WPS430
+        peers.add(request.transport.get_extra_info('peername'))
+        return web.json_response({'servers': SERVERS})
+
+    async def volumes_handler(request: Request):  # noqa: WPS430
+        server_id = request.match_info['server_id']
+        return web.json_response({'volumes': [{'id': 1, 'server_id': server_id}]})
+
+    app = web.Application()
+    app.router.add_route('GET', '/api/v1/servers', servers_handler)
+    app.router.add_route('GET', '/api/v1/servers/{server_id}/volumes', volumes_handler)
+    # the server has its own loop, blocking client calls don't stop it
+    server_thread = LoopThread(name='test-server')
+    server = TestServer(app)
+    server_thread.run(server.start_server())
+    yield str(server.make_url('/')), peers
+    server_thread.run(server.close())
+    server_thread.stop()
+
+
+def test_services_block(api_root):
+    root, _ = api_root
+    with SyncSSClient(root, None, config=RequestConfig(retry=RetryPolicy(max_retries=0))) as client:
+        assert client.servers().list() == SERVERS
+        assert list(client.servers().iter_list()) == SERVERS
+        # nested services are blocking too
+        assert client.servers().volumes('s1').list() == [{'id': 1, 'server_id': 's1'}]
+
+
+def test_threads_share_connections(api_root):
+    root, peers = api_root
+    client = SyncSSClient(root, None, config=RequestConfig(retry=RetryPolicy(max_retries=0)))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.servers().list(), range(40)))
+    client.close()
+    assert results == [SERVERS] * 40
+    # connections of the pooled session are reused across threads
+    assert len(peers) <= ConnectionPoolConfig().limit_per_host
+
+
+def test_plain_methods_run_in_loop_thread():
+    class Target(object):
+        def get_thread_name(self):
+            return threading.current_thread().name
+
+    loop_thread = LoopThread(name='test-loop')
+    try:
+        assert SyncProxy(Target(), loop_thread).get_thread_name() == 'test-loop'
+    finally:
+        loop_thread.stop()
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from ssclient import errors
+from ssclient.http_client import HttpClient
+from ssclient.polling import PollingPolicy, TaskHistory, TaskPoller
+from ssclient.request_config import RequestConfig
+from ssclient.retry import RetryPolicy
+from ssclient.task import TaskWaiter
+
+# polls needed for the task to complete
+TASK_POLLS = {'slow': 4, 'fast': 1, 'medium': 2, 'failing': 3, 'lagging': 1}
+
+
+@pytest.fixture
+async def tasks_root(aiohttp_server):
+    polls = {}
+
+    async def task_handler(request: Request):  # noqa: WPS430
+        task_id = request.match_info['task_id']
+        if task_id not in TASK_POLLS:
+            return web.json_response({'errors': ['not found']}, status=404)
+        if task_id == 'lagging':
+            await asyncio.sleep(0.3)
+        polls[task_id] = polls.get(task_id, 0) + 1
+        status = 'InProgress'
+        if polls[task_id] >= TASK_POLLS[task_id]:
+            status = 'Failed' if task_id == 'failing' else 'Completed'
+        return web.json_response({'task': {'id': task_id, 'is_completed': status}})
+
+    app = web.Application()
+    app.router.add_route('GET', '/api/v1/tasks/{task_id}', task_handler)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/')), polls
+    await server.close()
+
+
+def _make_waiter(root, polls_per_second=100):
+    http_client = HttpClient(root, None, config=RequestConfig(retry=RetryPolicy(max_retries=0)))
+    task_poller = TaskPoller(PollingPolicy(initial_delay=0.01, multiplier=1, jitter=0), TaskHistory())
+    return TaskWaiter(http_client, polls_per_second, task_poller)
+
+
+async def test_completion_order(tasks_root):
+    root, _ = tasks_root
+    task_waiter = _make_waiter(root)
+    for task_id in ('slow', 'fast', 'unknown', 'failing', 'medium'):
+        task_waiter.add(task_id, kind='server.create')
+
+    outcomes = [outcome async for outcome in task_waiter.as_completed()]
+    outcomes_by_id = {outcome.task_id: outcome for outcome in outcomes}
+    # "fast" and "unknown" are done by the first poll in any order
+    assert {outcome.task_id for outcome in outcomes[:2]} == {'fast', 'unknown'}
+    assert [outcome.task_id for outcome in outcomes[2:]] == ['medium', 'failing', 'slow']
+    assert [outcome.task['id'] for outcome in outcomes[2:] if outcome.error is None] == ['medium', 'slow']
+    assert outcomes_by_id['fast'].task['id'] == 'fast'
+    assert isinstance(outcomes_by_id['unknown'].error, errors.HttpClientResponseError)
+    assert isinstance(outcomes_by_id['failing'].error, errors.TaskFailedError)
+    assert task_waiter.pending == 0
+    assert task_waiter.task_poller.history.get_expected('server.create') is not None
+
+
+async def test_slow_poll_does_not_hold_completed(tasks_root):
+    root, _ = tasks_root
+    task_waiter = _make_waiter(root)
+    # both are polled at once, the poll of "lagging" takes longer
+    task_waiter.add('lagging')
+    task_waiter.add('fast')
+    outcomes = await _drain(task_waiter)
+    assert [outcome.task_id for outcome in outcomes] == ['fast', 'lagging']
+
+
+async def test_added_while_waiting(tasks_root):
+    root, _ = tasks_root
+    task_waiter = _make_waiter(root)
+    task_waiter.add('fast')
+    completed = []
+    async for outcome in task_waiter.as_completed():
+        completed.append(outcome.task_id)
+        if outcome.task_id == 'fast':
+            task_waiter.add('medium')
+    assert completed == ['fast', 'medium']
+
+
+async def test_polls_paced(tasks_root):
+    root, polls = tasks_root
+    task_waiter = _make_waiter(root, polls_per_second=10)
+    task_waiter.add('slow')
+    task_waiter.add('medium')
+    waiting = asyncio.ensure_future(_drain(task_waiter))
+    await asyncio.sleep(0.25)
+    # burst of 10 polls, then 10 per second
+    assert sum(polls.values()) <= 6
+    await waiting
+
+
+async def _drain(task_waiter):
+    return [outcome async for outcome in task_waiter.as_completed()]
@@ -0,0 +1,65 @@
+import pytest
+
+from ssclient import errors
+from ssclient.har import make_har_log, write_har
+from ssclient.http_client import HttpClient
+from ssclient.session import SessionConfig
+from ssclient.tracing import PHASES, RequestTracer, format_trace
+
+
+async def test_request_traced(server_root):
+    tracer = RequestTracer()
+    async with HttpClient(host=server_root, apikey='secret', session_config=SessionConfig(tracer=tracer)) as client:
+        await client.get('first')
+        await client.get('second')
+
+    first, second = tracer.traces
+    assert first.method == 'GET'
+    assert first.url.endswith('/first')
+    assert first.status == 200
+    assert first.response_size > 0
+    assert {'connect', 'wait', 'receive', 'decode'} <= set(first.timings)
+    assert set(first.timings) <= set(PHASES)
+    assert not first.reused_connection
+    assert second.reused_connection
+    assert 'connect' not in second.timings
+
+
+async def test_failed_request_traced(server_root):
+    tracer = RequestTracer()
+    async with HttpClient(host=server_root, apikey=None, session_config=SessionConfig(tracer=tracer)) as client:
+        with pytest.raises(errors.HttpClientResponseError):
+            await client.get('error/404')
+
+    trace = tracer.traces[-1]
+    assert trace.status == 404
+    assert 'HttpClientResponseError' in trace.error
+
+
+async def test_listeners_called(server_root):
+    formatted = []
+    tracer = RequestTracer([lambda trace: formatted.append(format_trace(trace))])
+    async with HttpClient(host=server_root, apikey=None, session_config=SessionConfig(tracer=tracer)) as client:
+        await client.get('first')
+
+    assert formatted[0].startswith('GET {root}/first 200 in '.format(root=server_root))
+    assert 'wait' in formatted[0]
+
+
+async def test_har_export(server_root, tmp_path):
+    tracer = RequestTracer()
+    async with HttpClient(host=server_root, apikey='secret', session_config=SessionConfig(tracer=tracer)) as client:
+        await client.get('first')
+    har_path = tmp_path / 'trace.har'
+    write_har(tracer.traces, str(har_path))
+
+    har_log = make_har_log(tracer.traces)['log']
+    assert har_path.exists()
+    assert har_log['version'] == '1.2'
+    entry = har_log['entries'][0]
+    assert entry['response']['status'] == 200
+    assert {'name': 'X-API-KEY', 'value': '***'} in entry['request']['headers']
+    assert set(entry['timings']) == {
+        'blocked', 'dns', 'connect', 'ssl', 'send', 'wait', 'receive', '_decode',
+    }
+